@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Type, Union, cast
+from typing import Any, Dict, Iterator, Optional, Type, Union
 from urllib.parse import urlencode, urljoin
 from uuid import UUID
 
@@ -8,7 +8,7 @@ from typing_extensions import Protocol, TypeVar
 
 from pyuploadcare.api.client import Client
 from pyuploadcare.api.entities import Entity, UUIDEntity
-from pyuploadcare.api.responses import PaginatedResponse, Response
+from pyuploadcare.api.responses import Response
 from pyuploadcare.exceptions import DefaultResponseClassNotDefined
 
 
@@ -216,6 +216,34 @@ class ListMixin(APIProtocol):
             if hasattr(response, "next"):
                 next_ = response.next
 
+    def list_raw(
+        self,
+        limit=None,
+        request_limit=None,
+        **query_parameters,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterates over listed items as plain ``dict`` without validation."""
+        if request_limit is not None:
+            query_parameters["limit"] = request_limit
+
+        next_: Optional[str] = self._build_url(
+            query_parameters=query_parameters
+        )
+
+        while next_:
+            json_response = self._client.get(next_).json()
+            results = json_response.get("results") or []
+
+            if limit is not None:
+                results = results[:limit]
+                limit -= len(results)
+
+            yield from results
+
+            next_ = json_response.get("next")
+            if limit is not None and limit <= 0:
+                break
+
 
 class CountMixin(APIProtocol):
     def count(
@@ -223,14 +251,10 @@ class CountMixin(APIProtocol):
         request_limit=None,
         **query_parameters,
     ) -> int:
-        if request_limit is not None:
-            query_parameters["limit"] = request_limit
-
-        response_class = self._get_response_class("list")
-        json_response = self._get(query_parameters=query_parameters)
-        response = self._parse_response(json_response, response_class)
-        response = cast(PaginatedResponse, response)
-        return response.total
+        # only ``total`` is needed, so a single item page is requested
+        query_parameters["limit"] = 1
+        json_response = self._get(**query_parameters)
+        return int(json_response["total"])
 
 
 class CreateMixin(APIProtocol):
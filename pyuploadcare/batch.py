@@ -0,0 +1,73 @@
+import dataclasses
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from pyuploadcare.api.entities import ApplicationDataBase
+
+
+if TYPE_CHECKING:
+    from pyuploadcare.resources.file import File
+
+
+def source_uuid(path: str) -> str:
+    """Returns UUID of the source file from conversion path.
+
+    >>> source_uuid("740e1b8c-1ad8-4324-b7ec-112c79d8eac2/video/-/format/webm/")
+    740e1b8c-1ad8-4324-b7ec-112c79d8eac2
+    """
+    return path.lstrip("/").split("/", 1)[0]
+
+
+@dataclasses.dataclass
+class BatchConversionResult:
+    """Result of ``Uploadcare.convert_files``.
+
+    - ``files`` -- converted files by source file UUID in order of input;
+    - ``problems`` -- conversion problems by source file UUID.
+
+    """
+
+    files: Dict[str, "File"] = dataclasses.field(default_factory=dict)
+    problems: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class BatchAddonResult:
+    """Result of ``Uploadcare.execute_addon_bulk``.
+
+    - ``results`` -- application data produced by add-on by file UUID
+      in order of input, e.g. ``UCClamAVApplicationData``;
+    - ``problems`` -- exceptions raised for files by file UUID.
+
+    """
+
+    results: Dict[str, Optional[ApplicationDataBase]] = dataclasses.field(
+        default_factory=dict
+    )
+    problems: Dict[str, Exception] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class BatchFileOperationResult:
+    """Result of ``Uploadcare.store_files`` and ``Uploadcare.delete_files``.
+
+    - ``processed`` -- amount of successfully processed files;
+    - ``problems`` -- problems by file UUID. Values are reasons reported
+      by REST API or exceptions raised for the whole chunk of files.
+
+    """
+
+    processed: int = 0
+    problems: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class BatchDownloadResult:
+    """Result of ``Uploadcare.download``.
+
+    - ``files`` -- local paths of downloaded files by file UUID;
+    - ``problems`` -- exceptions raised for files by file UUID.
+
+    """
+
+    files: Dict[str, str] = dataclasses.field(default_factory=dict)
+    problems: Dict[str, Exception] = dataclasses.field(default_factory=dict)
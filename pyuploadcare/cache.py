@@ -0,0 +1,143 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, MutableMapping, Optional, Tuple
+
+
+CacheEntry = Tuple[float, Dict[str, Any]]
+
+
+class FileInfoCache:
+    """Bounded LRU cache of file information shared by ``File`` instances.
+
+    Entries are keyed by file UUID and expire after ``ttl`` seconds.
+    Entries themselves are kept in ``store``, which can be any mutable
+    mapping with string keys, e.g. ``dict`` (default) or ``shelve`` shelf::
+
+        >>> import shelve
+        >>> uploadcare = Uploadcare(
+        ...     public_key='<public-key>',
+        ...     secret_key='<secret-key>',
+        ...     info_cache=FileInfoCache(
+        ...         maxsize=10000, ttl=3600, store=shelve.open('info.db')
+        ...     ),
+        ... )
+
+    Args:
+        - maxsize: maximum number of cached entries.
+        - ttl: entry lifetime in seconds, ``None`` means no expiration.
+        - store: mapping to keep entries in.
+
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 300,
+        store: Optional[MutableMapping[str, CacheEntry]] = None,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive number")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.store: MutableMapping[str, CacheEntry] = (
+            {} if store is None else store
+        )
+        self._order: "OrderedDict[str, None]" = OrderedDict.fromkeys(
+            self.store
+        )
+        self._lock = threading.Lock()
+        self._evict()
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, uuid: object) -> bool:
+        return self.get(str(uuid)) is not None
+
+    def get(self, uuid: str) -> Optional[Dict[str, Any]]:
+        """Returns cached information or ``None`` if it's missing or expired."""
+        with self._lock:
+            entry = self.store.get(uuid)
+            if entry is None:
+                return None
+
+            expires_at, info = entry
+            if expires_at < time.time():
+                self._delete(uuid)
+                return None
+
+            self._order.move_to_end(uuid)
+            return info
+
+    def set(self, uuid: str, info: Dict[str, Any]) -> None:
+        expires_at = (
+            float("inf") if self.ttl is None else time.time() + self.ttl
+        )
+        with self._lock:
+            self.store[uuid] = (expires_at, info)
+            self._order[uuid] = None
+            self._order.move_to_end(uuid)
+            self._evict()
+
+    def invalidate(self, uuid: str) -> None:
+        with self._lock:
+            self._delete(uuid)
+
+    def clear(self) -> None:
+        with self._lock:
+            for uuid in list(self._order):
+                self._delete(uuid)
+
+    def _delete(self, uuid: str) -> None:
+        self.store.pop(uuid, None)
+        self._order.pop(uuid, None)
+
+    def _evict(self) -> None:
+        while len(self._order) > self.maxsize:
+            uuid, _ = self._order.popitem(last=False)
+            self.store.pop(uuid, None)
+
+
+class CountCache:
+    """Cache of ``count()`` results of file and group lists.
+
+    Results are keyed by resource type and query parameters
+    and expire after ``ttl`` seconds::
+
+        >>> uploadcare = Uploadcare(
+        ...     public_key='<public-key>',
+        ...     secret_key='<secret-key>',
+        ...     count_cache=CountCache(ttl=60),
+        ... )
+
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, count = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            return count
+
+    def set(self, key: Hashable, count: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, count)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
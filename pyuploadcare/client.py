@@ -1,13 +1,25 @@
+import dataclasses
+import heapq
+import itertools
 import os
 import socket
 import ssl
-from time import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from functools import partial
+from time import sleep, time
 from typing import (
     IO,
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -16,6 +28,8 @@ from typing import (
 )
 from uuid import UUID
 
+from httpx import HTTPError, TransportError
+
 from pyuploadcare import File, FileGroup, FileList, GroupList, conf
 from pyuploadcare.api import (
     AddonsAPI,
@@ -28,22 +42,97 @@ from pyuploadcare.api import (
     VideoConvertAPI,
     WebhooksAPI,
 )
+from pyuploadcare.api.addon_entities import AddonExecutionParams, AddonLabels
 from pyuploadcare.api.api import URLAPI
 from pyuploadcare.api.auth import UploadcareAuth
 from pyuploadcare.api.client import Client
-from pyuploadcare.api.entities import ProjectInfo, Webhook, WebhookEvent
-from pyuploadcare.exceptions import DuplicateFileError, InvalidParamError
+from pyuploadcare.api.entities import (
+    ApplicationDataBase,
+    ProjectInfo,
+    VideoConvertInfo,
+    Webhook,
+    WebhookEvent,
+)
+from pyuploadcare.api.responses import (
+    AddonExecuteResponse,
+    BatchFileOperationResponse,
+)
+from pyuploadcare.batch import (
+    BatchAddonResult,
+    BatchConversionResult,
+    BatchDownloadResult,
+    BatchFileOperationResult,
+    source_uuid,
+)
+from pyuploadcare.cache import CountCache, FileInfoCache
+from pyuploadcare.download import Part, download_part, join_parts, plan_parts
+from pyuploadcare.exceptions import (
+    APIError,
+    DuplicateFileError,
+    InvalidParamError,
+    ThrottledRequestError,
+    TimeoutError,
+    UploadcareException,
+    UploadError,
+)
 from pyuploadcare.helpers import (
     get_file_size,
     guess_mime_type,
     iterate_over_batches,
 )
-from pyuploadcare.resources.file import FileFromUrl, UploadProgress
+from pyuploadcare.jobs import Job, JobTracker
+from pyuploadcare.polling import (
+    ExponentialBackoff,
+    PollingState,
+    PollingStrategy,
+)
+from pyuploadcare.resources.file import (
+    RE_UUID_REGEX,
+    UUID_WITH_EFFECTS_REGEX,
+    FileFromUrl,
+    UploadProgress,
+)
 from pyuploadcare.secure_url import BaseSecureUrlBuilder
+from pyuploadcare.transformations.base import (
+    SLOT_MARKER,
+    BaseTransformation,
+    TransformationTemplate,
+)
+from pyuploadcare.transformations.document import DocumentTransformation
+from pyuploadcare.transformations.image import ImageTransformation
+from pyuploadcare.transformations.video import VideoTransformation
 
 
 DEFAULT_SSL_CONTEXT = ssl.create_default_context()
 
+UUID_LENGTH = 36
+
+RETRIABLE_ERRORS = (APIError, ThrottledRequestError, TransportError)
+
+INFO_BATCH_SIZE = 100
+
+RETRY_DELAY = 0.5
+MAX_RETRY_DELAY = 30.0
+
+
+def _retry_delay(attempt: int, exc: Exception) -> float:
+    """Returns seconds to wait before retry after ``attempt`` failures
+    in a row, throttled requests wait as long as the server asks."""
+    if isinstance(exc, ThrottledRequestError):
+        return exc.wait
+    return min(RETRY_DELAY * 2**attempt, MAX_RETRY_DELAY)
+
+
+@dataclasses.dataclass
+class _UrlUploadState:
+    url: str
+    file_from_url: FileFromUrl
+    started_at: float
+    interval: float = 0.0
+    polling_state: PollingState = dataclasses.field(
+        default_factory=PollingState
+    )
+
 
 class Uploadcare:
     """Uploadcare client.
@@ -72,6 +161,8 @@ class Uploadcare:
         - multipart_chunk_size: Chunk size in bytes for multipart uploading.
         - auth_class: Authentication class to use for API.
         - secure_url_builder: URL builder for secure delivery.
+        - info_cache: Cache of file information shared by ``File`` instances.
+        - count_cache: Cache of ``count()`` results of file and group lists.
 
     """
 
@@ -95,6 +186,8 @@ class Uploadcare:
         multipart_chunk_size=conf.multipart_chunk_size,
         auth_class: Type[UploadcareAuth] = UploadcareAuth,
         secure_url_builder: Optional[BaseSecureUrlBuilder] = None,
+        info_cache: Optional[FileInfoCache] = None,
+        count_cache: Optional[CountCache] = None,
     ):
         if not public_key:
             raise ValueError("public_key is required")
@@ -115,6 +208,8 @@ class Uploadcare:
         self.multipart_min_file_size = multipart_min_file_size
         self.multipart_chunk_size = multipart_chunk_size
         self.secure_url_builder = secure_url_builder
+        self.info_cache = info_cache
+        self.count_cache = count_cache
 
         if timeout is conf.DEFAULT:
             timeout = socket.getdefaulttimeout()
@@ -206,9 +301,118 @@ class Uploadcare:
             file_._info_cache = file_info
         return file_
 
+    def prefetch_info(  # noqa: C901
+        self,
+        files: Iterable[Optional[Union[str, UUID, File]]],
+        include_appdata: bool = False,
+        concurrency: int = 8,
+    ) -> List[File]:
+        """Fills information of many files with concurrent API requests.
+
+        Files which already have information are not requested again,
+        each file is requested once even if it's passed several times.
+        It works for any iterable of files, e.g. ``FileGroup`` or values
+        of a Django queryset, ``None`` values are skipped::
+
+            >>> files = uploadcare.prefetch_info(
+            ...     Photo.objects.values_list('image', flat=True)[:200]
+            ... )
+            >>> [file.size for file in files]  # no more requests
+
+        Args:
+            - files: file UUIDs, CDN urls or ``File`` instances.
+            - include_appdata: request application data of files as well.
+            - concurrency: maximum number of simultaneous requests.
+
+        Returns:
+            ``File`` instances with filled information in order of input.
+        """
+        result, problems = self._prefetch_info(
+            files, include_appdata, concurrency
+        )
+        if problems:
+            raise next(iter(problems.values()))
+        return result
+
+    def _prefetch_info(  # noqa: C901
+        self,
+        files: Iterable[Optional[Union[str, UUID, File]]],
+        include_appdata: bool,
+        concurrency: int,
+    ) -> Tuple[List[File], Dict[str, Exception]]:
+        """Returns files and errors of information requests by UUID,
+        information of failed files isn't filled."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive number")
+
+        result: List[File] = []
+        pending: Dict[str, List[File]] = {}
+        problems: Dict[str, Exception] = {}
+
+        for file_ in files:
+            if file_ is None:
+                continue
+            if not isinstance(file_, File):
+                file_ = File(file_, client=self)
+            result.append(file_)
+
+            info = file_._info_cache
+            if info is None and self.info_cache is not None:
+                info = file_._info_cache = self.info_cache.get(file_.uuid)
+            if info is None or (
+                include_appdata and info.get("appdata") is None
+            ):
+                pending.setdefault(file_.uuid, []).append(file_)
+
+        if not pending:
+            return result, problems
+
+        retrieve = partial(
+            self.files_api.retrieve, include_appdata=include_appdata
+        )
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                uuid: executor.submit(retrieve, uuid) for uuid in pending
+            }
+            for uuid, future in futures.items():
+                try:
+                    info = future.result().model_dump()
+                except (UploadcareException, HTTPError) as exc:
+                    problems[uuid] = exc
+                    continue
+                for file_ in pending[uuid]:
+                    file_._set_info(info)
+
+        return result, problems
+
     def file_from_url(self, token) -> FileFromUrl:
         return FileFromUrl(token, client=self)
 
+    def job_tracker(
+        self,
+        polling: Optional[PollingStrategy] = None,
+        timeout: float = 600,
+        concurrency: int = 4,
+        requests_per_second: Optional[float] = None,
+    ) -> JobTracker:
+        """Returns ``JobTracker`` for waiting for many conversion
+        and add-on execution jobs at once::
+
+            >>> tracker = uploadcare.job_tracker(requests_per_second=10)
+            >>> job = tracker.track_addon_execution(
+            ...     request_id, AddonLabels.CLAM_AV, callback=print
+            ... )
+            >>> tracker.wait()
+
+        """
+        return JobTracker(
+            self,
+            polling=polling,
+            timeout=timeout,
+            concurrency=concurrency,
+            requests_per_second=requests_per_second,
+        )
+
     def file_group(
         self, group_id: str, group_info: Optional[Dict[str, Any]] = None
     ) -> FileGroup:
@@ -542,6 +746,8 @@ class Uploadcare:
         callback: Optional[Callable[[UploadProgress], Any]] = None,
         check_duplicates: Optional[bool] = None,
         save_duplicates: Optional[bool] = None,
+        polling: Optional[PollingStrategy] = None,
+        ready_polling: Optional[PollingStrategy] = None,
     ) -> File:
         """Uploads file from given url and returns ``File`` instance.
 
@@ -570,6 +776,12 @@ class Uploadcare:
                 uploaded file.
             - save_duplicates (Optional[bool]): Indicates if the URL should be
                 stored by Uploadcare future check_duplicates usages.
+            - polling (Optional[PollingStrategy]): strategy computing intervals
+                between upload status checks, e.g. ``ExponentialBackoff()``.
+                If not set, status is checked every ``interval`` seconds.
+            - ready_polling (Optional[PollingStrategy]): strategy computing
+                intervals between file readiness checks when ``until_ready``
+                is set. Defaults to ``polling``.
 
         Returns:
             ``File`` instance
@@ -592,40 +804,304 @@ class Uploadcare:
                 interval=interval,
                 until_ready=until_ready,
                 callback=callback,
+                polling=polling,
+                ready_polling=ready_polling,
             )
         except DuplicateFileError as e:
             return self.file(e.file_id)
 
+    def upload_from_urls(  # noqa: C901
+        self,
+        urls: Iterable[str],
+        concurrency: int = 8,
+        timeout=30,
+        interval=0.3,
+        max_interval=5.0,
+        metadata=None,
+        store=None,
+        check_duplicates: Optional[bool] = None,
+        save_duplicates: Optional[bool] = None,
+        raise_errors: bool = True,
+        polling: Optional[PollingStrategy] = None,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Union[File, Exception]]]:
+        """Uploads many files from urls and yields results as they complete.
+
+        Upload requests are submitted concurrently and statuses of all
+        outstanding uploads are polled from a single scheduler loop.
+        Each upload has its own polling schedule. By default the interval
+        doubles after every check until ``max_interval`` is reached::
+
+            >>> for url, file in uploadcare.upload_from_urls(urls, concurrency=16):
+            ...     print(url, file.uuid)
+
+        Args:
+            - urls: iterable of URLs to upload files from. It is consumed
+                lazily, so generators are fine.
+            - concurrency (int): maximum number of simultaneous requests
+                to Upload API. Defaults to 8.
+            - timeout (Optional[int]): seconds to wait for each upload
+                to complete. Defaults to 30.
+            - interval (Optional[float]): initial interval between
+                upload status checks. Defaults to 0.3.
+            - max_interval (Optional[float]): upper bound for the interval
+                between upload status checks. Defaults to 5.
+            - store, metadata, check_duplicates, save_duplicates:
+                the same as for ``upload_from_url``. Duplicates are yielded
+                as previously uploaded files.
+            - raise_errors (bool): if ``True``, the first failed upload
+                raises ``UploadError``, ``TimeoutError`` or an error of the
+                request. Otherwise
+                the exception is yielded in place of the file.
+            - polling (Optional[PollingStrategy]): strategy computing
+                intervals between status checks of each upload. Overrides
+                ``interval`` and ``max_interval``.
+            - max_pending (Optional[int]): maximum number of submitted
+                uploads which are not completed yet. New urls are taken
+                when uploads complete, so ``timeout`` of uploads isn't
+                spent waiting for status checks of others.
+                Defaults to ``4 * concurrency``.
+
+        Yields:
+            ``(url, File)`` pairs in order of completion.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive number")
+        if max_pending is None:
+            max_pending = 4 * concurrency
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive number")
+
+        if polling is None:
+            # negative intervals were treated as zero
+            polling = ExponentialBackoff(
+                initial=max(interval, 0), max_interval=max_interval, jitter=0
+            )
+
+        pending_urls = iter(urls)
+        schedule: List[Tuple[float, int, _UrlUploadState]] = []
+        sequence = itertools.count()
+        # maps future to url of submit request or to state of status request
+        inflight: Dict[Future, Union[str, _UrlUploadState]] = {}
+
+        def submit(url: str) -> FileFromUrl:
+            return self.upload_from_url(
+                url,
+                store=store,
+                metadata=metadata,
+                check_duplicates=check_duplicates,
+                save_duplicates=save_duplicates,
+            )
+
+        def poll(state: _UrlUploadState) -> Dict[str, Any]:
+            return state.file_from_url.update_info()
+
+        def fail(url: str, exc: Exception):
+            if raise_errors:
+                raise exc
+            return url, exc
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                while len(inflight) < concurrency:
+                    if schedule and schedule[0][0] <= time():
+                        _, _, state = heapq.heappop(schedule)
+                        inflight[executor.submit(poll, state)] = state
+                        continue
+
+                    # polled uploads are in schedule or in flight
+                    if len(inflight) + len(schedule) >= max_pending:
+                        break
+                    url = next(pending_urls, None)
+                    if url is None:
+                        break
+                    inflight[executor.submit(submit, url)] = url
+
+                if not inflight and not schedule:
+                    return
+
+                wait_timeout = None
+                if schedule:
+                    wait_timeout = max(schedule[0][0] - time(), 0)
+
+                if not inflight:
+                    # wait() returns at once without futures
+                    sleep(wait_timeout or 0)
+                    continue
+
+                done, _ = wait(
+                    inflight, timeout=wait_timeout, return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    source = inflight.pop(future)
+
+                    if isinstance(source, str):
+                        try:
+                            file_from_url = future.result()
+                        except DuplicateFileError as e:
+                            yield source, self.file(e.file_id)
+                            continue
+                        except (UploadcareException, HTTPError) as e:
+                            yield fail(source, e)
+                            continue
+
+                        state = _UrlUploadState(
+                            url=source,
+                            file_from_url=file_from_url,
+                            started_at=time(),
+                        )
+                        # the upload request counts as the first check,
+                        # so strategies wait ``initial`` before the first
+                        # status check and back off after it
+                        state.polling_state.advance(0)
+                        state.interval = polling.next_interval(
+                            state.polling_state
+                        )
+                        heapq.heappush(
+                            schedule,
+                            (time() + state.interval, next(sequence), state),
+                        )
+                        continue
+
+                    state = source
+                    try:
+                        info = future.result()
+                    except (UploadcareException, HTTPError) as e:
+                        yield fail(state.url, e)
+                        continue
+
+                    if info["status"] == "success":
+                        yield state.url, self.file(info["uuid"])
+                    elif info["status"] in ("failed", "error"):
+                        yield fail(
+                            state.url,
+                            UploadError(
+                                f"could not upload file from url: {info}"
+                            ),
+                        )
+                    elif time() - state.started_at >= timeout:
+                        yield fail(
+                            state.url,
+                            TimeoutError(
+                                f"timed out during upload: {state.url}"
+                            ),
+                        )
+                    else:
+                        state.polling_state.advance(
+                            state.interval, info.get("done"), info.get("total")
+                        )
+                        state.interval = polling.next_interval(
+                            state.polling_state
+                        )
+                        heapq.heappush(
+                            schedule,
+                            (
+                                time() + state.interval,
+                                next(sequence),
+                                state,
+                            ),
+                        )
+
+    def _iter_uuids(  # noqa: C901
+        self, files: Iterable[Union[str, File, UUID]]
+    ) -> Iterator[str]:
+        """Lazily convert various resource representation into string-based.
+
+        Canonical UUID strings, ``UUID`` and ``File`` instances are handled
+        without parsing, CDN urls are parsed only when needed.
+        """
+        for file_ in files:
+            if isinstance(file_, str):
+                if len(file_) == UUID_LENGTH and RE_UUID_REGEX.match(file_):
+                    yield file_
+                    continue
+
+                matches = UUID_WITH_EFFECTS_REGEX.search(file_)
+                if not matches:
+                    raise InvalidParamError("Couldn't find UUID")
+                yield matches.group("uuid")
+            elif isinstance(file_, File):
+                yield file_.uuid
+            elif isinstance(file_, UUID):
+                yield str(file_)
+            else:
+                yield File(file_, self).uuid
+
     def _extract_uuids(
         self, files: Iterable[Union[str, File, UUID]]
     ) -> List[str]:
         """Convert various resource representation into string-based."""
-        file_generator = (
-            file_ if isinstance(file_, File) else File(file_, self)
-            for file_ in files
-        )
-
-        def __extracts_uuids(files: Iterable[Union[str, File]]) -> List[str]:
-            uuids: List[str] = []
+        return list(self._iter_uuids(files))
 
-            for file_ in files:
-                if isinstance(file_, File):
-                    uuids.append(file_.uuid)
-                elif isinstance(file_, str):
-                    uuids.append(file_)
-                else:
-                    raise ValueError(
-                        "Invalid type for sequence item: {0}".format(
-                            type(file_)
-                        )
+    def _run_batch_operation(  # noqa: C901
+        self,
+        operation: Callable[[List[str]], BatchFileOperationResponse],
+        files: Iterable[Union[str, UUID, "File"]],
+        concurrency: int,
+        retries: int,
+        raise_errors: bool,
+    ) -> BatchFileOperationResult:
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive number")
+
+        def process(chunk: List[str]) -> BatchFileOperationResponse:
+            attempt = 0
+            while True:
+                try:
+                    return operation(chunk)
+                except RETRIABLE_ERRORS as exc:
+                    if attempt >= retries:
+                        raise
+                    sleep(_retry_delay(attempt, exc))
+                    attempt += 1
+
+        result = BatchFileOperationResult()
+        chunks = iterate_over_batches(
+            self._iter_uuids(files), self.batch_chunk_size
+        )
+        inflight: Dict[Future, List[str]] = {}
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                while len(inflight) < concurrency:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    inflight[executor.submit(process, chunk)] = chunk
+
+                if not inflight:
+                    return result
+
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = inflight.pop(future)
+                    try:
+                        response = future.result()
+                    except (UploadcareException, HTTPError) as exc:
+                        if raise_errors:
+                            raise
+                        result.problems.update(dict.fromkeys(chunk, exc))
+                        continue
+
+                    if self.info_cache is not None:
+                        for uuid in chunk:
+                            self.info_cache.invalidate(uuid)
+
+                    problems = response.problems or {}
+                    result.problems.update(problems)
+                    result.processed += sum(
+                        1 for uuid in chunk if uuid not in problems
                     )
 
-            return uuids
-
-        uuids: List[str] = __extracts_uuids(file_generator)
-        return uuids
-
-    def store_files(self, files: Iterable[Union[str, UUID, "File"]]) -> None:
+    def store_files(
+        self,
+        files: Iterable[Union[str, UUID, "File"]],
+        concurrency: int = 1,
+        retries: int = 0,
+        raise_errors: bool = True,
+    ) -> BatchFileOperationResult:
         """Stores multiple files by requesting Uploadcare API.
 
         Usage example::
@@ -636,17 +1112,35 @@ class Uploadcare:
             ... 'a771f854-c2cb-408a-8c36-71af77811f3b'
             ... ]
             >>> uploadcare.store_files(files)
+            BatchFileOperationResult(processed=2, problems={})
 
         Args:
             - files:
-                List of file UUIDs, CND urls or ``File`` instances.
+                Iterable of file UUIDs, CND urls or ``File`` instances.
+                It is consumed lazily by chunks of ``batch_chunk_size``.
+            - concurrency:
+                Amount of chunks processed simultaneously.
+            - retries:
+                Amount of retries for a chunk after server or network errors.
+            - raise_errors:
+                If ``False``, errors of failed chunks are reported in
+                ``problems`` for every file of the chunk instead of raising.
         """
-        uuids = self._extract_uuids(files)
-
-        for chunk in iterate_over_batches(uuids, self.batch_chunk_size):
-            self.files_api.batch_store(chunk)
+        return self._run_batch_operation(
+            self.files_api.batch_store,
+            files,
+            concurrency=concurrency,
+            retries=retries,
+            raise_errors=raise_errors,
+        )
 
-    def delete_files(self, files: Iterable[Union[str, UUID, "File"]]) -> None:
+    def delete_files(
+        self,
+        files: Iterable[Union[str, UUID, "File"]],
+        concurrency: int = 1,
+        retries: int = 0,
+        raise_errors: bool = True,
+    ) -> BatchFileOperationResult:
         """Deletes multiple files by requesting Uploadcare API.
 
         Usage example::
@@ -657,15 +1151,185 @@ class Uploadcare:
             ... 'a771f854-c2cb-408a-8c36-71af77811f3b'
             ... ]
             >>> uploadcare.delete_files(files)
+            BatchFileOperationResult(processed=2, problems={})
 
         Args:
             - files:
-                List of file UUIDs, CND urls or ``File`` instances.
+                Iterable of file UUIDs, CND urls or ``File`` instances.
+                It is consumed lazily by chunks of ``batch_chunk_size``.
+            - concurrency:
+                Amount of chunks processed simultaneously.
+            - retries:
+                Amount of retries for a chunk after server or network errors.
+            - raise_errors:
+                If ``False``, errors of failed chunks are reported in
+                ``problems`` for every file of the chunk instead of raising.
+        """
+        return self._run_batch_operation(
+            self.files_api.batch_delete,
+            files,
+            concurrency=concurrency,
+            retries=retries,
+            raise_errors=raise_errors,
+        )
+
+    def convert_files(  # noqa: C901
+        self,
+        files: Iterable[Union[str, UUID, File]],
+        transformation: Union[VideoTransformation, DocumentTransformation],
+        store: Optional[bool] = None,
+        save_in_group: bool = False,
+        chunk_size: Optional[int] = None,
+    ) -> BatchConversionResult:
+        """Converts multiple videos or documents using as few requests as possible.
+
+        Files are sent in chunks of ``chunk_size`` paths per request,
+        results and problems are mapped back to the source files::
+
+            >>> transformation = VideoTransformation().format(VideoFormat.mp4).thumbs(2)
+            >>> result = uploadcare.convert_files(uuids, transformation)
+            >>> for source_uuid, converted_file in result.files.items():
+            ...     print(source_uuid, converted_file, converted_file.thumbnails_group_uuid)
+            >>> result.problems
+            {'6c5e9526-b0fe-4739-8975-72e8d5ee6342': 'Bad path "..."'}
+
+        Args:
+            - files: file UUIDs, CDN urls or ``File`` instances.
+            - transformation: ``VideoTransformation`` or ``DocumentTransformation``.
+            - store (Optional[bool]): the same as for ``File.convert``.
+            - save_in_group (bool): the same as for ``File.convert``.
+            - chunk_size (Optional[int]): amount of files per request.
+                Defaults to ``batch_chunk_size``.
+
         """
+        convert: Callable[[List[str]], Any]
+        if isinstance(transformation, VideoTransformation):
+            if save_in_group:
+                raise ValueError(
+                    "Multipage conversion is available only for documents."
+                )
+            convert = partial(self.video_convert_api.convert, store=store)
+        elif isinstance(transformation, DocumentTransformation):
+            convert = partial(
+                self.document_convert_api.convert,
+                store=store,
+                save_in_group=save_in_group,
+            )
+        else:
+            raise ValueError(f"Unsupported transformation: {transformation}")
+
         uuids = self._extract_uuids(files)
+        result = BatchConversionResult()
+
+        for chunk in iterate_over_batches(
+            uuids, chunk_size or self.batch_chunk_size
+        ):
+            response = convert([transformation.path(uuid) for uuid in chunk])
+
+            for path, problem in (response.problems or {}).items():
+                result.problems[source_uuid(path)] = problem
+
+            converted_files: Dict[str, File] = {}
+            for conversion_info in response.result or []:
+                converted_file = self.file(conversion_info.uuid)
+                if isinstance(conversion_info, VideoConvertInfo):
+                    converted_file.thumbnails_group_uuid = (
+                        conversion_info.thumbnails_group_uuid
+                    )
+                converted_files[
+                    source_uuid(conversion_info.original_source)
+                ] = converted_file
+
+            for uuid in chunk:
+                if uuid in converted_files:
+                    result.files[uuid] = converted_files[uuid]
 
-        for chunk in iterate_over_batches(uuids, self.batch_chunk_size):
-            self.files_api.batch_delete(chunk)
+        return result
+
+    def execute_addon_bulk(  # noqa: C901
+        self,
+        files: Iterable[Union[str, UUID, File]],
+        addon: Union[AddonLabels, str],
+        params: Optional[Union[AddonExecutionParams, dict]] = None,
+        concurrency: int = 8,
+        timeout: float = 600,
+        polling: Optional[PollingStrategy] = None,
+    ) -> BatchAddonResult:
+        """Executes add-on for multiple files and waits for results.
+
+        Executions are requested by a bounded pool of workers,
+        their statuses are tracked by ``JobTracker``. When execution is
+        done, application data produced by add-on is retrieved::
+
+            >>> result = uploadcare.execute_addon_bulk(uuids, AddonLabels.CLAM_AV)
+            >>> for uuid, appdata in result.results.items():
+            ...     print(uuid, appdata.data.infected)
+            >>> result.problems
+            {'6c5e9526-b0fe-4739-8975-72e8d5ee6342': JobFailedError(...)}
+
+        Args:
+            - files: file UUIDs, CDN urls or ``File`` instances.
+            - addon: add-on name.
+            - params: add-on execution parameters.
+            - concurrency (int): maximum number of simultaneous requests.
+            - timeout (float): seconds to wait for each execution.
+            - polling (Optional[PollingStrategy]): strategy computing
+                intervals between status checks of each execution.
+
+        """
+        addon_name = addon.value if isinstance(addon, AddonLabels) else addon
+        uuids = self._extract_uuids(files)
+        result = BatchAddonResult()
+        tracker = self.job_tracker(
+            polling=polling, timeout=timeout, concurrency=concurrency
+        )
+
+        def execute(uuid: str) -> AddonExecuteResponse:
+            return self.addons_api.execute(uuid, addon, params)
+
+        def fetch_appdata(uuid: str) -> Optional[ApplicationDataBase]:
+            file_info = self.files_api.retrieve(uuid, include_appdata=True)
+            return getattr(file_info.appdata, addon_name, None)
+
+        def collect(futures: Dict[Future, str]) -> Iterator[Tuple[str, Any]]:
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except (UploadcareException, HTTPError) as exc:
+                    result.problems[futures[future]] = exc
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            jobs: Dict[Job, str] = {}
+            executions = {
+                executor.submit(execute, uuid): uuid for uuid in uuids
+            }
+            for uuid, response in collect(executions):
+                job = tracker.track_addon_execution(response.request_id, addon)
+                jobs[job] = uuid
+
+            finished: List[str] = []
+            for job in tracker.as_completed():
+                try:
+                    job.result()
+                except (UploadcareException, HTTPError) as exc:
+                    result.problems[jobs[job]] = exc
+                else:
+                    finished.append(jobs[job])
+
+            appdata = dict(
+                collect(
+                    {
+                        executor.submit(fetch_appdata, uuid): uuid
+                        for uuid in finished
+                    }
+                )
+            )
+
+        for uuid in uuids:
+            if uuid in appdata:
+                result.results[uuid] = appdata[uuid]
+
+        return result
 
     def create_file_group(self, files: List[File]) -> FileGroup:
         """Creates file group and returns ``FileGroup`` instance.
@@ -868,6 +1532,225 @@ class Uploadcare:
         )
         return expire, signature
 
+    def download(  # noqa: C901
+        self,
+        files: Iterable[Union[str, UUID, File]],
+        dest: Union[str, Callable[[File], str]],
+        concurrency: int = 4,
+        range_size: int = 64 * 1024 * 1024,
+        chunk_size: int = 1024 * 1024,
+        retries: int = 2,
+        raise_errors: bool = True,
+    ) -> BatchDownloadResult:
+        """Downloads original files from CDN with concurrent requests.
+
+        Files larger than ``range_size`` are split into parts downloaded
+        with Range requests over several connections of ``cdn_client``.
+        Parts are kept in ``.part`` files, so calling it again after
+        interruption resumes downloads. Files which already exist with
+        the size from file information are skipped, downloaded files are
+        verified against it::
+
+            >>> result = uploadcare.download(
+            ...     uploadcare.list_files(stored=True), '/backup', concurrency=16
+            ... )
+            >>> result.problems
+            {}
+
+        Information of files is requested lazily in batches, so ``files``
+        can be a long generator. Urls are signed with ``secure_url_builder``
+        if it's set, every attempt of a part is signed again, so signatures
+        don't expire during long downloads.
+
+        Args:
+            - files: file UUIDs, CDN urls or ``File`` instances.
+            - dest: directory to save files named by UUID, or function
+              which returns local path of ``File``.
+            - concurrency: maximum number of simultaneous requests.
+            - range_size: maximum size of part in bytes.
+            - chunk_size: size of chunks written to disk in bytes.
+            - retries: number of retries of failed part, each retry
+              resumes the part.
+            - raise_errors: raise the first error, otherwise errors
+              are collected in ``problems`` of the result, including
+              errors of file information requests.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive number")
+
+        result = BatchDownloadResult()
+        pending: Dict[str, Tuple[str, int, List[Part]]] = {}
+        remaining: Dict[str, int] = {}
+
+        def fail(uuid: str, exc: Exception) -> None:
+            pending.pop(uuid, None)
+            if raise_errors:
+                raise exc
+            result.problems[uuid] = exc
+
+        def process(uuid: str, part: Part, whole: bool) -> None:
+            attempt = 0
+            while True:
+                if uuid not in pending:
+                    # another part of the file failed
+                    return
+                # signed urls expire, so every attempt is signed again
+                (url,) = self.cdn_urls(
+                    [uuid], secure=self.secure_url_builder is not None
+                )
+                try:
+                    download_part(
+                        self.cdn_client, url, part, chunk_size, whole
+                    )
+                    return
+                except (APIError, HTTPError) as exc:
+                    if attempt >= retries:
+                        raise
+                    sleep(_retry_delay(attempt, exc))
+                    attempt += 1
+
+        def prefetch() -> Iterator[File]:
+            # information is requested lazily, so files can be a generator
+            # of any length, e.g. ``list_files()``
+            for batch in iterate_over_batches(files, INFO_BATCH_SIZE):
+                batch_files, problems = self._prefetch_info(
+                    batch, include_appdata=False, concurrency=concurrency
+                )
+                for file_ in batch_files:
+                    if file_.uuid in problems:
+                        fail(file_.uuid, problems.pop(file_.uuid))
+                    elif file_.uuid not in result.problems:
+                        yield file_
+
+        def plan() -> Iterator[Tuple[str, Part, bool]]:
+            for file_ in prefetch():
+                uuid = file_.uuid
+                size = file_.size
+                if size is None:
+                    fail(uuid, APIError(f"Size of file {uuid} is unknown"))
+                    continue
+
+                path = (
+                    dest(file_) if callable(dest) else os.path.join(dest, uuid)
+                )
+                if os.path.dirname(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                if os.path.exists(path) and os.path.getsize(path) == size:
+                    result.files[uuid] = path
+                    continue
+
+                parts = plan_parts(path, size, range_size)
+                if not parts:
+                    open(path, "wb").close()
+                    result.files[uuid] = path
+                    continue
+
+                pending[uuid] = (path, size, parts)
+                remaining[uuid] = len(parts)
+                for part in parts:
+                    yield uuid, part, len(parts) == 1
+
+        def complete(uuid: str) -> None:
+            path, size, parts = pending.pop(uuid)
+            join_parts(parts, path, chunk_size)
+            if os.path.getsize(path) != size:
+                os.remove(path)
+                raise APIError(f"Size of downloaded file {uuid} mismatch")
+            result.files[uuid] = path
+
+        def release(uuid: str) -> None:
+            remaining[uuid] -= 1
+            if not remaining[uuid]:
+                del remaining[uuid]
+
+        tasks = plan()
+        inflight: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                while len(inflight) < concurrency:
+                    task = next(tasks, None)
+                    if task is None:
+                        break
+                    uuid, part, whole = task
+                    if uuid not in pending:
+                        # parts of failed files aren't downloaded
+                        release(uuid)
+                        continue
+                    inflight[executor.submit(process, uuid, part, whole)] = (
+                        uuid
+                    )
+
+                if not inflight:
+                    return result
+
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    uuid = inflight.pop(future)
+                    release(uuid)
+                    try:
+                        future.result()
+                        if uuid not in remaining and uuid in pending:
+                            complete(uuid)
+                    except (UploadcareException, HTTPError, OSError) as exc:
+                        if uuid in pending:
+                            fail(uuid, exc)
+
+    def cdn_urls(
+        self,
+        files: Iterable[Union[str, UUID, File]],
+        transformation: Optional[
+            Union[str, BaseTransformation, TransformationTemplate]
+        ] = None,
+        secure: bool = False,
+        wildcard: bool = False,
+        values: Optional[Dict[str, Any]] = None,
+        per_file_token: bool = False,
+    ) -> List[str]:
+        """Returns CDN urls of many files with the same transformation.
+
+        The transformation is compiled once, so it's much faster than
+        ``File.cdn_url`` for thousands of files. Effects of passed CDN urls
+        and default effects of ``File`` instances are not applied::
+
+            >>> uploadcare.cdn_urls(
+            ...     ['a771f854-c2cb-408a-8c36-71af77811f3b'],
+            ...     ImageTransformation().resize(width=200),
+            ... )
+            ['https://ucarecdn.com/a771f854-c2cb-408a-8c36-71af77811f3b/-/resize/200x/']
+
+        Args:
+            - files: file UUIDs, CDN urls or ``File`` instances.
+            - transformation: transformation applied to every file.
+            - secure: sign urls with ``secure_url_builder``.
+            - wildcard: sign urls with wildcard signatures,
+              see ``generate_secure_url``.
+            - values: values of slots of frozen transformation.
+            - per_file_token: sign urls with tokens valid for all
+              transformations of files, see ``generate_secure_urls``.
+        """
+        if not isinstance(transformation, TransformationTemplate):
+            if not isinstance(transformation, BaseTransformation):
+                # strings are image effects, as in ``File.cdn_path``
+                transformation = ImageTransformation(transformation)
+            transformation = transformation.freeze()
+
+        # paths follow rules of transformation classes, e.g. video prefix
+        prefix, _, suffix = transformation.path(
+            SLOT_MARKER, **(values or {})
+        ).partition(SLOT_MARKER)
+        uuids = self._iter_uuids(files)
+
+        if not secure:
+            prefix = self.cdn_base + prefix
+            return [f"{prefix}{uuid}{suffix}" for uuid in uuids]
+
+        return self.generate_secure_urls(
+            (f"{prefix}{uuid}{suffix}" for uuid in uuids),
+            wildcard=wildcard,
+            per_file_token=per_file_token,
+        )
+
     def generate_secure_url(
         self, handle: Union[str, UUID], wildcard: bool = False
     ) -> str:
@@ -883,6 +1766,33 @@ class Uploadcare:
 
         return self.secure_url_builder.build(handle, wildcard=wildcard)
 
+    def generate_secure_urls(
+        self,
+        handles: Iterable[Union[str, UUID]],
+        wildcard: bool = False,
+        per_file_token: bool = False,
+    ) -> List[str]:
+        """
+        Generate authenticated URLs of many handles in their order.
+
+        URLs share the same expiration time. ``wildcard`` means the same
+        as in ``generate_secure_url``. With ``per_file_token`` handles
+        of the same file share a single token valid for all its
+        transformations, which is broader than ``wildcard``.
+        :param handles: Each can be one of the following: UUID, UUID with transformations, full URL.
+        """
+        if not self.secure_url_builder:
+            raise ValueError("secure_url_builder must be set")
+
+        return self.secure_url_builder.build_many(
+            (
+                str(handle) if isinstance(handle, UUID) else handle
+                for handle in handles
+            ),
+            wildcard=wildcard,
+            per_file_token=per_file_token,
+        )
+
     def generate_secure_url_token(
         self, handle: Union[str, UUID], wildcard: bool = False
     ) -> str:
@@ -0,0 +1,116 @@
+"""Ranged downloads of files from CDN.
+
+Files are split into parts of ``range_size`` bytes, each part is downloaded
+with a Range request into its own ``.part`` file next to the target,
+so interrupted downloads resume from current sizes of part files.
+Complete parts are joined into the target file.
+"""
+
+import os
+import shutil
+from typing import IO, List, NamedTuple
+
+from httpx import Client
+
+from pyuploadcare.exceptions import APIError
+
+
+class Part(NamedTuple):
+    path: str
+    start: int
+    end: int  # inclusive
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start + 1
+
+
+def plan_parts(path: str, size: int, range_size: int) -> List[Part]:
+    """Splits file of ``size`` bytes into parts.
+
+    Names of part files contain their ranges, so parts of downloads
+    started with another ``range_size`` are not mixed up.
+    """
+    if range_size < 1:
+        raise ValueError("range_size must be positive number")
+    return [
+        Part(f"{path}.{start}-{end}.part", start, end)
+        for start in range(0, size, range_size)
+        for end in (min(start + range_size, size) - 1,)
+    ]
+
+
+def _downloaded(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
+
+
+def download_part(  # noqa: C901
+    client: Client, url: str, part: Part, chunk_size: int, whole: bool
+) -> None:
+    """Downloads missing bytes of part, ``whole`` means the part
+    is the whole file, so the server may ignore Range header."""
+    offset = _downloaded(part.path)
+    if offset > part.size:
+        os.remove(part.path)
+        offset = 0
+    if offset == part.size:
+        return
+
+    headers = {"Range": f"bytes={part.start + offset}-{part.end}"}
+    with client.stream("GET", url, headers=headers) as response:
+        response.raise_for_status()
+        if response.status_code != 206:
+            if not whole:
+                raise APIError(f"Range requests are not supported: {url}")
+            # whole content is returned
+            offset = 0
+
+        with open(part.path, "ab" if offset else "wb") as part_file:
+            for chunk in response.iter_bytes(chunk_size):
+                part_file.write(chunk)
+
+    if _downloaded(part.path) != part.size:
+        raise APIError(f"Incomplete download of {url}")
+
+
+def copy_file(  # noqa: C901
+    source: IO[bytes], target: IO[bytes], chunk_size: int
+) -> None:
+    """Appends source to target, in kernel if ``os.sendfile`` is available."""
+    offset = 0
+    if hasattr(os, "sendfile"):
+        target.flush()
+        size = os.fstat(source.fileno()).st_size
+        try:
+            while offset < size:
+                sent = os.sendfile(
+                    target.fileno(), source.fileno(), offset, size - offset
+                )
+                if not sent:
+                    break
+                offset += sent
+        except OSError:
+            pass  # not supported for these files, copy the rest
+        target.seek(0, os.SEEK_END)
+
+    source.seek(offset)
+    shutil.copyfileobj(source, target, chunk_size)
+
+
+def join_parts(parts: List[Part], path: str, chunk_size: int) -> None:
+    """Joins downloaded parts into file at ``path`` and removes them."""
+    if len(parts) == 1:
+        os.replace(parts[0].path, path)
+        return
+
+    temporary_path = f"{path}.part"
+    with open(temporary_path, "wb") as target:
+        for part in parts:
+            with open(part.path, "rb") as source:
+                copy_file(source, target, chunk_size)
+    os.replace(temporary_path, path)
+    for part in parts:
+        os.remove(part.path)
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 DEFAULT_RETRY_AFTER = 15  # in seconds
 
 
@@ -72,6 +75,16 @@ class DuplicateFileError(UploadError):
         self.file_id = file_id
 
 
+class JobFailedError(UploadcareException):
+    """Raised when tracked conversion or add-on execution job fails."""
+
+    status: Any
+
+    def __init__(self, message: str, status: Any) -> None:
+        super().__init__(message)
+        self.status = status
+
+
 class DefaultResponseClassNotDefined(Exception):
     def __init__(self) -> None:
         super().__init__("Need define default response class for API.")
@@ -1,8 +1,11 @@
 import hashlib
+import itertools
+import math
 import mimetypes
 import os
 import string
-from typing import IO, Any, Dict, Iterable, List, Optional, TypeVar
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, TypeVar
 
 
 def get_file_size(file_object: IO) -> int:
@@ -13,17 +16,21 @@ T = TypeVar("T")
 
 
 def iterate_over_batches(
-    collection: List[T], batch_size: int
-) -> Iterable[List[T]]:
-    """Generate consequent slices of size `batch_size`."""
+    collection: Iterable[T], batch_size: int
+) -> Iterator[List[T]]:
+    """Generate consequent slices of size `batch_size`.
+
+    Collection is consumed lazily, so it can be a generator.
+    """
     if batch_size < 1:
         raise ValueError("Wrong batch size: must be positive number")
 
-    start, total = 0, len(collection)
+    iterator = iter(collection)
+    batch = list(itertools.islice(iterator, batch_size))
 
-    while start < total:
-        yield collection[start : start + batch_size]  # noqa
-        start += batch_size
+    while batch:
+        yield batch
+        batch = list(itertools.islice(iterator, batch_size))
 
 
 def guess_mime_type(file_object: IO) -> str:
@@ -54,28 +61,53 @@ def deep_update(
     return updated_mapping
 
 
-def base36encode(number):
+BASE36_ALPHABET = string.digits + string.ascii_lowercase
+CNAME_PREFIX_LEN = 10
+
+
+def _base36_length(number: int) -> int:
+    length = max(1, int(number.bit_length() / math.log2(36)))
+    while 36**length <= number:
+        length += 1
+    while length > 1 and 36 ** (length - 1) > number:
+        length -= 1
+    return length
+
+
+def base36encode(number: int, digits: Optional[int] = None) -> str:
+    """Encodes number in base36.
+
+    With ``digits`` only that many leading digits are computed.
+    """
+    if digits is not None:
+        length = _base36_length(number)
+        if length > digits:
+            number //= 36 ** (length - digits)
+
     if number == 0:
         return "0"
-    alphabet = string.digits + string.ascii_lowercase
     base36 = ""
     while number > 0:
         number, i = divmod(number, 36)
-        base36 = alphabet[i] + base36
+        base36 = BASE36_ALPHABET[i] + base36
     return base36
 
 
-def get_cname_prefix(pub_key: str):
-    CNAME_PREFIX_LEN = 10
+@lru_cache(maxsize=1024)
+def get_cname_prefix(pub_key: str) -> str:
     sha256_hex = hashlib.sha256(pub_key.encode()).hexdigest()
-    sha256_base36 = base36encode(number=int(sha256_hex, 16))
-    prefix = sha256_base36[:CNAME_PREFIX_LEN]
-    return prefix
+    return base36encode(int(sha256_hex, 16), digits=CNAME_PREFIX_LEN)
 
 
+@lru_cache(maxsize=None)
 def get_cdn_base(
     pub_key: Optional[str], default: str, subdomains: bool, subdomains_ptn: str
 ) -> str:
+    """Returns CDN base of project.
+
+    Results are cached by arguments for the lifetime of the process,
+    so it can be called per request to resolve CDN bases of many projects.
+    """
     if subdomains and pub_key:
         prefix = get_cname_prefix(pub_key)
         return subdomains_ptn.format(prefix=prefix)
@@ -0,0 +1,297 @@
+import heapq
+import itertools
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from uuid import UUID
+
+from httpx import HTTPError
+
+from pyuploadcare.api.addon_entities import AddonLabels
+from pyuploadcare.api.responses import AddonResponse, AddonStatus
+from pyuploadcare.exceptions import (
+    JobFailedError,
+    TimeoutError,
+    UploadcareException,
+)
+from pyuploadcare.polling import (
+    ExponentialBackoff,
+    PollingState,
+    PollingStrategy,
+)
+
+
+if TYPE_CHECKING:
+    from pyuploadcare.client import Uploadcare
+
+
+CONVERSION_SUCCESS_STATUSES = ("finished",)
+CONVERSION_FAILURE_STATUSES = ("failed", "cancelled")
+ADDON_FAILURE_STATUSES = (AddonStatus.ERROR, AddonStatus.UNKNOWN)
+
+
+class Job:
+    """Conversion or add-on execution tracked by ``JobTracker``.
+
+    ``future`` is resolved with the last job status,
+    e.g. ``VideoConvertStatus`` or ``AddonResponse``,
+    or with ``JobFailedError``/``TimeoutError`` exception. Network errors
+    of status requests are retried until the deadline, then the last one
+    is set.
+
+    """
+
+    def __init__(
+        self,
+        job_id: Union[int, str],
+        fetch_status: Callable[[], Any],
+        deadline: float,
+    ):
+        self.id = job_id
+        self.deadline = deadline
+        self.status: Any = None
+        self.future: Future = Future()
+        self._fetch_status = fetch_status
+        self._polling_state = PollingState()
+
+    def __repr__(self):
+        return f"<uploadcare.Job {self.id}>"
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout)
+
+    def _resolve(self, status: Any) -> bool:
+        """Completes the job if ``status`` is final."""
+        self.status = status
+
+        if isinstance(status, AddonResponse):
+            succeeded = status.status == AddonStatus.DONE
+            failed = status.status in ADDON_FAILURE_STATUSES
+        else:
+            succeeded = status.status in CONVERSION_SUCCESS_STATUSES
+            failed = status.status in CONVERSION_FAILURE_STATUSES
+
+        if succeeded:
+            self.future.set_result(status)
+        elif failed:
+            self.future.set_exception(
+                JobFailedError(f"job {self.id} failed: {status}", status)
+            )
+        return succeeded or failed
+
+
+class JobTracker:
+    """Waits for many conversion and add-on execution jobs at once.
+
+    Jobs are polled from a single scheduler loop by a bounded pool of
+    workers. Each job has its own polling schedule and deadline, and the
+    total rate of status requests can be limited::
+
+        >>> tracker = uploadcare.job_tracker(requests_per_second=10)
+        >>> for info in uploadcare.video_convert_api.convert(paths).result:
+        ...     tracker.track_video_conversion(info.token)
+        >>> for job in tracker.as_completed():
+        ...     print(job.id, job.result().result.uuid)
+
+    Completion can also be observed by callbacks passed to ``track_*``
+    methods or by ``Job.future``. Callbacks are called from the thread
+    running ``as_completed`` or ``wait``.
+
+    Args:
+        - polling: strategy computing intervals between status checks
+          of each job. Defaults to exponential backoff from 1 to 30 seconds.
+        - timeout: default job deadline in seconds.
+        - concurrency: maximum number of simultaneous status requests.
+        - requests_per_second: limit for the rate of status requests.
+
+    """
+
+    def __init__(
+        self,
+        client: "Uploadcare",
+        polling: Optional[PollingStrategy] = None,
+        timeout: float = 600,
+        concurrency: int = 4,
+        requests_per_second: Optional[float] = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive number")
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive number")
+
+        self._client = client
+        self.polling = polling or ExponentialBackoff(
+            initial=1, max_interval=30
+        )
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+
+        self._schedule: List[Tuple[float, int, Job]] = []
+        self._sequence = itertools.count()
+        self._next_request_at = 0.0
+
+    def __len__(self):
+        return len(self._schedule)
+
+    def track_video_conversion(
+        self,
+        token: int,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[Job], Any]] = None,
+    ) -> Job:
+        """Tracks video conversion job by its token."""
+        return self._track(
+            token,
+            lambda: self._client.video_convert_api.status(token),
+            timeout,
+            callback,
+        )
+
+    def track_document_conversion(
+        self,
+        token: int,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[Job], Any]] = None,
+    ) -> Job:
+        """Tracks document conversion job by its token."""
+        return self._track(
+            token,
+            lambda: self._client.document_convert_api.status(token),
+            timeout,
+            callback,
+        )
+
+    def track_addon_execution(
+        self,
+        request_id: Union[UUID, str],
+        addon_name: Union[AddonLabels, str],
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[Job], Any]] = None,
+    ) -> Job:
+        """Tracks add-on execution by its request id."""
+        return self._track(
+            str(request_id),
+            lambda: self._client.addons_api.status(request_id, addon_name),
+            timeout,
+            callback,
+        )
+
+    def _track(
+        self,
+        job_id: Union[int, str],
+        fetch_status: Callable[[], Any],
+        timeout: Optional[float],
+        callback: Optional[Callable[[Job], Any]],
+    ) -> Job:
+        if timeout is None:
+            timeout = self.timeout
+
+        job = Job(job_id, fetch_status, deadline=time.time() + timeout)
+        if callback:
+            job.future.add_done_callback(lambda _: callback(job))
+
+        self._schedule_job(job, time.time())
+        return job
+
+    def _schedule_job(self, job: Job, due: float) -> None:
+        heapq.heappush(self._schedule, (due, next(self._sequence), job))
+
+    def _reserve_request(self, now: float) -> bool:
+        if self.requests_per_second is None:
+            return True
+        if now < self._next_request_at:
+            return False
+        self._next_request_at = (
+            max(now, self._next_request_at) + 1 / self.requests_per_second
+        )
+        return True
+
+    def _submit_due_jobs(
+        self, executor: ThreadPoolExecutor, inflight: Dict[Future, Job]
+    ) -> None:
+        now = time.time()
+        while (
+            self._schedule
+            and len(inflight) < self.concurrency
+            and self._schedule[0][0] <= now
+            and self._reserve_request(now)
+        ):
+            _, _, job = heapq.heappop(self._schedule)
+            inflight[executor.submit(job._fetch_status)] = job
+
+    def _next_wakeup(self) -> Optional[float]:
+        if not self._schedule:
+            return None
+        due = max(self._schedule[0][0], self._next_request_at)
+        return max(due - time.time(), 0)
+
+    def _handle_status(self, job: Job, future: Future) -> bool:  # noqa: C901
+        error: Optional[Exception] = None
+        try:
+            status = future.result()
+        except UploadcareException as exc:
+            job.future.set_exception(exc)
+            return True
+        except HTTPError as exc:
+            # network errors are transient, status is checked again
+            error = exc
+        else:
+            if job._resolve(status):
+                return True
+
+        now = time.time()
+        if now >= job.deadline:
+            job.future.set_exception(
+                error or TimeoutError(f"timed out waiting for job {job.id}")
+            )
+            return True
+
+        job._polling_state.advance(job._polling_state.interval)
+        interval = self.polling.next_interval(job._polling_state)
+        job._polling_state.interval = interval
+        self._schedule_job(job, min(now + interval, job.deadline))
+        return False
+
+    def as_completed(self) -> Iterator[Job]:
+        """Polls tracked jobs and yields them as they complete."""
+        inflight: Dict[Future, Job] = {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while self._schedule or inflight:
+                self._submit_due_jobs(executor, inflight)
+
+                wakeup = self._next_wakeup()
+                if not inflight:
+                    time.sleep(wakeup or 0)
+                    continue
+
+                done, _ = wait(
+                    inflight, timeout=wakeup, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    job = inflight.pop(future)
+                    if self._handle_status(job, future):
+                        yield job
+
+    def wait(self) -> List[Job]:
+        """Polls tracked jobs until all of them complete."""
+        return list(self.as_completed())
@@ -0,0 +1,283 @@
+import json
+import sqlite3
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pyuploadcare.resources.utils import coerce_to_optional_datetime
+
+
+if TYPE_CHECKING:
+    from pyuploadcare.client import Uploadcare
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    uuid TEXT PRIMARY KEY,
+    size INTEGER,
+    mime_type TEXT,
+    original_filename TEXT,
+    is_image INTEGER,
+    is_ready INTEGER,
+    image_width INTEGER,
+    image_height INTEGER,
+    datetime_uploaded TEXT,
+    datetime_stored TEXT,
+    datetime_removed TEXT,
+    metadata TEXT
+);
+CREATE INDEX IF NOT EXISTS files_datetime_uploaded
+    ON files (datetime_uploaded);
+CREATE INDEX IF NOT EXISTS files_state
+    ON files (datetime_removed, datetime_stored, datetime_uploaded);
+CREATE INDEX IF NOT EXISTS files_mime_type ON files (mime_type);
+CREATE INDEX IF NOT EXISTS files_size ON files (size);
+"""
+
+COLUMNS = (
+    "uuid",
+    "size",
+    "mime_type",
+    "original_filename",
+    "is_image",
+    "is_ready",
+    "image_width",
+    "image_height",
+    "datetime_uploaded",
+    "datetime_stored",
+    "datetime_removed",
+    "metadata",
+)
+
+UPSERT = "INSERT OR REPLACE INTO files ({0}) VALUES ({1})".format(
+    ", ".join(COLUMNS), ", ".join("?" * len(COLUMNS))
+)
+
+
+def _format_datetime(value: Optional[Union[str, datetime]]) -> Optional[str]:
+    """Formats datetime as UTC ISO 8601 string with microseconds,
+    so that strings are ordered as datetimes."""
+    value = coerce_to_optional_datetime(value)
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _row(item: Dict[str, Any]) -> Tuple:
+    image = (item.get("content_info") or {}).get("image") or {}
+    metadata = item.get("metadata")
+    return (
+        item["uuid"],
+        item.get("size"),
+        item.get("mime_type"),
+        item.get("original_filename"),
+        item.get("is_image"),
+        item.get("is_ready"),
+        image.get("width"),
+        image.get("height"),
+        _format_datetime(item.get("datetime_uploaded")),
+        _format_datetime(item.get("datetime_stored")),
+        _format_datetime(item.get("datetime_removed")),
+        json.dumps(metadata) if metadata is not None else None,
+    )
+
+
+class FileMirror:
+    """Local SQLite copy of project files for fast queries.
+
+    The first ``refresh`` lists all files of the project, next ones list
+    only files uploaded since the latest known upload, and files which
+    were neither stored nor removed yet, to track their stores and
+    removals::
+
+        >>> mirror = FileMirror(uploadcare, 'files.db')
+        >>> mirror.refresh()
+        >>> mirror.count(
+        ...     stored=True,
+        ...     is_image=True,
+        ...     min_size=5 * 1024 * 1024,
+        ...     uploaded_after=datetime.now() - timedelta(days=7),
+        ... )
+        42
+
+    Removals of files stored before the latest refresh can't be listed
+    incrementally, ``refresh(full=True)`` lists all files again and
+    drops files which don't exist anymore.
+
+    """
+
+    def __init__(self, client: "Uploadcare", path: str = ":memory:"):
+        self._client = client
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _scalar(self, query: str, parameters: Tuple = ()) -> Any:
+        return self.connection.execute(query, parameters).fetchone()[0]
+
+    def _list_items(
+        self, removed: bool, starting_point: Optional[str]
+    ) -> Iterator[Dict[str, Any]]:
+        query_parameters = {
+            "ordering": "datetime_uploaded",
+            "removed": str(removed).lower(),
+        }
+        if starting_point is not None:
+            query_parameters["from"] = starting_point
+        return self._client.files_api.list_raw(
+            request_limit=1000, **query_parameters
+        )
+
+    def refresh(self, full: bool = False) -> int:  # noqa: C901
+        """Updates the mirror by listing files from REST API.
+
+        Returns number of received files.
+        """
+        starting_point = None
+        if not full:
+            starting_point = self._scalar(
+                "SELECT MIN(datetime_uploaded) FROM files "
+                "WHERE datetime_stored IS NULL AND datetime_removed IS NULL"
+            ) or self._scalar("SELECT MAX(datetime_uploaded) FROM files")
+
+        received = 0
+        with self.connection:
+            if full:
+                # table of failed refresh can be left, DDL isn't rolled back
+                self.connection.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS seen "
+                    "(uuid TEXT PRIMARY KEY)"
+                )
+                self.connection.execute("DELETE FROM seen")
+
+            for removed in (False, True):
+                for item in self._list_items(removed, starting_point):
+                    self.connection.execute(UPSERT, _row(item))
+                    if full:
+                        self.connection.execute(
+                            "INSERT OR IGNORE INTO seen VALUES (?)",
+                            (item["uuid"],),
+                        )
+                    received += 1
+
+            if full:
+                self.connection.execute(
+                    "DELETE FROM files WHERE uuid NOT IN (SELECT uuid FROM seen)"
+                )
+                self.connection.execute("DROP TABLE seen")
+
+        return received
+
+    def _where(  # noqa: C901
+        self,
+        stored: Optional[bool] = None,
+        removed: Optional[bool] = False,
+        is_image: Optional[bool] = None,
+        mime_type: Optional[str] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        uploaded_after: Optional[Union[str, datetime]] = None,
+        uploaded_before: Optional[Union[str, datetime]] = None,
+    ) -> Tuple[str, Tuple]:
+        conditions: List[str] = []
+        parameters: List[Any] = []
+
+        if stored is not None:
+            conditions.append(
+                "datetime_stored IS NOT NULL"
+                if stored
+                else "datetime_stored IS NULL"
+            )
+        if removed is not None:
+            conditions.append(
+                "datetime_removed IS NOT NULL"
+                if removed
+                else "datetime_removed IS NULL"
+            )
+        if is_image is not None:
+            conditions.append("is_image = ?")
+            parameters.append(is_image)
+        if mime_type is not None:
+            # "image/" matches all images
+            if mime_type.endswith("/"):
+                conditions.append("mime_type LIKE ?")
+                parameters.append(f"{mime_type}%")
+            else:
+                conditions.append("mime_type = ?")
+                parameters.append(mime_type)
+        if min_size is not None:
+            conditions.append("size >= ?")
+            parameters.append(min_size)
+        if max_size is not None:
+            conditions.append("size <= ?")
+            parameters.append(max_size)
+        if uploaded_after is not None:
+            conditions.append("datetime_uploaded >= ?")
+            parameters.append(_format_datetime(uploaded_after))
+        if uploaded_before is not None:
+            conditions.append("datetime_uploaded < ?")
+            parameters.append(_format_datetime(uploaded_before))
+
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return where, tuple(parameters)
+
+    def count(self, **filters) -> int:
+        """Returns number of files matching filters.
+
+        Filters:
+            - stored, removed, is_image: ``True``, ``False`` or ``None``
+              to ignore. Removed files are excluded by default.
+            - mime_type: exact mime type or its prefix like ``image/``.
+            - min_size, max_size: size limits in bytes, inclusive.
+            - uploaded_after, uploaded_before: upload datetime limits,
+              naive datetimes are treated as UTC.
+        """
+        where, parameters = self._where(**filters)
+        return self._scalar(f"SELECT COUNT(*) FROM files{where}", parameters)
+
+    def total_size(self, **filters) -> int:
+        """Returns total size of files matching filters, see ``count``."""
+        where, parameters = self._where(**filters)
+        return self._scalar(
+            f"SELECT COALESCE(SUM(size), 0) FROM files{where}", parameters
+        )
+
+    def query(
+        self, limit: Optional[int] = None, **filters
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterates over files matching filters ordered by upload datetime.
+
+        See ``count`` for filters.
+        """
+        where, parameters = self._where(**filters)
+        query = f"SELECT * FROM files{where} ORDER BY datetime_uploaded"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters += (limit,)
+
+        for row in self.connection.execute(query, parameters):
+            item = dict(row)
+            if item["metadata"] is not None:
+                item["metadata"] = json.loads(item["metadata"])
+            yield item
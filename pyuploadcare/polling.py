@@ -0,0 +1,119 @@
+import dataclasses
+import random
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+@dataclasses.dataclass
+class PollingState:
+    """State of a single polling session passed to ``PollingStrategy``.
+
+    - ``attempt`` -- number of checks performed so far;
+    - ``interval`` -- last interval waited before the latest check;
+    - ``done``, ``total`` -- progress reported by the latest check, if any;
+    - ``previous_done`` -- progress reported by the check before it.
+
+    """
+
+    attempt: int = 0
+    interval: float = 0.0
+    done: Optional[int] = None
+    total: Optional[int] = None
+    previous_done: Optional[int] = None
+
+    def advance(
+        self,
+        interval: float,
+        done: Optional[int] = None,
+        total: Optional[int] = None,
+    ) -> None:
+        self.attempt += 1
+        self.interval = interval
+        self.previous_done = self.done
+        self.done = done
+        self.total = total
+
+
+class PollingStrategy(ABC):
+    """Computes delays between consecutive status checks."""
+
+    @abstractmethod
+    def next_interval(self, state: PollingState) -> float:
+        """Returns seconds to wait before the next check."""
+        raise NotImplementedError
+
+
+class FixedInterval(PollingStrategy):
+    """Checks status every ``interval`` seconds."""
+
+    def __init__(self, interval: float = 0.3):
+        self.interval = interval
+
+    def next_interval(self, state: PollingState) -> float:
+        return self.interval
+
+
+class ExponentialBackoff(PollingStrategy):
+    """Multiplies interval by ``factor`` after every check.
+
+    ``initial`` is the interval after the first check.
+    Interval is capped by ``max_interval``. ``jitter`` is a fraction of
+    the interval used to randomize it, so many pollers started at once
+    don't check status at the same moments.
+
+    """
+
+    def __init__(
+        self,
+        initial: float = 0.3,
+        factor: float = 2.0,
+        max_interval: float = 5.0,
+        jitter: float = 0.1,
+    ):
+        if initial < 0 or factor < 1:
+            raise ValueError(
+                "initial must not be negative and factor must be at least 1"
+            )
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def _backoff(self, state: PollingState) -> float:
+        exponent = max(state.attempt - 1, 0)
+        return min(self.initial * self.factor**exponent, self.max_interval)
+
+    def _apply_jitter(self, interval: float) -> float:
+        if self.jitter:
+            interval *= random.uniform(  # noqa: S311
+                1 - self.jitter, 1 + self.jitter
+            )
+        return min(interval, self.max_interval)
+
+    def next_interval(self, state: PollingState) -> float:
+        return self._apply_jitter(self._backoff(state))
+
+
+class ProgressAwareBackoff(ExponentialBackoff):
+    """Estimates time left from the growth of ``done`` towards ``total``.
+
+    While progress grows the next check is scheduled at the estimated
+    completion time, bounded by ``initial`` and ``max_interval``.
+    Without progress information it falls back to exponential backoff.
+
+    """
+
+    def _estimate(self, state: PollingState) -> Optional[float]:
+        if not (state.done and state.total and state.interval):
+            return None
+        if state.previous_done is None or state.done <= state.previous_done:
+            return None
+
+        rate = (state.done - state.previous_done) / state.interval
+        return (state.total - state.done) / rate
+
+    def next_interval(self, state: PollingState) -> float:
+        estimate = self._estimate(state)
+        if estimate is None:
+            return super().next_interval(state)
+        return self._apply_jitter(max(estimate, self.initial))
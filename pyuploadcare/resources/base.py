@@ -84,12 +84,23 @@ class BaseApiList:
         except StopIteration:
             raise IndexError("index out of range")
 
-    def count(self):
+    def count(self):  # noqa: C901
         if self.starting_point:
             raise ValueError(
                 "Can't count objects if the `starting_point` present"
             )
         if self._count is None:
             qs = self.query_parameters(limit=None)
-            self._count = self.resource_api.count(**qs)
+            count_cache = self._client.count_cache
+            key = (
+                self.resource_api.resource_type,
+                tuple(sorted(qs.items(), key=str)),
+            )
+
+            if count_cache is not None:
+                self._count = count_cache.get(key)
+            if self._count is None:
+                self._count = self.resource_api.count(**qs)
+                if count_cache is not None:
+                    count_cache.set(key, self._count)
         return self._count
@@ -0,0 +1,155 @@
+"""Columnar representation of file listings.
+
+Columns are built as PyArrow arrays if ``pyarrow`` is installed,
+otherwise as NumPy arrays. In NumPy arrays missing integers are ``-1``,
+missing datetimes are ``NaT``.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+
+
+# column kinds
+STRING = "string"
+INTEGER = "integer"
+BOOLEAN = "boolean"
+DATETIME = "datetime"
+
+NUMPY_DTYPES: Dict[str, Any] = {
+    STRING: object,
+    INTEGER: "int64",
+    BOOLEAN: "bool",
+    DATETIME: "datetime64[us]",
+}
+
+MISSING_INTEGER = -1
+
+
+def _image_info(item: Dict[str, Any]) -> Dict[str, Any]:
+    return (item.get("content_info") or {}).get("image") or {}
+
+
+COLUMNS: Dict[str, Any] = {
+    "uuid": (STRING, lambda item: item["uuid"]),
+    "size": (INTEGER, lambda item: item.get("size")),
+    "mime_type": (STRING, lambda item: item.get("mime_type")),
+    "original_filename": (
+        STRING,
+        lambda item: item.get("original_filename"),
+    ),
+    "datetime_uploaded": (
+        DATETIME,
+        lambda item: item.get("datetime_uploaded"),
+    ),
+    "datetime_stored": (DATETIME, lambda item: item.get("datetime_stored")),
+    "datetime_removed": (DATETIME, lambda item: item.get("datetime_removed")),
+    "is_stored": (BOOLEAN, lambda item: bool(item.get("datetime_stored"))),
+    "is_removed": (BOOLEAN, lambda item: bool(item.get("datetime_removed"))),
+    "is_image": (BOOLEAN, lambda item: bool(item.get("is_image"))),
+    "is_ready": (BOOLEAN, lambda item: bool(item.get("is_ready"))),
+    "image_width": (INTEGER, lambda item: _image_info(item).get("width")),
+    "image_height": (INTEGER, lambda item: _image_info(item).get("height")),
+}
+
+DEFAULT_FIELDS = (
+    "uuid",
+    "size",
+    "mime_type",
+    "datetime_uploaded",
+    "is_stored",
+    "is_image",
+    "image_width",
+    "image_height",
+)
+
+
+def has_arrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _numpy_datetime(value: Any) -> str:
+    if not value:
+        return "NaT"
+    # NumPy parses only timezone naive strings, REST API returns UTC
+    return value.rstrip("Z").split("+")[0]
+
+
+def _build_numpy_columns(buffers: Dict[str, List[Any]]) -> Dict[str, Any]:
+    import numpy
+
+    columns = {}
+    for field, values in buffers.items():
+        kind = COLUMNS[field][0]
+        if kind == INTEGER:
+            values = [
+                MISSING_INTEGER if value is None else value for value in values
+            ]
+        elif kind == DATETIME:
+            values = [_numpy_datetime(value) for value in values]
+        columns[field] = numpy.array(values, dtype=NUMPY_DTYPES[kind])
+    return columns
+
+
+def _build_arrow_table(buffers: Dict[str, List[Any]]) -> Any:
+    import pyarrow
+
+    types = {
+        STRING: pyarrow.string(),
+        INTEGER: pyarrow.int64(),
+        BOOLEAN: pyarrow.bool_(),
+    }
+    arrays = []
+    for field, values in buffers.items():
+        kind = COLUMNS[field][0]
+        if kind == DATETIME:
+            array = pyarrow.array(values, pyarrow.string()).cast(
+                pyarrow.timestamp("us", tz="UTC")
+            )
+        else:
+            array = pyarrow.array(values, types[kind])
+        arrays.append(array)
+    return pyarrow.table(arrays, names=list(buffers))
+
+
+def iter_columns(  # noqa: C901
+    items: Iterable[Dict[str, Any]],
+    fields: Sequence[str] = DEFAULT_FIELDS,
+    chunk_size: int = 100000,
+    as_arrow: bool = False,
+) -> Iterator[Any]:
+    """Converts REST API file listing items into chunks of columns.
+
+    Yields ``pyarrow.Table`` if ``as_arrow`` is ``True``,
+    otherwise ``dict`` of NumPy arrays by field name.
+    Empty listing produces a single chunk of empty columns.
+    """
+    unknown = set(fields) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive number")
+
+    build = _build_arrow_table if as_arrow else _build_numpy_columns
+    buffers: Dict[str, List[Any]] = {field: [] for field in fields}
+    getters: List[Callable] = [COLUMNS[field][1] for field in fields]
+    columns = list(zip(getters, buffers.values()))
+    size = 0
+    empty = True
+
+    for item in items:
+        for getter, buffer in columns:
+            buffer.append(getter(item))
+        size += 1
+
+        if size == chunk_size:
+            empty = False
+            yield build(buffers)
+            buffers = {field: [] for field in fields}
+            columns = list(zip(getters, buffers.values()))
+            size = 0
+
+    if size or empty:
+        yield build(buffers)
@@ -57,6 +57,15 @@ class FileGroup(Iterable):
 
     """
 
+    __slots__ = (
+        "id",
+        "_is_deleted",
+        "_stored_at",
+        "_files_qty",
+        "_info_cache",
+        "_client",
+    )
+
     def __init__(self, cdn_url_or_group_id: str, client: "Uploadcare"):
         matches = GROUP_ID_REGEX.search(cdn_url_or_group_id)
 
@@ -171,35 +180,34 @@ class FileGroup(Iterable):
         if isinstance(datetime_, str):
             return dateutil.parser.parse(datetime_)
 
+    def _files_info(self) -> Iterator[Dict[str, Any]]:
+        for file_info in self.info.get("files") or ():
+            # Due to type of source as Optional[List[Optional[FileInfo]]]
+            if file_info is not None:
+                yield file_info
+
     @property
     def is_stored(self):
         """Returns ``True`` if group is stored.
 
-        It might do several API request
-        because it iterates over all files gathered in group.
+        It is computed from group information, so it might do API request
+        once because it depends on ``info``.
 
         """
-        is_stored = False
         most_fresh_date: Optional[datetime] = None
 
-        for _file in self:
-            if not _file:
-                """Due to type of source as Optional[List[Optional[FileInfo]]]"""
-                continue
-
-            if not _file.is_stored:
-                most_fresh_date = None
-                break
+        for file_info in self._files_info():
+            datetime_stored = file_info.get("datetime_stored")
+            if datetime_stored is None:
+                self._stored_at = None
+                return False
 
             most_fresh_date = max_for_optional_datetimes(
-                most_fresh_date,
-                coerce_to_optional_datetime(_file.datetime_stored),
+                most_fresh_date, coerce_to_optional_datetime(datetime_stored)
             )
-        else:
-            is_stored = True
 
         self._stored_at = most_fresh_date
-        return is_stored
+        return True
 
     def store(self):
         """Stores all group's files by requesting Uploadcare API.
@@ -209,13 +217,19 @@ class FileGroup(Iterable):
         Since pyuploadcare v.4.0. started to use REST API v.0.7
         this method performs multiple API calls
         using batch method for file storing
-        and API call for updating collection of files belonging to the group
+        and API call for updating collection of files belonging to the group.
+        Files which are already stored are skipped.
 
         """
-        if self.is_stored:
+        not_stored = [
+            file_info["uuid"]
+            for file_info in self._files_info()
+            if file_info.get("datetime_stored") is None
+        ]
+        if not not_stored:
             return
 
-        self._client.store_files(file_ for file_ in self)
+        self._client.store_files(not_stored)
         self.update_info()
         return self.is_stored
 
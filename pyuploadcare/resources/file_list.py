@@ -1,4 +1,12 @@
+import sys
+from typing import Any, Iterator, Optional, Sequence
+
 from pyuploadcare.resources.base import BaseApiList
+from pyuploadcare.resources.columns import (
+    DEFAULT_FIELDS,
+    has_arrow,
+    iter_columns,
+)
 
 
 class FileList(BaseApiList):
@@ -37,6 +45,11 @@ class FileList(BaseApiList):
 
         >>> print('Number of stored files is', uploadcare.list_files(stored=True).count())
 
+    Get columns of file information for analytics::
+
+        >>> table = uploadcare.list_files(stored=True).to_columns()
+        >>> table.to_pandas()
+
     """
 
     constructor_name = "file"
@@ -60,3 +73,43 @@ class FileList(BaseApiList):
             parameters.setdefault("removed", str(bool(self.removed)).lower())
 
         return super().query_parameters(**parameters)
+
+    def iter_columns(
+        self,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        chunk_size: int = 100000,
+        as_arrow: Optional[bool] = None,
+    ) -> Iterator[Any]:
+        """Iterates over chunks of file information columns.
+
+        Pages of listing are converted straight into columns,
+        no ``File`` instances are created.
+
+        Args:
+            - fields: names of columns, see ``COLUMNS``
+              from ``pyuploadcare.resources.columns``.
+            - chunk_size: maximum number of files in a chunk.
+            - as_arrow: ``True`` to yield ``pyarrow.Table``,
+              ``False`` to yield ``dict`` of NumPy arrays by field name.
+              Arrow is used by default if ``pyarrow`` is installed.
+        """
+        if as_arrow is None:
+            as_arrow = has_arrow()
+
+        items = self.resource_api.list_raw(**self.query_parameters())
+        return iter_columns(items, fields, chunk_size, as_arrow)
+
+    def to_columns(
+        self,
+        fields: Sequence[str] = DEFAULT_FIELDS,
+        as_arrow: Optional[bool] = None,
+    ) -> Any:
+        """Returns file information columns of all listed files.
+
+        See ``iter_columns`` for arguments.
+        """
+        return next(
+            self.iter_columns(
+                fields, chunk_size=sys.maxsize, as_arrow=as_arrow
+            )
+        )
@@ -0,0 +1,120 @@
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple, Union
+from uuid import UUID
+
+from pyuploadcare.resources.utils import coerce_to_optional_datetime
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# sentinels for missing integers, datetimes and strings
+NULL = -(2**63)
+NULL_LENGTH = 0xFFFF
+
+# uuid, size, flags, datetime_uploaded, datetime_stored, datetime_removed,
+# lengths of mime_type and original_filename
+HEADER = struct.Struct("<16sqBqqqHH")
+
+FLAGS = ("is_image", "is_ready")
+
+PACKED_FIELDS = (
+    "uuid",
+    "size",
+    *FLAGS,
+    "datetime_uploaded",
+    "datetime_stored",
+    "datetime_removed",
+    "mime_type",
+    "original_filename",
+)
+
+
+def _pack_datetime(value: Optional[Union[str, datetime]]) -> int:
+    value = coerce_to_optional_datetime(value)
+    if value is None:
+        return NULL
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _unpack_datetime(value: int) -> Optional[datetime]:
+    if value == NULL:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _pack_str(value: Optional[str]) -> Tuple[int, bytes]:
+    if value is None:
+        return NULL_LENGTH, b""
+    data = value.encode()
+    return len(data), data
+
+
+def pack_file_info(info: Dict[str, Any]) -> bytes:
+    """Packs ``PACKED_FIELDS`` of file information into a compact record.
+
+    It takes 53 bytes plus lengths of mime type and file name,
+    other fields are dropped.
+    """
+    flags = 0
+    for bit, field in enumerate(FLAGS):
+        # 2 bits per flag: is set, value
+        if info.get(field) is not None:
+            flags |= (2 | bool(info[field])) << bit * 2
+
+    mime_type_length, mime_type = _pack_str(info.get("mime_type"))
+    filename_length, filename = _pack_str(info.get("original_filename"))
+    size = info.get("size")
+
+    header = HEADER.pack(
+        UUID(info["uuid"]).bytes,
+        NULL if size is None else size,
+        flags,
+        _pack_datetime(info.get("datetime_uploaded")),
+        _pack_datetime(info.get("datetime_stored")),
+        _pack_datetime(info.get("datetime_removed")),
+        mime_type_length,
+        filename_length,
+    )
+    return header + mime_type + filename
+
+
+def unpack_file_info(record: bytes) -> Dict[str, Any]:
+    """Expands record made by ``pack_file_info`` into file information."""
+    (
+        uuid,
+        size,
+        flags,
+        datetime_uploaded,
+        datetime_stored,
+        datetime_removed,
+        mime_type_length,
+        filename_length,
+    ) = HEADER.unpack_from(record)
+
+    info: Dict[str, Any] = {
+        "uuid": str(UUID(bytes=uuid)),
+        "size": None if size == NULL else size,
+    }
+    for bit, field in enumerate(FLAGS):
+        value = flags >> bit * 2 & 3
+        info[field] = bool(value & 1) if value & 2 else None
+
+    info["datetime_uploaded"] = _unpack_datetime(datetime_uploaded)
+    info["datetime_stored"] = _unpack_datetime(datetime_stored)
+    info["datetime_removed"] = _unpack_datetime(datetime_removed)
+
+    offset = HEADER.size
+    for field, length in (
+        ("mime_type", mime_type_length),
+        ("original_filename", filename_length),
+    ):
+        if length == NULL_LENGTH:
+            info[field] = None
+        else:
+            info[field] = record[offset : offset + length].decode()
+            offset += length
+
+    return info
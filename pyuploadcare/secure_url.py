@@ -5,7 +5,7 @@ import re
 import time
 import warnings
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import quote_plus, urlparse
 
 
@@ -17,6 +17,24 @@ class BaseSecureUrlBuilder(ABC):
         """
         raise NotImplementedError
 
+    def build_many(
+        self,
+        handles: Iterable[str],
+        wildcard: bool = False,
+        per_file_token: bool = False,
+    ) -> List[str]:
+        """
+        :param handles: Each can be one of the following: UUID, UUID with transformations, full URL.
+        :param wildcard: The same as in ``build``.
+        :param per_file_token: Sign handles with signatures valid for all
+            transformations of their files, it's broader than ``wildcard``.
+        :return: Secure URLs in order of handles.
+        """
+        return [
+            self.build(handle, wildcard=wildcard or per_file_token)
+            for handle in handles
+        ]
+
     def get_token(self, handle: str, wildcard: bool = False) -> str:
         """
         :param handle: Can be one of the following: UUID, UUID with transformations, full URL.
@@ -31,6 +49,16 @@ class BaseAkamaiSecureUrlBuilder(BaseSecureUrlBuilder):
 
     See https://uploadcare.com/docs/security/secure_delivery/
     for more details.
+
+    Tokens are cached by path and ``wildcard`` while their expiration
+    time stays the same, by default only within the same second.
+    Caching for longer is opt-in: with ``token_bucket`` expiration time
+    is rounded down to a multiple of it, so the same token is reused for
+    ``token_bucket`` seconds and stays valid for at least
+    ``window - token_bucket`` seconds.
+
+    Handles are resolved to paths once, private methods take
+    resolved paths.
     """
 
     base_template = "https://{cdn}/{path}/"
@@ -43,23 +71,75 @@ class BaseAkamaiSecureUrlBuilder(BaseSecureUrlBuilder):
         secret_key: str,
         window: int = 300,
         hash_algo=hashlib.sha256,
+        token_bucket: int = 0,
+        token_cache_size: int = 10000,
     ):
+        if token_bucket and token_bucket >= window:
+            raise ValueError("token_bucket must be less than window")
+
         self.secret_key = secret_key
         self.cdn_url = cdn_url
         self.window = window
         self.hash_algo = hash_algo
+        self.token_bucket = token_bucket
+        self.token_cache_size = token_cache_size
+        self._tokens: Dict[Tuple[str, bool], Tuple[int, str]] = {}
+        self._hmac_key: Optional[Tuple[str, Any]] = None
+        self._hmac_template: Any = None
 
     def build(self, handle: str, wildcard: bool = False) -> str:
-        token = self.get_token(handle, wildcard=wildcard)
-        secure_url = self._build_url(handle, token)
+        path = self._get_path(handle)
+        token = self._get_token(path, wildcard, self._build_expire_time())
+        secure_url = self._build_url(path, token)
         return secure_url
 
+    def build_many(
+        self,
+        handles: Iterable[str],
+        wildcard: bool = False,
+        per_file_token: bool = False,
+    ) -> List[str]:
+        """Builds secure urls with the same expiration time.
+
+        ``wildcard`` means the same as in ``build``. With ``per_file_token``
+        all handles of a file share a single wildcard token valid for all
+        its transformations if the builder supports it,
+        see ``_get_token_path``. It's broader than ``wildcard``.
+        """
+        expire = self._build_expire_time()
+        wildcard = wildcard or per_file_token
+        tokens: Dict[str, str] = {}
+        secure_urls = []
+        for handle in handles:
+            path = self._get_path(handle)
+            token_path = self._get_token_path(path, per_file_token)
+            token = tokens.get(token_path)
+            if token is None:
+                token = self._get_token(token_path, wildcard, expire)
+                tokens[token_path] = token
+            secure_urls.append(self._build_url(path, token))
+        return secure_urls
+
     def get_token(self, handle: str, wildcard: bool = False) -> str:
         path = self._get_path(handle)
-        expire = self._build_expire_time()
+        return self._get_token(path, wildcard, self._build_expire_time())
+
+    def _get_token_path(self, path: str, per_file_token: bool) -> str:
+        """Returns path to sign for handle path in ``build_many``."""
+        return path
+
+    def _get_token(self, path: str, wildcard: bool, expire: int) -> str:
+        cached = self._tokens.get((path, wildcard))
+        if cached is not None and cached[0] == expire:
+            return cached[1]
+
         acl = self._format_acl(path, wildcard=wildcard)
-        signature = self._build_signature(handle, expire, acl)
+        signature = self._build_signature(path, expire, acl)
         token = self._build_token(expire, acl, signature)
+
+        if len(self._tokens) >= self.token_cache_size:
+            self._tokens.clear()
+        self._tokens[(path, wildcard)] = (expire, token)
         return token
 
     def _prepare_path_for_url(self, path: str) -> str:
@@ -79,25 +159,34 @@ class BaseAkamaiSecureUrlBuilder(BaseSecureUrlBuilder):
         return path
 
     def _build_expire_time(self) -> int:
-        return int(time.time()) + self.window
+        expire = int(time.time()) + self.window
+        if self.token_bucket:
+            expire -= expire % self.token_bucket
+        return expire
+
+    def _new_hmac(self) -> Any:
+        """Returns HMAC prepared with decoded secret key."""
+        key = (self.secret_key, self.hash_algo)
+        if self._hmac_key != key:
+            self._hmac_template = hmac.new(
+                binascii.a2b_hex(self.secret_key.encode()),
+                digestmod=self.hash_algo,
+            )
+            self._hmac_key = key
+        return self._hmac_template.copy()
 
     def _build_signature(
-        self, handle: str, expire: int, acl: Optional[str]
+        self, path: str, expire: int, acl: Optional[str]
     ) -> str:
-        path = self._get_path(handle)
         path = self._prepare_path_for_url(path)
         hash_source = [
             f"exp={expire}",
             f"acl={acl}" if acl else f"url={path}",
         ]
 
-        signature = hmac.new(
-            binascii.a2b_hex(self.secret_key.encode()),
-            self.field_delimeter.join(hash_source).encode(),
-            self.hash_algo,
-        ).hexdigest()
-
-        return signature
+        signature = self._new_hmac()
+        signature.update(self.field_delimeter.join(hash_source).encode())
+        return signature.hexdigest()
 
     def _build_token(self, expire: int, acl: Optional[str], signature: str):
         token_parts = [
@@ -112,10 +201,10 @@ class BaseAkamaiSecureUrlBuilder(BaseSecureUrlBuilder):
 
     def _build_url(
         self,
-        handle: str,
+        path: str,
         token: str,
     ) -> str:
-        base_url = self._build_base_url(handle)
+        base_url = self._build_base_url(path)
         return self.template.format(
             base=base_url,
             token=token,
@@ -137,26 +226,30 @@ class BaseAkamaiSecureUrlBuilder(BaseSecureUrlBuilder):
             path = f"/{path}"
         return path
 
-    def _build_base_url(self, handle: str):
+    def _build_base_url(self, path: str):
         """
-        >>> builder._build_base_url("fake-uuid")
+        >>> builder._build_base_url("/fake-uuid/")
         https://sectest.ucarecdn.com/fake-uuid/
-        >>> builder._get_path("https://sectest.ucarecdn.com/fake-uuid/-/resize/20x20/")
+        >>> builder._build_base_url("/fake-uuid/-/resize/20x20/")
         https://sectest.ucarecdn.com/fake-uuid/-/resize/20x20/
         """
-        path = self._get_path(handle)
         path = path.lstrip("/").rstrip("/")
         base_url = self.base_template.format(cdn=self.cdn_url, path=path)
         return base_url
 
     @abstractmethod
-    def _format_acl(self, handle: str, wildcard: bool) -> Optional[str]:
+    def _format_acl(self, path: str, wildcard: bool) -> Optional[str]:
         raise NotImplementedError
 
 
 class AkamaiSecureUrlBuilderWithAclToken(BaseAkamaiSecureUrlBuilder):
-    def _format_acl(self, handle: str, wildcard: bool) -> str:
-        path = self._get_path(handle)
+    def _get_token_path(self, path: str, per_file_token: bool) -> str:
+        if not per_file_token:
+            return path
+        # single token for all transformations of file
+        return "/" + path.lstrip("/").split("/", 1)[0] + "/"
+
+    def _format_acl(self, path: str, wildcard: bool) -> str:
         path = path.lstrip("/").rstrip("/")
         path = self._prepare_path_for_acl(path)
         if wildcard:
@@ -165,7 +258,7 @@ class AkamaiSecureUrlBuilderWithAclToken(BaseAkamaiSecureUrlBuilder):
 
 
 class AkamaiSecureUrlBuilderWithUrlToken(BaseAkamaiSecureUrlBuilder):
-    def _format_acl(self, handle: str, wildcard: bool) -> None:
+    def _format_acl(self, path: str, wildcard: bool) -> None:
         if wildcard:
             raise ValueError(
                 "Wildcards are not supported in AkamaiSecureUrlBuilderWithUrlToken."
@@ -180,6 +273,8 @@ class AkamaiSecureUrlBuilder(AkamaiSecureUrlBuilderWithAclToken):
         secret_key: str,
         window: int = 300,
         hash_algo=hashlib.sha256,
+        token_bucket: int = 0,
+        token_cache_size: int = 10000,
     ):
         warnings.warn(
             "AkamaiSecureUrlBuilder class was renamed to AkamaiSecureUrlBuilderWithAclToken",
@@ -191,4 +286,6 @@ class AkamaiSecureUrlBuilder(AkamaiSecureUrlBuilderWithAclToken):
             secret_key=secret_key,
             window=window,
             hash_algo=hash_algo,
+            token_bucket=token_bucket,
+            token_cache_size=token_cache_size,
         )
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 from urllib.parse import quote
 
 from typing_extensions import Self
@@ -10,6 +10,153 @@ class StrEnum(str, Enum):
         return self.value
 
 
+# marks slots in rendered transformations, can't appear in urls
+SLOT_MARKER = "\x00"
+
+
+class Slot:
+    """Placeholder for a transformation parameter.
+
+    It can be passed to transformation methods instead of a value
+    and filled in by ``TransformationTemplate``::
+
+        >>> template = (
+        ...     ImageTransformation()
+        ...     .resize(Slot("width"), Slot("height"))
+        ...     .quality(ImageQuality.smart)
+        ...     .freeze()
+        ... )
+        >>> template.render(width=200, height=100)
+        'resize/200x100/-/quality/smart/'
+
+    Slots can't be used in escaped parameters, e.g. text of overlays.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        if not name.isidentifier() or name == "file_id":
+            raise ValueError(f"Invalid slot name: {name}")
+        self.name = name
+
+    def __repr__(self):
+        return f"Slot({self.name!r})"
+
+    def __str__(self):
+        return f"{SLOT_MARKER}{self.name}{SLOT_MARKER}"
+
+    def __format__(self, format_spec: str) -> str:
+        return str(self)
+
+
+def _compile(rendered: str) -> Tuple[str, FrozenSet[str]]:
+    """Converts rendered transformation with slot markers
+    into ``str.format`` template and names of slots."""
+    parts = rendered.split(SLOT_MARKER)
+    names = parts[1::2]
+    template = "".join(
+        (
+            "{" + part + "}"
+            if index % 2
+            else part.replace("{", "{{").replace("}", "}}")
+        )
+        for index, part in enumerate(parts)
+    )
+    return template, frozenset(names)
+
+
+class TransformationTemplate:
+    """Immutable compiled transformation.
+
+    It's made by ``freeze`` method of transformations. Rendered effects
+    and hash are computed once, so templates are cheap to use as
+    ``dict`` keys and can be shared between threads. Values of ``Slot``
+    parameters are filled in by fast string formatting::
+
+        >>> template = ImageTransformation().resize(Slot("width")).freeze()
+        >>> template.path("a771f854-c2cb-408a-8c36-71af77811f3b", width=200)
+        'a771f854-c2cb-408a-8c36-71af77811f3b/-/resize/200x/'
+
+    """
+
+    __slots__ = ("slots", "_effects", "_path", "_hash")
+
+    slots: FrozenSet[str]
+    _effects: str
+    _path: str
+    _hash: int
+
+    def __init__(self, transformation: "BaseTransformation"):
+        effects, slots = _compile(transformation.effects)
+        path, _ = _compile(
+            transformation.path(f"{SLOT_MARKER}file_id{SLOT_MARKER}")
+        )
+
+        object.__setattr__(self, "slots", slots)
+        object.__setattr__(self, "_effects", effects)
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_hash", hash((type(self), path)))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError("TransformationTemplate is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError("TransformationTemplate is immutable")
+
+    def __repr__(self):
+        return f"<TransformationTemplate {self._path}>"
+
+    def __str__(self):
+        return self.render()
+
+    def __eq__(self, other):
+        if not isinstance(other, TransformationTemplate):
+            return NotImplemented
+        return self._path == other._path
+
+    def __hash__(self):
+        return self._hash
+
+    def _check_values(self, values: Dict[str, Any]) -> None:
+        missing = self.slots.difference(values)
+        if missing:
+            raise ValueError(
+                f"Values of slots are missing: {', '.join(sorted(missing))}"
+            )
+
+    @property
+    def effects(self) -> str:
+        return self.render()
+
+    def render(self, **values: Any) -> str:
+        """Returns effects with slots filled by ``values``."""
+        self._check_values(values)
+        return self._effects.format(**values)
+
+    def path(self, file_id: str, **values: Any) -> str:
+        """Returns path of file with slots filled by ``values``."""
+        self._check_values(values)
+        return self._path.format(file_id=file_id, **values)
+
+
+def split_effects(effects: str) -> List[Tuple[str, List[str]]]:
+    """Splits effects like ``resize/200x/-/format/webp/``
+    into operation names and parameters."""
+    operations: List[Tuple[str, List[str]]] = []
+    parameters: Optional[List[str]] = None
+    for part in effects.split("/"):
+        if part == "-":
+            parameters = None
+        elif not part:
+            continue
+        elif parameters is None:
+            parameters = []
+            operations.append((part, parameters))
+        else:
+            parameters.append(part)
+    return operations
+
+
 class BaseTransformation:
     def __init__(
         self, transformation: Optional[Union[str, "BaseTransformation"]] = None
@@ -18,6 +165,7 @@ class BaseTransformation:
             transformation = transformation.effects
 
         self._effects = []
+        self._effects_cache: Optional[str] = None
         if transformation:
             transformation = transformation.rstrip("/")  # type: ignore
             self._effects.append(transformation)
@@ -25,10 +173,17 @@ class BaseTransformation:
     def set(self, transformation_name: str, parameters: List[str]) -> Self:
         effect = transformation_name
         if parameters:
-            effect += "/" + "/".join(parameters)
+            effect += "/" + "/".join(
+                str(parameter) for parameter in parameters
+            )
         self._effects.append(effect)
+        self._effects_cache = None
         return self
 
+    def freeze(self) -> TransformationTemplate:
+        """Returns immutable compiled copy of the transformation."""
+        return TransformationTemplate(self)
+
     def _escape_percent(self, value: Union[str, int]) -> str:
         return str(value).replace("%", "p")
 
@@ -45,10 +200,17 @@ class BaseTransformation:
 
     @property
     def effects(self):
-        effects_ = "/-/".join(self._effects)
-        if effects_:
-            effects_ += "/"
-        return effects_
+        if self._effects_cache is None:
+            effects_ = "/-/".join(self._effects)
+            if effects_:
+                effects_ += "/"
+            self._effects_cache = effects_
+        return self._effects_cache
+
+    @property
+    def operations(self) -> List[Tuple[str, List[str]]]:
+        """Returns names and parameters of operations in order."""
+        return split_effects(self.effects)
 
     def path(self, file_id: str) -> str:
         path_ = self._prefix(file_id)
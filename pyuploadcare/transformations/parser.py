@@ -0,0 +1,158 @@
+"""Parsing of CDN urls and effects into transformation objects.
+
+    >>> parsed = parse_cdn_url(
+    ...     'https://ucarecdn.com/a771f854-c2cb-408a-8c36-71af77811f3b/'
+    ...     '-/format/webp/-/resize/200x/image.jpg'
+    ... )
+    >>> parsed.transformation.operations
+    [('format', ['webp']), ('resize', ['200x'])]
+    >>> canonical_cdn_path(parsed)
+    'a771f854-c2cb-408a-8c36-71af77811f3b/-/resize/200x/-/format/webp/image.jpg'
+
+"""
+
+import dataclasses
+import re
+from typing import Dict, List, Optional, Type, Union
+
+from pyuploadcare.exceptions import InvalidParamError
+from pyuploadcare.resources.file import RE_UUID
+from pyuploadcare.transformations.base import BaseTransformation, split_effects
+from pyuploadcare.transformations.document import DocumentTransformation
+from pyuploadcare.transformations.image import ImageTransformation
+from pyuploadcare.transformations.video import VideoTransformation
+
+
+CDN_PATH_REGEX = re.compile(
+    f"""
+    (?P<uuid>{RE_UUID})
+    (?:/(?P<kind>video|document)(?=/|$))?
+    (?P<rest>/.*)?
+$""",
+    re.VERBOSE,
+)
+
+TRANSFORMATION_CLASSES: Dict[Optional[str], Type[BaseTransformation]] = {
+    None: ImageTransformation,
+    "video": VideoTransformation,
+    "document": DocumentTransformation,
+}
+
+# operations which are written without "-/" prefix in paths
+UNPREFIXED_OPERATIONS_REGEX = re.compile(
+    "/(?:(gif2video|detect_faces)(?=/|$)|(thumbs)~)"
+)
+
+# image operations which set up output regardless of their position,
+# in canonical order
+IMAGE_OUTPUT_OPERATIONS = ("format", "quality", "progressive", "strip_meta")
+
+
+@dataclasses.dataclass
+class ParsedCdnUrl:
+    """Result of ``parse_cdn_url``.
+
+    - ``uuid`` -- file UUID;
+    - ``transformation`` -- ``ImageTransformation``,
+      ``VideoTransformation`` or ``DocumentTransformation``;
+    - ``filename`` -- file name at the end of url, may be empty.
+
+    """
+
+    uuid: str
+    transformation: BaseTransformation
+    filename: str = ""
+
+
+def _normalize_path_effects(effects: str) -> str:
+    """Restores "-/" prefixes which are omitted in paths."""
+    return UNPREFIXED_OPERATIONS_REGEX.sub(
+        lambda match: (
+            f"/-/{match.group(1)}" if match.group(1) else "/-/thumbs/"
+        ),
+        "/" + effects,
+    )
+
+
+def parse_effects(
+    effects: Union[str, BaseTransformation],
+    transformation_class: Type[BaseTransformation] = ImageTransformation,
+) -> BaseTransformation:
+    """Parses effects like ``-/resize/200x/-/format/webp/``
+    into transformation of given class."""
+    transformation = transformation_class()
+    for name, parameters in split_effects(
+        _normalize_path_effects(str(effects))
+    ):
+        transformation.set(name.lower(), parameters)
+    return transformation
+
+
+def parse_cdn_url(cdn_url: str) -> ParsedCdnUrl:
+    """Parses CDN url or path into UUID, transformation and filename.
+
+    Query string and fragment of url are ignored.
+
+    Raises ``InvalidParamError`` if url doesn't contain file UUID.
+    """
+    path = cdn_url.split("?", 1)[0].split("#", 1)[0]
+    match = None
+    for candidate in re.finditer(RE_UUID, path):
+        match = CDN_PATH_REGEX.match(path, candidate.start())
+        if match:
+            break
+    if not match:
+        raise InvalidParamError("Couldn't find UUID")
+
+    rest = match.group("rest") or "/"
+    effects, _, filename = rest.rpartition("/")
+    transformation = parse_effects(
+        effects, TRANSFORMATION_CLASSES[match.group("kind")]
+    )
+    return ParsedCdnUrl(match.group("uuid"), transformation, filename)
+
+
+def canonical_transformation(
+    transformation: BaseTransformation,
+) -> BaseTransformation:
+    """Returns equivalent transformation in canonical form.
+
+    Operation names are lowercased, empty operations are dropped.
+    Only the last one of repeated image output operations (format, quality,
+    progressive and strip_meta) is kept, they are moved to the end
+    in fixed order. Image output operations are left in place after
+    ``gif2video``, since they set up the video then.
+    """
+    operations = parse_effects(transformation, type(transformation)).operations
+
+    canonical = type(transformation)()
+    output: Dict[str, List[str]] = {}
+    reorder = isinstance(transformation, ImageTransformation) and not any(
+        name == "gif2video" for name, _ in operations
+    )
+    for name, parameters in operations:
+        if reorder and name in IMAGE_OUTPUT_OPERATIONS:
+            output[name] = parameters
+        else:
+            canonical.set(name, parameters)
+
+    for name in IMAGE_OUTPUT_OPERATIONS:
+        if name in output:
+            canonical.set(name, output[name])
+    return canonical
+
+
+def canonical_cdn_path(cdn_url: Union[str, ParsedCdnUrl]) -> str:
+    """Returns canonical CDN path of url, e.g. to use as a cache key.
+
+    Urls which differ only in order of output operations, repeated
+    output operations, letter case of operation names or slashes
+    have the same canonical path.
+    """
+    parsed = (
+        cdn_url
+        if isinstance(cdn_url, ParsedCdnUrl)
+        else parse_cdn_url(cdn_url)
+    )
+    transformation = canonical_transformation(parsed.transformation)
+    return transformation.path(parsed.uuid) + parsed.filename
@@ -0,0 +1,189 @@
+import dataclasses
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+from uuid import UUID
+
+from pyuploadcare.transformations.base import Slot
+from pyuploadcare.transformations.image import (
+    ImageFormat,
+    ImageQuality,
+    ImageTransformation,
+)
+
+
+if TYPE_CHECKING:
+    from pyuploadcare.client import Uploadcare
+    from pyuploadcare.resources.file import File
+
+
+@dataclasses.dataclass(frozen=True)
+class Variant:
+    """Single variant of image.
+
+    - ``format`` -- image format;
+    - ``width`` -- width of image in pixels;
+    - ``descriptor`` -- ``srcset`` descriptor, e.g. ``400w`` or ``2x``;
+    - ``effects`` -- effects of CDN url.
+
+    """
+
+    format: str
+    width: int
+    descriptor: str
+    effects: str
+
+
+class VariantSet:
+    """Responsive variants of images in several widths and formats.
+
+    Effects of all variants are compiled once, urls of many files
+    are built by string formatting::
+
+        >>> variants = VariantSet(
+        ...     uploadcare,
+        ...     widths=[320, 640],
+        ...     formats=[ImageFormat.webp, ImageFormat.jpeg],
+        ... )
+        >>> variants.srcset('a771f854-c2cb-408a-8c36-71af77811f3b')
+        'https://ucarecdn.com/a771f854-.../-/resize/320x/-/format/webp/ 320w, https://...'
+
+    With a single width ``densities`` produce ``x`` descriptors,
+    e.g. ``densities=[1, 2]`` gives ``1x`` and ``2x`` variants,
+    otherwise each density multiplies widths and ``w`` descriptors are used.
+
+    Args:
+        - client: Uploadcare client.
+        - widths: breakpoint widths in CSS pixels.
+        - formats: image formats, the first one is the default.
+        - densities: pixel density multipliers.
+        - transformation: transformation applied before resize.
+        - quality: image quality.
+
+    """
+
+    def __init__(  # noqa: C901
+        self,
+        client: "Uploadcare",
+        widths: Sequence[int],
+        formats: Sequence[Union[str, ImageFormat]] = (ImageFormat.auto,),
+        densities: Sequence[float] = (1,),
+        transformation: Optional[Union[str, ImageTransformation]] = None,
+        quality: Optional[ImageQuality] = None,
+    ):
+        if not widths or not formats or not densities:
+            raise ValueError("widths, formats and densities must be set")
+        if min(widths) < 1 or min(densities) <= 0:
+            raise ValueError("widths and densities must be positive numbers")
+
+        self._client = client
+        self.formats = [str(image_format) for image_format in formats]
+
+        pixel_densities = len(widths) == 1
+        self.variants: Dict[str, List[Variant]] = {}
+        for image_format in self.formats:
+            template = ImageTransformation(transformation).resize(
+                Slot("width")  # type: ignore
+            )
+            template.format(image_format)  # type: ignore
+            if quality:
+                template.quality(quality)
+            frozen = template.freeze()
+
+            variants: Dict[int, Variant] = {}
+            for density in densities:
+                for width in widths:
+                    pixel_width = round(width * density)
+                    descriptor = (
+                        f"{density:g}x"
+                        if pixel_densities
+                        else f"{pixel_width}w"
+                    )
+                    variants.setdefault(
+                        pixel_width,
+                        Variant(
+                            image_format,
+                            pixel_width,
+                            descriptor,
+                            frozen.render(width=pixel_width),
+                        ),
+                    )
+            self.variants[image_format] = [
+                variants[pixel_width] for pixel_width in sorted(variants)
+            ]
+
+    def urls(
+        self,
+        files: Iterable[Union[str, UUID, "File"]],
+        secure: bool = False,
+        wildcard: bool = False,
+        per_file_token: bool = False,
+    ) -> Dict[str, Dict[Variant, str]]:
+        """Returns CDN urls of all variants by file UUID.
+
+        See ``Uploadcare.cdn_urls`` for ``secure``, ``wildcard``
+        and ``per_file_token``.
+        """
+        uuids = self._client._extract_uuids(files)
+        urls: Dict[str, Dict[Variant, str]] = {uuid: {} for uuid in uuids}
+        for variants in self.variants.values():
+            for variant in variants:
+                variant_urls = self._client.cdn_urls(
+                    uuids,
+                    variant.effects,
+                    secure=secure,
+                    wildcard=wildcard,
+                    per_file_token=per_file_token,
+                )
+                for uuid, url in zip(uuids, variant_urls):
+                    urls[uuid][variant] = url
+        return urls
+
+    def srcsets(
+        self,
+        files: Iterable[Union[str, UUID, "File"]],
+        secure: bool = False,
+        wildcard: bool = False,
+        per_file_token: bool = False,
+    ) -> Dict[str, Dict[str, str]]:
+        """Returns ``srcset`` strings by file UUID and format."""
+        return {
+            uuid: {
+                image_format: ", ".join(
+                    f"{variant_urls[variant]} {variant.descriptor}"
+                    for variant in variants
+                )
+                for image_format, variants in self.variants.items()
+            }
+            for uuid, variant_urls in self.urls(
+                files,
+                secure=secure,
+                wildcard=wildcard,
+                per_file_token=per_file_token,
+            ).items()
+        }
+
+    def srcset(
+        self,
+        file: Union[str, UUID, "File"],
+        image_format: Optional[Union[str, ImageFormat]] = None,
+        secure: bool = False,
+        wildcard: bool = False,
+        per_file_token: bool = False,
+    ) -> str:
+        """Returns ``srcset`` string of single file,
+        in the first format by default."""
+        srcsets = self.srcsets(
+            [file],
+            secure=secure,
+            wildcard=wildcard,
+            per_file_token=per_file_token,
+        )
+        (by_format,) = srcsets.values()
+        return by_format[str(image_format or self.formats[0])]
@@ -56,6 +56,21 @@ def _check_upload_args(arg_namespace, client: Uploadcare):
     return True
 
 
+def _parse_metadata(items):
+    """Parses KEY=VALUE items into metadata dict."""
+    if not items:
+        return None
+
+    metadata = {}
+    for item in items:
+        if "=" not in item:
+            print(f"Invalid metadata format: {item}. Expected KEY=VALUE.")
+            continue
+        key, value = item.split("=", 1)
+        metadata[key] = value
+    return metadata
+
+
 def _handle_uploaded_file(file_, arg_namespace):
     if arg_namespace.store:
         file_.store()
@@ -96,12 +111,16 @@ def promt(text, default="y"):
     return (input("{0} [y/n]: ".format(text)) or default) == "y"
 
 
-def bar(iter_content, parts, title=""):
-    """Iterates over the "iter_content" and draws a progress bar to stdout."""
+def bar(iter_content, parts, title="", interval=0.0):
+    """Iterates over the "iter_content" and draws a progress bar to stdout.
+
+    The bar is redrawn at most once per ``interval`` seconds.
+    """
     parts = max(float(parts), 1.0)
     cells = 10
     progress = 0
     step = cells / parts
+    drawn_at = 0.0
 
     draw = lambda progress: sys.stdout.write(  # noqa: E731
         "\r[{0:10}] {1:.2f}% {2}".format(
@@ -113,7 +132,12 @@ def bar(iter_content, parts, title=""):
         yield chunk
 
         progress += step
-        draw(progress)
+        if interval:
+            now = time.monotonic()
+            if now - drawn_at < interval:
+                continue
+            drawn_at = now
+        draw(min(progress, cells))
         sys.stdout.flush()
 
     draw(cells)
@@ -0,0 +1,95 @@
+from pyuploadcare.client import Uploadcare
+from pyuploadcare.mirror import FileMirror
+from pyuploadcare.ucare_cli.commands.helpers import (
+    bool_or_none,
+    int_or_none,
+    pprint,
+)
+
+
+def register_arguments(subparsers):
+    subparser = subparsers.add_parser(
+        "mirror", help="refresh and query local SQLite mirror of files"
+    )
+    subparser.set_defaults(func=mirror)
+    subparser.add_argument("database", help="path to SQLite database")
+    subparser.add_argument(
+        "--full",
+        action="store_true",
+        help="list all files again to track removals of stored files",
+    )
+    subparser.add_argument(
+        "--norefresh",
+        action="store_false",
+        dest="refresh",
+        help="query the mirror without refreshing",
+    )
+    subparser.add_argument(
+        "--stored",
+        help="filter stored files",
+        choices=[True, False, None],
+        type=bool_or_none,
+        default=None,
+    )
+    subparser.add_argument(
+        "--removed",
+        help="filter removed files",
+        choices=[True, False, None],
+        type=bool_or_none,
+        default=False,
+    )
+    subparser.add_argument(
+        "--is_image",
+        help="filter images",
+        choices=[True, False, None],
+        type=bool_or_none,
+        default=None,
+    )
+    subparser.add_argument(
+        "--mime_type", help="mime type or its prefix like image/"
+    )
+    subparser.add_argument(
+        "--min_size", help="minimum size in bytes", type=int_or_none
+    )
+    subparser.add_argument(
+        "--max_size", help="maximum size in bytes", type=int_or_none
+    )
+    subparser.add_argument(
+        "--uploaded_after", help="minimum upload datetime, UTC"
+    )
+    subparser.add_argument(
+        "--uploaded_before", help="maximum upload datetime, UTC"
+    )
+    subparser.add_argument(
+        "--list",
+        action="store_true",
+        help="show matching files instead of their count",
+    )
+    return subparser
+
+
+def mirror(arg_namespace, client: Uploadcare):
+    filters = {
+        "stored": arg_namespace.stored,
+        "removed": arg_namespace.removed,
+        "is_image": arg_namespace.is_image,
+        "mime_type": arg_namespace.mime_type,
+        "min_size": arg_namespace.min_size,
+        "max_size": arg_namespace.max_size,
+        "uploaded_after": arg_namespace.uploaded_after,
+        "uploaded_before": arg_namespace.uploaded_before,
+    }
+
+    with FileMirror(client, arg_namespace.database) as file_mirror:
+        if arg_namespace.refresh:
+            file_mirror.refresh(full=arg_namespace.full)
+
+        if arg_namespace.list:
+            pprint(list(file_mirror.query(**filters)))
+        else:
+            pprint(
+                {
+                    "count": file_mirror.count(**filters),
+                    "total_size": file_mirror.total_size(**filters),
+                }
+            )
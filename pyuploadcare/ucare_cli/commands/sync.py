@@ -1,26 +1,33 @@
-import hashlib
 import os
-import pickle
 import re
 import socket
+import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
 
 from dateutil import parser
 from httpx import HTTPError
 
-from pyuploadcare import FileList, conf
+from pyuploadcare import File, conf
 from pyuploadcare.api.client import Client
 from pyuploadcare.client import Uploadcare
+from pyuploadcare.helpers import iterate_over_batches
 from pyuploadcare.ucare_cli.commands.helpers import (
     bar,
     bool_or_none,
     int_or_none,
     pprint,
-    promt,
 )
 
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# seconds between redraws of progress bar
+PROGRESS_INTERVAL = 0.2
+
+
 def register_arguments(subparsers):
     subparser = subparsers.add_parser("sync", help="sync files")
     subparser.set_defaults(func=sync_files)
@@ -89,9 +96,34 @@ def register_arguments(subparsers):
             "Example: --effects=resize/200x/-/rotate/90/"
         ),
     )
+    subparser.add_argument(
+        "--workers",
+        help="number of simultaneous downloads",
+        default=4,
+        type=int,
+    )
+    subparser.add_argument(
+        "--manifest",
+        help=(
+            "path to SQLite database of synced files. "
+            "Synced files which exist locally are skipped on the next run"
+        ),
+    )
+    subparser.add_argument(
+        "--checkpoint",
+        help="files synced between saves of the manifest",
+        default=100,
+        type=int,
+    )
+    subparser.add_argument(
+        "--chunk_size",
+        help="size of chunks written to disk in bytes",
+        default=DEFAULT_CHUNK_SIZE,
+        type=int,
+    )
     subparser.add_argument(
         "--no-input",
-        help="do not ask for user input",
+        help="do not ask for user input, kept for compatibility",
         default=False,
         action="store_true",
     )
@@ -106,50 +138,119 @@ def sync_files(arg_namespace, client: Uploadcare):  # noqa: C901
                 arg_namespace.starting_point
             )
 
-    kwargs = dict(uuids=arg_namespace.uuids or None)
-    if kwargs["uuids"] is None:
-        kwargs.update(
-            dict(
-                starting_point=arg_namespace.starting_point,
-                ordering=arg_namespace.ordering,
-                limit=arg_namespace.limit,
-                stored=arg_namespace.stored,
-                removed=arg_namespace.removed,
-                request_limit=arg_namespace.request_limit,
+    manifest = (
+        SQLiteSyncManifest(arg_namespace.manifest)
+        if arg_namespace.manifest
+        else SyncManifest()
+    )
+
+    files: Iterable[File]
+    if arg_namespace.uuids:
+        # information of synced files is taken from the manifest,
+        # so they are skipped without requests
+        files = (
+            client.file(
+                uuid,
+                file_info=(
+                    None if arg_namespace.replace else manifest.file_info(uuid)
+                ),
             )
+            for uuid in arg_namespace.uuids
+        )
+    else:
+        files = client.list_files(
+            starting_point=arg_namespace.starting_point,
+            ordering=arg_namespace.ordering,
+            limit=arg_namespace.limit,
+            stored=arg_namespace.stored,
+            removed=arg_namespace.removed,
+            request_limit=arg_namespace.request_limit,
         )
 
-    with SyncSession(
-        TrackedFileList(client=client, **kwargs),
-        no_input=arg_namespace.no_input,
-    ) as files:
-        for f in files:
-            if f.is_image and arg_namespace.effects:
-                f.default_effects = arg_namespace.effects.lstrip("-/")
-
-            local_filepath = build_filepath(arg_namespace.path, f)
-            dirname = os.path.dirname(local_filepath)
-
-            if dirname and not os.path.exists(dirname):
-                os.makedirs(dirname)
-
-            if os.path.exists(local_filepath) and not arg_namespace.replace:
-                pprint(
-                    "File `{0}` already exists. "
-                    "To override it use `--replace` option".format(
-                        local_filepath
-                    )
-                )
-                continue
-
-            url = f.cdn_url
-            _download_file(url, local_filepath, file_size=f.size)
+    def download(item):
+        f, local_filepath = item
+        return _download_file(
+            f.cdn_url,
+            local_filepath,
+            file_size=f.size,
+            client=client.cdn_client,
+            chunk_size=arg_namespace.chunk_size,
+            # progress bars of simultaneous downloads would garble output
+            progress=arg_namespace.workers == 1,
+        )
 
+    with manifest, ThreadPoolExecutor(arg_namespace.workers) as executor:
+        for batch in iterate_over_batches(files, arg_namespace.checkpoint):
+            originals: Dict[str, Tuple[File, str]] = {}
+            transformed = []
+            for f in client.prefetch_info(
+                batch, concurrency=arg_namespace.workers
+            ):
+                if f.is_image and arg_namespace.effects:
+                    f.default_effects = arg_namespace.effects.lstrip("-/")
+
+                local_filepath = build_filepath(arg_namespace.path, f)
+                if not arg_namespace.replace and manifest.is_synced(
+                    f, local_filepath
+                ):
+                    continue
+
+                if os.path.exists(local_filepath):
+                    if not arg_namespace.replace:
+                        pprint(
+                            "File `{0}` already exists. "
+                            "To override it use `--replace` option".format(
+                                local_filepath
+                            )
+                        )
+                        continue
+                    os.remove(local_filepath)
+
+                if f.default_effects:
+                    transformed.append((f, local_filepath))
+                else:
+                    originals[f.uuid] = (f, local_filepath)
+
+            if originals:
+                result = client.download(
+                    [f for f, _ in originals.values()],
+                    dest=lambda f: originals[f.uuid][1],
+                    concurrency=arg_namespace.workers,
+                    chunk_size=arg_namespace.chunk_size,
+                    raise_errors=False,
+                )
+                for uuid, error in result.problems.items():
+                    pprint("Can't download {0}: {1}".format(uuid, error))
+                for uuid, local_filepath in result.files.items():
+                    manifest.add(originals[uuid][0], local_filepath)
+
+            for (f, local_filepath), synced in zip(
+                transformed, executor.map(download, transformed)
+            ):
+                if synced:
+                    manifest.add(f, local_filepath)
+
+            manifest.checkpoint()
+
+
+def _download_file(  # noqa: C901
+    url: str,
+    local_filepath: str,
+    file_size: int,
+    max_retry=3,
+    client: Optional[Client] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: bool = True,
+) -> bool:
+    """Downloads url to local file, returns ``True`` on success."""
+    if client is None:
+        client = Client(
+            verify=conf.verify_api_ssl, timeout=get_timeout(conf.timeout)
+        )
 
-def _download_file(url: str, local_filepath: str, file_size: int, max_retry=3):
-    client = Client(
-        verify=conf.verify_api_ssl, timeout=get_timeout(conf.timeout)
-    )
+    dirname = os.path.dirname(local_filepath)
+    if dirname:
+        os.makedirs(dirname, exist_ok=True)
 
     for i in range(max_retry):
         try:
@@ -157,12 +258,14 @@ def _download_file(url: str, local_filepath: str, file_size: int, max_retry=3):
                 if response is None:
                     pprint("Can't fetch URL: {0}".format(url))
                     pprint("Skip it.")
-                    return
+                    return False
 
                 save_file_locally(
                     fname=local_filepath,
                     response=response,
                     size=file_size,
+                    chunk_size=chunk_size,
+                    progress=progress,
                 )
 
         except HTTPError as e:
@@ -171,18 +274,45 @@ def _download_file(url: str, local_filepath: str, file_size: int, max_retry=3):
             time.sleep(i**2)
             continue
         else:
-            break
-
-
-def save_file_locally(fname, response, size):
-    chunk_size = 1024
-    with open(fname, "wb") as lf:
-        for chunk in bar(
-            response.iter_bytes(chunk_size),
-            ceil(size / float(chunk_size)),
-            fname,
-        ):
-            lf.write(chunk)
+            return True
+    return False
+
+
+def _preallocate(fileobj, size: int) -> None:
+    try:
+        os.posix_fallocate(fileobj.fileno(), 0, size)
+    except (AttributeError, OSError):
+        # not supported by platform or file system
+        pass
+
+
+def save_file_locally(  # noqa: C901
+    fname, response, size, chunk_size=DEFAULT_CHUNK_SIZE, progress=True
+):
+    """Saves response content to temporary file, which is renamed
+    to ``fname`` when it's complete."""
+    temporary_fname = "{0}.tmp".format(fname)
+    try:
+        with open(temporary_fname, "wb") as lf:
+            if size:
+                _preallocate(lf, size)
+            chunks = response.iter_bytes(chunk_size)
+            if progress:
+                chunks = bar(
+                    chunks,
+                    ceil((size or 0) / float(chunk_size)),
+                    fname,
+                    interval=PROGRESS_INTERVAL,
+                )
+            for chunk in chunks:
+                lf.write(chunk)
+            # size of transformed image differs from the original one
+            lf.truncate()
+        os.replace(temporary_fname, fname)
+    except BaseException:
+        if os.path.exists(temporary_fname):
+            os.remove(temporary_fname)
+        raise
 
 
 PATTERNS_REGEX = re.compile(r"(\${\w+})")
@@ -209,79 +339,122 @@ def build_filepath(path, file_):
     return os.path.normpath(PATTERNS_REGEX.sub(_replace, path))
 
 
-class SyncSession:
-    """Provides an ability to save current state of iteration if any errors
-    happened during iteration. After that is possible to restore this state
-    and continue from that point.
+class SyncedFile(NamedTuple):
+    path: str
+    size: Optional[int]
+    effects: str
+    filename: Optional[str]
+    is_image: Optional[bool]
+
+
+class SyncManifest:
+    """Synced files kept in memory.
+
+    A file is synced if it was saved to the same local path
+    with the same size and effects, and the local file still exists.
+    Information of original files doesn't change, so the manifest
+    keeps what is needed to build local paths without requests.
     """
 
-    def __init__(self, file_list, no_input=False):
-        parts = str(file_list.__dict__)
-        self.session = file_list
-        self.no_input = no_input
-        self.signature = hashlib.md5(parts.encode("utf-8")).hexdigest()
-        self.session_filepath = os.path.join(
-            os.path.expanduser("~"), ".{0}.sync".format(self.signature)
+    def __init__(self):
+        self._files: Dict[str, SyncedFile] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def _entry(file_: File, local_filepath: str) -> SyncedFile:
+        return SyncedFile(
+            local_filepath,
+            file_.size,
+            file_.default_effects or "",
+            file_.filename,
+            file_.is_image,
         )
 
-        # If the serialized session is exists load it and set as current
-        if os.path.exists(self.session_filepath):
-            if not self.no_input and promt("Continue last sync?"):
-                with open(self.session_filepath, "rb") as f:
-                    client = self.session._client
-                    self.session = pickle.load(f)
-                    self.session._client = client
-                    return
+    def _get(self, uuid: str) -> Optional[SyncedFile]:
+        return self._files.get(uuid)
 
-    def __enter__(self):
-        return self.session
-
-    def __exit__(self, *args):
-        if all(args):
-            with open(self.session_filepath, "wb") as f:
-                client = self.session._client
-                self.session._client = None
-                pickle.dump(self.session, f)
-                self.session._client = client
-            return False
-
-        # Iteration is complete without errors.
-        # Let's delete serialized session if exists.
-        if os.path.exists(self.session_filepath):
-            try:
-                os.remove(self.session_filepath)
-            except OSError:
-                pass
-
-        return True
-
-
-class TrackedFileList(FileList):
-    """Transparently iterate over provided list of UUIDs and all list
-    of files of the user. Saves current state of iteration.
+    def is_synced(self, file_: File, local_filepath: str) -> bool:
+        synced = self._get(file_.uuid)
+        return (
+            synced is not None
+            and synced[:3] == self._entry(file_, local_filepath)[:3]
+            and os.path.exists(local_filepath)
+        )
+
+    def file_info(self, uuid: str) -> Optional[Dict[str, Any]]:
+        """Returns information of synced file kept in the manifest."""
+        synced = self._get(uuid)
+        if synced is None:
+            return None
+        return {
+            "uuid": uuid,
+            "size": synced.size,
+            "original_filename": synced.filename,
+            "is_image": synced.is_image,
+        }
+
+    def add(self, file_: File, local_filepath: str) -> None:
+        self._files[file_.uuid] = self._entry(file_, local_filepath)
+
+    def checkpoint(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.checkpoint()
+
+
+class SQLiteSyncManifest(SyncManifest):
+    """Synced files kept in SQLite database.
+
+    New entries are kept in memory and written by ``checkpoint``,
+    so the manifest survives interruptions of long syncs.
     """
 
-    def __init__(self, *args, **kwargs):
-        self.uuids = kwargs.pop("uuids", None)
-        self.handled_uuids = []
-        self.last_page_url = None
-        super(TrackedFileList, self).__init__(*args, **kwargs)
+    def __init__(self, path: str):
+        super().__init__()
+        self.connection = sqlite3.connect(path)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS synced ("
+                "uuid TEXT PRIMARY KEY, path TEXT, size INTEGER, "
+                "effects TEXT, filename TEXT, is_image INTEGER)"
+            )
 
-    def __iter__(self):
-        if self.uuids:
-            yield from self.iter_uuids()
-        else:
-            for file in super().__iter__():
-                if file.uuid not in self.handled_uuids:
-                    yield file
-                    self.handled_uuids.append(file.uuid)
-
-    def iter_uuids(self):
-        for uuid in self.uuids:
-            if uuid in self.handled_uuids:
-                continue
-            yield self._client.file(uuid)
-            self.handled_uuids.append(uuid)
+    def _get(self, uuid: str) -> Optional[SyncedFile]:
+        synced = super()._get(uuid)
+        if synced is None:
+            row = self.connection.execute(
+                "SELECT path, size, effects, filename, is_image "
+                "FROM synced WHERE uuid = ?",
+                (uuid,),
+            ).fetchone()
+            if row is not None:
+                path, size, effects, filename, is_image = row
+                synced = SyncedFile(
+                    path,
+                    size,
+                    effects,
+                    filename,
+                    None if is_image is None else bool(is_image),
+                )
+        return synced
+
+    def checkpoint(self) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO synced VALUES (?, ?, ?, ?, ?, ?)",
+                ((uuid, *synced) for uuid, synced in self._files.items()),
+            )
+        self._files.clear()
+
+    def close(self) -> None:
+        super().close()
+        self.connection.close()
 
 
 def get_timeout(timeout):
@@ -2,6 +2,7 @@ from pyuploadcare.client import Uploadcare
 from pyuploadcare.ucare_cli.commands.helpers import (
     _check_upload_args,
     _handle_uploaded_file,
+    _parse_metadata,
 )
 
 
@@ -53,15 +54,7 @@ def upload(arg_namespace, client: Uploadcare):
     if not _check_upload_args(arg_namespace, client):
         return
 
-    metadata = None
-    if getattr(arg_namespace, "metadata", None):
-        metadata = {}
-        for item in arg_namespace.metadata:
-            if "=" not in item:
-                print(f"Invalid metadata format: {item}. Expected KEY=VALUE.")
-                continue
-            key, value = item.split("=", 1)
-            metadata[key] = value
+    metadata = _parse_metadata(getattr(arg_namespace, "metadata", None))
 
     with open(arg_namespace.filename, "rb") as fh:
         file_ = client.upload(fh, metadata=metadata)
@@ -0,0 +1,156 @@
+import json
+import os
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from fnmatch import fnmatch
+from typing import Dict, Iterator, Set
+
+from pyuploadcare.client import Uploadcare
+from pyuploadcare.ucare_cli.commands.helpers import _parse_metadata, pprint
+
+
+DEFAULT_LOG = "ucare_upload.jsonl"
+
+
+def register_arguments(subparsers):
+    subparser = subparsers.add_parser(
+        "upload-dir", help="upload files of directory concurrently"
+    )
+    subparser.set_defaults(func=upload_dir)
+    subparser.add_argument("path", help="directory to upload")
+    subparser.add_argument(
+        "--workers",
+        help="number of simultaneous uploads",
+        default=4,
+        type=int,
+    )
+    subparser.add_argument(
+        "--pattern",
+        help="upload only files with matching names, e.g. '*.jpg'",
+        default="*",
+    )
+    group = subparser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--store",
+        action="store_true",
+        default=None,
+        dest="store",
+        help="Store uploaded files",
+    )
+    group.add_argument(
+        "--nostore",
+        action="store_false",
+        dest="store",
+        help="Do not store uploaded files",
+    )
+    subparser.add_argument(
+        "--metadata",
+        nargs="*",
+        metavar="KEY=VALUE",
+        help="Attach metadata to the uploaded files as key=value pairs.",
+    )
+    subparser.add_argument(
+        "--log",
+        help=(
+            "JSON lines log of uploads. Files logged as uploaded "
+            "are skipped on the next run. Default is {0}".format(DEFAULT_LOG)
+        ),
+        default=DEFAULT_LOG,
+    )
+    return subparser
+
+
+def _read_uploaded(log_path: str) -> Set[str]:  # noqa: C901
+    uploaded: Set[str] = set()
+    if not os.path.exists(log_path):
+        return uploaded
+
+    with open(log_path) as log:
+        for line in log:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # line of interrupted run
+                continue
+            if entry.get("uuid"):
+                uploaded.add(os.path.abspath(entry["path"]))
+    return uploaded
+
+
+def _iter_paths(root: str, pattern: str, exclude: str) -> Iterator[str]:
+    """Yields absolute paths of matching files, so logs of runs
+    from other directories match."""
+    for dirpath, dirnames, filenames in os.walk(os.path.abspath(root)):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if fnmatch(filename, pattern) and path != exclude:
+                yield path
+
+
+def upload_dir(arg_namespace, client: Uploadcare):  # noqa: C901
+    if arg_namespace.workers < 1:
+        pprint("Number of workers must be positive")
+        return
+
+    metadata = _parse_metadata(arg_namespace.metadata)
+    uploaded = _read_uploaded(arg_namespace.log)
+    summary = {"uploaded": 0, "failed": 0, "skipped": 0}
+
+    def iter_paths() -> Iterator[str]:
+        for path in _iter_paths(
+            arg_namespace.path,
+            arg_namespace.pattern,
+            os.path.abspath(arg_namespace.log),
+        ):
+            if path in uploaded:
+                summary["skipped"] += 1
+            else:
+                yield path
+
+    paths = iter_paths()
+
+    def upload(path: str):
+        with open(path, "rb") as fh:
+            return client.upload(
+                fh, store=arg_namespace.store, metadata=metadata
+            )
+
+    inflight: Dict[Future, str] = {}
+
+    with open(arg_namespace.log, "a") as log, ThreadPoolExecutor(
+        max_workers=arg_namespace.workers
+    ) as executor:
+        while True:
+            while len(inflight) < arg_namespace.workers:
+                path = next(paths, None)
+                if path is None:
+                    break
+                inflight[executor.submit(upload, path)] = path
+
+            if not inflight:
+                break
+
+            done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = inflight.pop(future)
+                try:
+                    file_ = future.result()
+                except Exception as exc:
+                    entry = {"path": path, "error": str(exc)}
+                    summary["failed"] += 1
+                else:
+                    entry = {
+                        "path": path,
+                        "uuid": file_.uuid,
+                        "cdn_url": file_.cdn_url,
+                    }
+                    summary["uploaded"] += 1
+                log.write(json.dumps(entry) + "\n")
+                log.flush()
+
+    pprint(summary)
@@ -21,10 +21,12 @@ from pyuploadcare.ucare_cli.commands import (
     list_files,
     list_groups,
     list_webhooks,
+    mirror,
     store_files,
     sync,
     update_webhook,
     upload,
+    upload_dir,
     upload_from_url,
 )
 from pyuploadcare.ucare_cli.commands.helpers import pprint
@@ -49,7 +51,9 @@ def ucare_argparser():
     delete_files.register_arguments(subparsers)
     upload_from_url.register_arguments(subparsers)
     upload.register_arguments(subparsers)
+    upload_dir.register_arguments(subparsers)
     sync.register_arguments(subparsers)
+    mirror.register_arguments(subparsers)
     create_group.register_arguments(subparsers)
     convert_video.register_arguments(subparsers)
     get_project.register_arguments(subparsers)
@@ -0,0 +1,320 @@
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from pyuploadcare.api.addon_entities import (
+    AddonClamAVExecutionParams,
+    AddonLabels,
+)
+from pyuploadcare.api.entities import FileInfo, UCClamAVApplicationData
+from pyuploadcare.api.responses import (
+    AddonExecuteResponse,
+    AddonResponse,
+    BatchFileOperationResponse,
+    DocumentConvertResponse,
+    VideoConvertResponse,
+)
+from pyuploadcare.exceptions import (
+    APIError,
+    InvalidRequestError,
+    JobFailedError,
+    ThrottledRequestError,
+)
+from pyuploadcare.polling import FixedInterval
+from pyuploadcare.transformations.document import (
+    DocumentFormat,
+    DocumentTransformation,
+)
+from pyuploadcare.transformations.video import VideoFormat, VideoTransformation
+
+
+UUIDS = [
+    "11111111-1111-1111-1111-111111111111",
+    "22222222-2222-2222-2222-222222222222",
+    "33333333-3333-3333-3333-333333333333",
+]
+
+
+def _converted_uuid(uuid):
+    return "c" + uuid[1:]
+
+
+def _fake_video_convert(paths, store=None):
+    *converted, failed = paths
+    return VideoConvertResponse.model_validate(
+        {
+            "problems": {failed: "Bad path"},
+            "result": [
+                {
+                    "original_source": path,
+                    "uuid": _converted_uuid(path[:36]),
+                    "token": index,
+                    "thumbnails_group_uuid": f"{path[:36]}~2",
+                }
+                for index, path in reversed(list(enumerate(converted)))
+            ],
+        }
+    )
+
+
+def test_convert_files_video(uploadcare):
+    transformation = VideoTransformation().format(VideoFormat.webm).thumbs(2)
+
+    with patch.object(
+        uploadcare.video_convert_api,
+        "convert",
+        side_effect=_fake_video_convert,
+    ) as convert_mock:
+        result = uploadcare.convert_files(
+            [uploadcare.file(UUIDS[0]), *UUIDS[1:]], transformation
+        )
+
+    assert convert_mock.call_count == 1
+    assert convert_mock.call_args[0][0] == [
+        transformation.path(uuid) for uuid in UUIDS
+    ]
+    assert list(result.files) == UUIDS[:2]
+    for uuid, converted_file in result.files.items():
+        assert converted_file.uuid == _converted_uuid(uuid)
+        assert converted_file.thumbnails_group_uuid == f"{uuid}~2"
+    assert result.problems == {UUIDS[2]: "Bad path"}
+
+
+def test_convert_files_document_chunks(uploadcare):
+    transformation = DocumentTransformation().format(DocumentFormat.pdf)
+
+    def fake_convert(paths, store=None, save_in_group=False):
+        return DocumentConvertResponse.model_validate(
+            {
+                "problems": {},
+                "result": [
+                    {
+                        "original_source": path,
+                        "uuid": _converted_uuid(path[:36]),
+                        "token": 1,
+                    }
+                    for path in paths
+                ],
+            }
+        )
+
+    with patch.object(
+        uploadcare.document_convert_api,
+        "convert",
+        side_effect=fake_convert,
+    ) as convert_mock:
+        result = uploadcare.convert_files(
+            UUIDS, transformation, save_in_group=True, chunk_size=2
+        )
+
+    assert convert_mock.call_count == 2
+    assert convert_mock.call_args.kwargs["save_in_group"] is True
+    assert [file.uuid for file in result.files.values()] == [
+        _converted_uuid(uuid) for uuid in UUIDS
+    ]
+    assert not result.problems
+
+
+def test_convert_files_video_in_group(uploadcare):
+    with pytest.raises(ValueError):
+        uploadcare.convert_files(
+            UUIDS, VideoTransformation(), save_in_group=True
+        )
+
+
+def test_execute_addon_bulk(uploadcare):
+    request_ids = {
+        UUIDS[0]: "c3446e41-9eb0-4301-aeb4-356d0fdcf9a0",
+        UUIDS[1]: "c3446e41-9eb0-4301-aeb4-356d0fdcf9a1",
+    }
+    statuses = {
+        request_ids[UUIDS[0]]: iter(["in_progress", "done"]),
+        request_ids[UUIDS[1]]: iter(["error"]),
+    }
+
+    def fake_execute(file_uuid, addon_name, params=None):
+        if file_uuid == UUIDS[2]:
+            raise InvalidRequestError("File is not an image")
+        return AddonExecuteResponse(request_id=request_ids[file_uuid])
+
+    def fake_status(request_id, addon_name):
+        return AddonResponse(status=next(statuses[str(request_id)]))
+
+    def fake_retrieve(file_uuid, include_appdata=False):
+        assert include_appdata
+        return FileInfo.model_validate(
+            {
+                "uuid": file_uuid,
+                "appdata": {
+                    "uc_clamav_virus_scan": {
+                        "data": {"infected": False},
+                        "version": "0.104.2",
+                        "datetime_created": "2021-09-21T11:24:33.159663Z",
+                        "datetime_updated": "2021-09-21T11:24:33.159663Z",
+                    }
+                },
+            }
+        )
+
+    with patch.object(
+        uploadcare.addons_api, "execute", side_effect=fake_execute
+    ), patch.object(
+        uploadcare.addons_api, "status", side_effect=fake_status
+    ), patch.object(
+        uploadcare.files_api, "retrieve", side_effect=fake_retrieve
+    ):
+        result = uploadcare.execute_addon_bulk(
+            UUIDS,
+            AddonLabels.CLAM_AV,
+            AddonClamAVExecutionParams(purge_infected=False),
+            concurrency=2,
+            polling=FixedInterval(0.001),
+        )
+
+    assert list(result.results) == [UUIDS[0]]
+    assert isinstance(result.results[UUIDS[0]], UCClamAVApplicationData)
+    assert result.results[UUIDS[0]].data.infected is False
+    assert isinstance(result.problems[UUIDS[1]], JobFailedError)
+    assert isinstance(result.problems[UUIDS[2]], InvalidRequestError)
+
+
+def test_execute_addon_bulk_network_errors(uploadcare):
+    timeout = httpx.ReadTimeout("timed out")
+
+    def fake_execute(file_uuid, addon_name, params=None):
+        if file_uuid == UUIDS[2]:
+            raise timeout
+        return AddonExecuteResponse(request_id=f"{file_uuid[:-1]}0")
+
+    def fake_retrieve(file_uuid, include_appdata=False):
+        if file_uuid == UUIDS[1]:
+            raise timeout
+        return FileInfo.model_validate({"uuid": file_uuid, "appdata": {}})
+
+    with patch.object(
+        uploadcare.addons_api, "execute", side_effect=fake_execute
+    ), patch.object(
+        uploadcare.addons_api,
+        "status",
+        return_value=AddonResponse(status="done"),
+    ), patch.object(
+        uploadcare.files_api, "retrieve", side_effect=fake_retrieve
+    ):
+        result = uploadcare.execute_addon_bulk(
+            UUIDS, AddonLabels.CLAM_AV, polling=FixedInterval(0.001)
+        )
+
+    assert list(result.results) == [UUIDS[0]]
+    assert result.problems == {UUIDS[1]: timeout, UUIDS[2]: timeout}
+
+
+def _fake_batch_operation(uuids):
+    return BatchFileOperationResponse.model_validate(
+        {
+            "status": "ok",
+            "problems": {uuid: "Missing in the project" for uuid in uuids[1:]},
+            "result": [{"uuid": uuids[0]}],
+        }
+    )
+
+
+def test_store_files_chunks(uploadcare):
+    uploadcare.batch_chunk_size = 2
+
+    with patch.object(
+        uploadcare.files_api,
+        "batch_store",
+        side_effect=_fake_batch_operation,
+    ) as store_mock:
+        result = uploadcare.store_files(
+            (uuid for uuid in UUIDS), concurrency=2
+        )
+
+    assert sorted(call.args[0] for call in store_mock.call_args_list) == [
+        UUIDS[:2],
+        UUIDS[2:],
+    ]
+    assert result.processed == 2
+    assert result.problems == {UUIDS[1]: "Missing in the project"}
+
+
+def test_delete_files_retries_and_failures(uploadcare):
+    uploadcare.batch_chunk_size = 2
+    errors = iter([APIError("Server error"), APIError("Server error")])
+
+    def fake_delete(uuids):
+        if uuids == UUIDS[2:]:
+            raise next(errors)
+        return _fake_batch_operation(uuids[:1])
+
+    with patch.object(
+        uploadcare.files_api, "batch_delete", side_effect=fake_delete
+    ) as delete_mock, patch("pyuploadcare.client.sleep"):
+        result = uploadcare.delete_files(UUIDS, retries=1, raise_errors=False)
+
+    assert delete_mock.call_count == 3
+    assert result.processed == 2
+    assert list(result.problems) == [UUIDS[2]]
+    assert isinstance(result.problems[UUIDS[2]], APIError)
+
+
+def test_batch_operation_backoff(uploadcare):
+    throttled = ThrottledRequestError(
+        httpx.Response(429, headers={"retry-after": "7"})
+    )
+    store_mock = Mock(
+        side_effect=[
+            APIError("Server error"),
+            APIError("Server error"),
+            throttled,
+            _fake_batch_operation(UUIDS[:1]),
+        ]
+    )
+
+    with patch.object(uploadcare.files_api, "batch_store", store_mock), patch(
+        "pyuploadcare.client.sleep"
+    ) as sleep_mock:
+        result = uploadcare.store_files(UUIDS[:1], retries=3)
+
+    assert result.processed == 1
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [
+        0.5,
+        1.0,
+        throttled.wait,
+    ]
+
+
+def test_delete_files_raises_errors(uploadcare):
+    with patch.object(
+        uploadcare.files_api,
+        "batch_delete",
+        side_effect=APIError("Server error"),
+    ):
+        with pytest.raises(APIError):
+            uploadcare.delete_files(UUIDS)
+
+
+def test_prefetch_info(uploadcare):
+    prefetched = uploadcare.file(
+        UUIDS[2], {"uuid": UUIDS[2], "size": 3, "appdata": None}
+    )
+
+    def fake_retrieve(file_uuid, include_appdata=False):
+        return FileInfo.model_validate(
+            {"uuid": file_uuid, "size": int(file_uuid[0])}
+        )
+
+    with patch.object(
+        uploadcare.files_api, "retrieve", side_effect=fake_retrieve
+    ) as retrieve_mock:
+        files = uploadcare.prefetch_info(
+            [UUIDS[0], None, uploadcare.file(UUIDS[1]), UUIDS[0], prefetched],
+            concurrency=2,
+        )
+        assert [file.size for file in files] == [1, 2, 1, 3]
+
+    assert sorted(call.args[0] for call in retrieve_mock.call_args_list) == [
+        UUIDS[0],
+        UUIDS[1],
+    ]
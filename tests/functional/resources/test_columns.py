@@ -0,0 +1,101 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+API_URL = "https://api.uploadcare.com/files/"
+
+ITEMS = [
+    {
+        "uuid": "11111111-1111-1111-1111-111111111111",
+        "size": 100,
+        "mime_type": "image/png",
+        "datetime_uploaded": "2024-01-01T10:00:00.123456Z",
+        "datetime_stored": "2024-01-01T10:00:01Z",
+        "is_image": True,
+        "content_info": {"image": {"width": 640, "height": 480}},
+    },
+    {
+        "uuid": "22222222-2222-2222-2222-222222222222",
+        "size": 200,
+        "mime_type": "application/pdf",
+        "datetime_uploaded": "2024-01-02T10:00:00Z",
+        "datetime_stored": None,
+        "is_image": False,
+        "content_info": None,
+    },
+    {
+        "uuid": "33333333-3333-3333-3333-333333333333",
+        "size": 300,
+        "mime_type": "image/jpeg",
+        "datetime_uploaded": "2024-01-03T10:00:00Z",
+        "datetime_stored": "2024-01-03T10:00:01Z",
+        "is_image": True,
+        "content_info": {"image": {"width": 10, "height": 20}},
+    },
+]
+
+
+def test_list_raw_pagination(uploadcare):
+    pages = {
+        API_URL
+        + "?limit=2": {"next": API_URL + "?page=2", "results": ITEMS[:2]},
+        API_URL + "?page=2": {"next": None, "results": ITEMS[2:]},
+    }
+
+    def fake_get(url):
+        response = MagicMock()
+        response.json.return_value = pages[url]
+        return response
+
+    with patch.object(
+        uploadcare.files_api._client, "get", side_effect=fake_get
+    ) as get_mock:
+        items = list(uploadcare.files_api.list_raw(request_limit=2))
+        limited = list(uploadcare.files_api.list_raw(limit=1, request_limit=2))
+
+    assert items == ITEMS
+    assert limited == ITEMS[:1]
+    assert get_mock.call_count == 3
+
+
+def test_file_list_to_numpy_columns(uploadcare):
+    numpy = pytest.importorskip("numpy")
+
+    with patch.object(
+        uploadcare.files_api, "list_raw", return_value=iter(ITEMS)
+    ):
+        columns = uploadcare.list_files().to_columns(as_arrow=False)
+
+    assert columns["uuid"][1] == ITEMS[1]["uuid"]
+    assert columns["size"].dtype == numpy.int64
+    assert columns["size"].tolist() == [100, 200, 300]
+    assert columns["is_stored"].tolist() == [True, False, True]
+    assert columns["image_width"].tolist() == [640, -1, 10]
+    assert columns["datetime_uploaded"][0] == numpy.datetime64(
+        "2024-01-01T10:00:00.123456"
+    )
+
+
+def test_file_list_iter_arrow_columns(uploadcare):
+    pytest.importorskip("pyarrow")
+
+    with patch.object(
+        uploadcare.files_api, "list_raw", return_value=iter(ITEMS)
+    ):
+        chunks = list(
+            uploadcare.list_files().iter_columns(
+                ["uuid", "image_height", "datetime_stored"], chunk_size=2
+            )
+        )
+
+    assert [chunk.num_rows for chunk in chunks] == [2, 1]
+    assert chunks[0].column("image_height").to_pylist() == [480, None]
+    assert str(chunks[0].schema.field("datetime_stored").type) == (
+        "timestamp[us, tz=UTC]"
+    )
+
+
+def test_file_list_to_columns_unknown_field(uploadcare):
+    with pytest.raises(ValueError):
+        uploadcare.list_files().to_columns(["uuid", "unknown"])
@@ -0,0 +1,76 @@
+import gc
+import tracemalloc
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from pyuploadcare.resources.packed_info import (
+    PACKED_FIELDS,
+    pack_file_info,
+    unpack_file_info,
+)
+
+
+def _file_info(uuid, index=0):
+    return {
+        "uuid": uuid,
+        "size": 1024,
+        "is_image": True,
+        "is_ready": None,
+        "datetime_uploaded": datetime(
+            2024, 1, 1, 1, 2, 3, 456, tzinfo=timezone.utc
+        ),
+        "datetime_stored": "2024-01-02T00:00:00Z",
+        "datetime_removed": None,
+        "mime_type": "image/png",
+        "original_filename": f"фото-{index}.png",
+        "image_info": {"width": 640, "height": 480},
+        "metadata": {"key": "value"},
+    }
+
+
+def test_pack_file_info_roundtrip():
+    info = _file_info(str(uuid4()))
+
+    unpacked = unpack_file_info(pack_file_info(info))
+
+    assert list(unpacked) == list(PACKED_FIELDS)
+    assert unpacked["datetime_stored"] == datetime(
+        2024, 1, 2, tzinfo=timezone.utc
+    )
+    for field in PACKED_FIELDS:
+        if field != "datetime_stored":
+            assert unpacked[field] == info[field]
+
+
+def test_packed_file(uploadcare):
+    file = uploadcare.file(str(uuid4()), _file_info(str(uuid4())))
+    file.pack_info()
+
+    assert not hasattr(file, "__dict__")
+    assert file._info_cache is None
+    assert file.size == 1024
+    assert file.is_stored
+    assert file.mime_type == "image/png"
+    assert "image_info" not in file.info
+
+
+def test_packed_file_memory(uploadcare):
+    infos = [_file_info(str(uuid4()), index) for index in range(1000)]
+    uuids = [info["uuid"].encode() for info in infos]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        files = []
+        for uuid, info in zip(uuids, infos):
+            file = uploadcare.file(uuid.decode(), info)
+            file.pack_info()
+            files.append(file)
+        gc.collect()
+        per_file = (tracemalloc.get_traced_memory()[0] - before) / len(files)
+    finally:
+        tracemalloc.stop()
+
+    # File instance, uuid string and packed record
+    assert per_file < 320
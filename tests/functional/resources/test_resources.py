@@ -1,10 +1,14 @@
 import os
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
+from uuid import UUID
 
 import pytest
 
 from pyuploadcare import File, FileGroup, FileList, GroupList
+from pyuploadcare.api.entities import GroupInfo
+from pyuploadcare.api.responses import BatchFileOperationResponse
+from pyuploadcare.exceptions import InvalidParamError
 from pyuploadcare.resources.file import UploadProgress
 from pyuploadcare.transformations.document import (
     DocumentFormat,
@@ -407,3 +411,80 @@ def test_retrieve_fileinfo_with_appdata(uploadcare):
     assert moderation_label["confidence"]
     assert moderation_label["name"] == "Weapons"
     assert moderation_label["parent_name"] == "Violence"
+
+
+def test_iter_uuids(uploadcare):
+    uuid = "6c5e9526-b0fe-4739-8975-72e8d5ee6342"
+    files = iter(
+        [
+            uuid,
+            UUID(uuid),
+            uploadcare.file(uuid),
+            f"https://ucarecdn.com/{uuid}/-/resize/100x/image.png",
+            f"/{uuid}/",
+        ]
+    )
+
+    uuids = uploadcare._iter_uuids(files)
+
+    assert next(uuids) == uuid
+    assert list(uuids) == [uuid] * 4
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "6C5E9526-B0FE-4739-8975-72E8D5EE6342",
+        "https://ucarecdn.com/not-a-uuid/",
+    ],
+)
+def test_iter_uuids_invalid(uploadcare, value):
+    with pytest.raises(InvalidParamError, match="Couldn't find UUID"):
+        list(uploadcare._iter_uuids([value]))
+
+
+def test_file_group_store_skips_stored_files(uploadcare):
+    stored = "6c5e9526-b0fe-4739-8975-72e8d5ee6342"
+    not_stored = "a771f854-c2cb-408a-8c36-71af77811f3b"
+    group_infos = iter(
+        [
+            {"datetime_stored": None},
+            {"datetime_stored": "2024-01-02T00:00:00Z"},
+        ]
+    )
+
+    def fake_retrieve(group_id):
+        return GroupInfo.model_validate(
+            {
+                "id": group_id,
+                "files": [
+                    {
+                        "uuid": stored,
+                        "datetime_stored": "2024-01-01T00:00:00Z",
+                    },
+                    None,
+                    {"uuid": not_stored, **next(group_infos)},
+                ],
+            }
+        )
+
+    group = uploadcare.file_group(f"{stored}~3")
+    with patch.object(
+        uploadcare.groups_api, "retrieve", side_effect=fake_retrieve
+    ) as retrieve_mock, patch.object(
+        uploadcare.files_api,
+        "batch_store",
+        return_value=BatchFileOperationResponse(status="ok"),
+    ) as store_mock, patch.object(
+        uploadcare.files_api, "retrieve"
+    ) as file_retrieve_mock:
+        assert not group.is_stored
+        assert group.store()
+        assert group.store() is None
+
+    store_mock.assert_called_once_with([not_stored])
+    assert retrieve_mock.call_count == 2
+    assert not file_retrieve_mock.called
+    assert group._stored_at == datetime.fromisoformat(
+        "2024-01-02T00:00:00+00:00"
+    )
@@ -0,0 +1,181 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyuploadcare import File
+from pyuploadcare.exceptions import DuplicateFileError, UploadError
+from pyuploadcare.polling import ExponentialBackoff
+
+
+URLS = {
+    "https://example.com/1.png": "11111111-1111-1111-1111-111111111111",
+    "https://example.com/2.png": "22222222-2222-2222-2222-222222222222",
+    "https://example.com/3.png": "33333333-3333-3333-3333-333333333333",
+}
+
+
+def _fake_upload_api(uploadcare, statuses):
+    polls = {token: 0 for token in statuses}
+
+    def upload_from_url(source_url, **kwargs):
+        if source_url == "https://example.com/dup.png":
+            raise DuplicateFileError(
+                "duplicate", file_id="44444444-4444-4444-4444-444444444444"
+            )
+        return source_url
+
+    def get_status(token):
+        polls[token] += 1
+        status = statuses[token][min(polls[token], len(statuses[token])) - 1]
+        info = {"status": status, "done": 1, "total": 2}
+        if status == "success":
+            info["uuid"] = URLS[token]
+        return info
+
+    return (
+        patch.object(
+            uploadcare.upload_api, "upload_from_url", upload_from_url
+        ),
+        patch.object(
+            uploadcare.upload_api, "get_upload_from_url_status", get_status
+        ),
+        polls,
+    )
+
+
+def test_upload_from_urls(uploadcare):
+    statuses = {
+        url: ["progress"] * index + ["success"]
+        for index, url in enumerate(URLS)
+    }
+    submit_patch, status_patch, polls = _fake_upload_api(uploadcare, statuses)
+
+    with submit_patch, status_patch:
+        results = dict(
+            uploadcare.upload_from_urls(
+                list(URLS) + ["https://example.com/dup.png"],
+                concurrency=2,
+                interval=0.001,
+                max_interval=0.002,
+            )
+        )
+
+    assert set(results) == set(URLS) | {"https://example.com/dup.png"}
+    for url, uuid in URLS.items():
+        assert isinstance(results[url], File)
+        assert results[url].uuid == uuid
+        assert polls[url] == len(statuses[url])
+    assert (
+        results["https://example.com/dup.png"].uuid
+        == "44444444-4444-4444-4444-444444444444"
+    )
+
+
+def test_upload_from_urls_zero_interval(uploadcare):
+    url = "https://example.com/1.png"
+    submit_patch, status_patch, polls = _fake_upload_api(
+        uploadcare, {url: ["progress", "progress", "success"]}
+    )
+
+    with submit_patch, status_patch:
+        results = dict(uploadcare.upload_from_urls([url], interval=0))
+
+    assert results[url].uuid == URLS[url]
+    assert polls[url] == 3
+
+
+def test_upload_from_urls_interval_doubles(uploadcare):
+    url = "https://example.com/1.png"
+    submit_patch, status_patch, _ = _fake_upload_api(
+        uploadcare, {url: ["progress", "progress", "success"]}
+    )
+    intervals = []
+    next_interval = ExponentialBackoff.next_interval
+
+    def spy(strategy, state):
+        intervals.append(next_interval(strategy, state))
+        return intervals[-1]
+
+    with submit_patch, status_patch, patch.object(
+        ExponentialBackoff, "next_interval", spy
+    ):
+        list(uploadcare.upload_from_urls([url], interval=0.001))
+
+    assert intervals == [0.001, 0.002, 0.004]
+
+
+def test_upload_from_urls_errors(uploadcare):
+    url = "https://example.com/1.png"
+    submit_patch, status_patch, _ = _fake_upload_api(
+        uploadcare, {url: ["error"]}
+    )
+
+    with submit_patch, status_patch:
+        with pytest.raises(UploadError):
+            list(uploadcare.upload_from_urls([url], interval=0.001))
+
+        [(failed_url, error)] = uploadcare.upload_from_urls(
+            [url], interval=0.001, raise_errors=False
+        )
+
+    assert failed_url == url
+    assert isinstance(error, UploadError)
+
+
+def test_upload_from_urls_max_pending(uploadcare):
+    urls = [f"https://example.com/{index}.png" for index in range(20)]
+    outstanding = set()
+    peak = 0
+
+    def upload_from_url(source_url, **kwargs):
+        nonlocal peak
+        outstanding.add(source_url)
+        peak = max(peak, len(outstanding))
+        return source_url
+
+    def get_status(token):
+        outstanding.discard(token)
+        return {"status": "success", "uuid": URLS["https://example.com/1.png"]}
+
+    with patch.object(
+        uploadcare.upload_api, "upload_from_url", upload_from_url
+    ), patch.object(
+        uploadcare.upload_api, "get_upload_from_url_status", get_status
+    ):
+        results = list(
+            uploadcare.upload_from_urls(
+                urls, concurrency=2, max_pending=3, interval=0.001
+            )
+        )
+
+    assert len(results) == 20
+    assert peak == 3
+
+
+def test_upload_from_urls_http_errors(uploadcare):
+    url = "https://example.com/1.png"
+    timeout = httpx.ReadTimeout("timed out")
+
+    def upload_from_url(source_url, **kwargs):
+        if source_url == "https://example.com/2.png":
+            raise timeout
+        return source_url
+
+    def get_status(token):
+        raise timeout
+
+    with patch.object(
+        uploadcare.upload_api, "upload_from_url", upload_from_url
+    ), patch.object(
+        uploadcare.upload_api, "get_upload_from_url_status", get_status
+    ):
+        results = dict(
+            uploadcare.upload_from_urls(
+                [url, "https://example.com/2.png"],
+                interval=0,
+                raise_errors=False,
+            )
+        )
+
+    assert results == {url: timeout, "https://example.com/2.png": timeout}
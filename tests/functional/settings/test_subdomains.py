@@ -1,9 +1,12 @@
+import hashlib
 import importlib
 import os
 import sys
 
 import pytest
 
+from pyuploadcare.helpers import base36encode, get_cdn_base
+
 
 @pytest.mark.parametrize(
     "use_subdomains,pub_key,expected_cdn_base",
@@ -30,3 +33,31 @@ def test_cdn_base(tmp_path, use_subdomains, pub_key, expected_cdn_base):
     # clean up
     del os.environ["UPLOADCARE_PUBLIC_KEY"]
     del os.environ["UPLOADCARE_USE_SUBDOMAINS"]
+
+
+@pytest.mark.parametrize("digits", [1, 10, 50, None])
+def test_base36encode_leading_digits(digits):
+    number = int(hashlib.sha256(b"demopublickey").hexdigest(), 16)
+    encoded = ""
+    while number:
+        number, i = divmod(number, 36)
+        encoded = "0123456789abcdefghijklmnopqrstuvwxyz"[i] + encoded
+
+    number = int(hashlib.sha256(b"demopublickey").hexdigest(), 16)
+    assert base36encode(number, digits=digits) == encoded[:digits]
+    assert base36encode(0, digits=digits) == "0"
+
+
+def test_get_cdn_base_cached():
+    get_cdn_base.cache_clear()
+    for _ in range(2):
+        assert (
+            get_cdn_base(
+                "demopublickey",
+                default="https://ucarecdn.com/",
+                subdomains=True,
+                subdomains_ptn="https://{prefix}.ucarecd.net/",
+            )
+            == "https://1s4oyld5dc.ucarecd.net/"
+        )
+    assert get_cdn_base.cache_info().hits == 1
@@ -0,0 +1,81 @@
+import shelve
+from unittest.mock import MagicMock, patch
+
+from pyuploadcare.api.entities import FileInfo
+from pyuploadcare.cache import CountCache, FileInfoCache
+
+
+UUID = "6c5e9526-b0fe-4739-8975-72e8d5ee6342"
+
+
+def test_file_info_cache_lru():
+    cache = FileInfoCache(maxsize=2)
+    cache.set("a", {"size": 1})
+    cache.set("b", {"size": 2})
+    assert cache.get("a") == {"size": 1}
+
+    cache.set("c", {"size": 3})
+
+    assert "b" not in cache
+    assert "a" in cache
+    assert len(cache) == 2
+
+
+def test_file_info_cache_ttl():
+    cache = FileInfoCache(ttl=10)
+    with patch("pyuploadcare.cache.time.time", return_value=100):
+        cache.set("a", {"size": 1})
+    with patch("pyuploadcare.cache.time.time", return_value=105):
+        assert cache.get("a") == {"size": 1}
+    with patch("pyuploadcare.cache.time.time", return_value=111):
+        assert cache.get("a") is None
+    assert not cache.store
+
+
+def test_file_info_cache_shelve_store(tmp_path):
+    path = str(tmp_path / "info")
+    with shelve.open(path) as store:
+        FileInfoCache(store=store).set("a", {"size": 1})
+    with shelve.open(path) as store:
+        assert FileInfoCache(store=store).get("a") == {"size": 1}
+
+
+def test_file_info_shared_by_files(uploadcare):
+    uploadcare.info_cache = FileInfoCache()
+    info = FileInfo.model_validate({"uuid": UUID, "size": 42})
+
+    with patch.object(
+        uploadcare.files_api, "retrieve", return_value=info
+    ) as retrieve_mock, patch.object(
+        uploadcare.files_api, "delete", return_value=info
+    ):
+        assert uploadcare.file(UUID).size == 42
+        assert uploadcare.file(UUID).size == 42
+        assert retrieve_mock.call_count == 1
+
+        uploadcare.file(UUID).delete()
+        assert uploadcare.file(UUID).size == 42
+        assert retrieve_mock.call_count == 2
+
+
+def test_count_cache(uploadcare):
+    uploadcare.count_cache = CountCache(ttl=10)
+    response = MagicMock()
+    response.json.return_value = {"total": 42, "results": [{"uuid": UUID}]}
+
+    with patch.object(
+        uploadcare.files_api._client, "get", return_value=response
+    ) as get_mock, patch("pyuploadcare.cache.time.time", return_value=100):
+        assert uploadcare.list_files(stored=True).count() == 42
+        assert uploadcare.list_files(stored=True).count() == 42
+        assert get_mock.call_count == 1
+        assert "limit=1" in get_mock.call_args.args[0]
+
+        assert uploadcare.list_files(stored=False).count() == 42
+        assert get_mock.call_count == 2
+
+    with patch.object(
+        uploadcare.files_api._client, "get", return_value=response
+    ) as get_mock, patch("pyuploadcare.cache.time.time", return_value=111):
+        assert uploadcare.list_files(stored=True).count() == 42
+        assert get_mock.call_count == 1
@@ -0,0 +1,165 @@
+import itertools
+import os
+import re
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyuploadcare.api.client import Client
+from pyuploadcare.api.entities import FileInfo
+from pyuploadcare.exceptions import APIError, InvalidRequestError
+from pyuploadcare.secure_url import BaseSecureUrlBuilder
+
+
+UUID = "a771f854-c2cb-408a-8c36-71af77811f3b"
+CONTENT = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def cdn_requests(uploadcare):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers["Range"])
+        start, end = int(match.group(1)), int(match.group(2))
+        return httpx.Response(206, content=CONTENT[start : end + 1])
+
+    uploadcare.cdn_client = Client(
+        base_url=uploadcare.cdn_base, transport=httpx.MockTransport(handler)
+    )
+    return requests
+
+
+def test_download_ranges(uploadcare, cdn_requests, tmp_path):
+    file_ = uploadcare.file(UUID, file_info={"uuid": UUID, "size": 10240})
+
+    result = uploadcare.download([file_], str(tmp_path), range_size=4096)
+
+    path = str(tmp_path / UUID)
+    assert result.files == {UUID: path}
+    assert not result.problems
+    with open(path, "rb") as downloaded:
+        assert downloaded.read() == CONTENT
+    assert sorted(request.headers["Range"] for request in cdn_requests) == [
+        "bytes=0-4095",
+        "bytes=4096-8191",
+        "bytes=8192-10239",
+    ]
+    assert os.listdir(tmp_path) == [UUID]
+
+    # existing files are not downloaded again
+    uploadcare.download([file_], str(tmp_path), range_size=4096)
+    assert len(cdn_requests) == 3
+
+
+def test_download_resume(uploadcare, cdn_requests, tmp_path):
+    file_ = uploadcare.file(UUID, file_info={"uuid": UUID, "size": 10240})
+    path = str(tmp_path / "photos" / "photo.jpg")
+    os.makedirs(tmp_path / "photos")
+    with open(f"{path}.4096-8191.part", "wb") as part:
+        part.write(CONTENT[4096:5000])
+
+    result = uploadcare.download(
+        [file_], lambda file_: path, concurrency=2, range_size=4096
+    )
+
+    assert result.files == {UUID: path}
+    assert "bytes=5000-8191" in {
+        request.headers["Range"] for request in cdn_requests
+    }
+    with open(path, "rb") as downloaded:
+        assert downloaded.read() == CONTENT
+
+
+def test_download_size_mismatch(uploadcare, cdn_requests, tmp_path):
+    file_ = uploadcare.file(UUID, file_info={"uuid": UUID, "size": 20000})
+
+    result = uploadcare.download(
+        [file_], str(tmp_path), retries=0, raise_errors=False
+    )
+
+    assert not result.files
+    assert isinstance(result.problems[UUID], APIError)
+
+    with pytest.raises(APIError):
+        uploadcare.download([file_], str(tmp_path), retries=0)
+
+
+def test_download_info_errors(uploadcare, cdn_requests, tmp_path):
+    missing = "22222222-2222-2222-2222-222222222222"
+
+    def fake_retrieve(file_uuid, include_appdata=False):
+        if file_uuid == missing:
+            raise InvalidRequestError("Not found")
+        return FileInfo.model_validate({"uuid": file_uuid, "size": 10240})
+
+    with patch.object(
+        uploadcare.files_api, "retrieve", side_effect=fake_retrieve
+    ):
+        result = uploadcare.download(
+            (uuid for uuid in [missing, UUID]),
+            str(tmp_path),
+            raise_errors=False,
+        )
+
+        assert result.files == {UUID: str(tmp_path / UUID)}
+        assert isinstance(result.problems[missing], InvalidRequestError)
+
+        with pytest.raises(InvalidRequestError):
+            uploadcare.download([missing], str(tmp_path))
+
+
+class CountingSecureUrlBuilder(BaseSecureUrlBuilder):
+    def __init__(self):
+        self.counter = itertools.count()
+
+    def build(self, handle, wildcard=False):
+        return f"https://cdn.example.com/{handle}?token={next(self.counter)}"
+
+
+def test_download_signs_every_attempt(uploadcare, tmp_path):
+    tokens = []
+
+    def handler(request):
+        tokens.append(request.url.params["token"])
+        if len(tokens) == 1:
+            return httpx.Response(403)
+        return httpx.Response(200, content=CONTENT)
+
+    uploadcare.secure_url_builder = CountingSecureUrlBuilder()
+    uploadcare.cdn_client = Client(transport=httpx.MockTransport(handler))
+    file_ = uploadcare.file(UUID, file_info={"uuid": UUID, "size": 10240})
+
+    with patch("pyuploadcare.client.sleep"):
+        result = uploadcare.download([file_], str(tmp_path))
+
+    assert result.files == {UUID: str(tmp_path / UUID)}
+    assert tokens == ["0", "1"]
+
+
+def test_download_skips_parts_of_failed_files(uploadcare, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(403)
+
+    uploadcare.cdn_client = Client(
+        base_url=uploadcare.cdn_base, transport=httpx.MockTransport(handler)
+    )
+    file_ = uploadcare.file(UUID, file_info={"uuid": UUID, "size": 10240})
+
+    result = uploadcare.download(
+        [file_],
+        str(tmp_path),
+        concurrency=1,
+        range_size=1024,
+        retries=0,
+        raise_errors=False,
+    )
+
+    assert not result.files
+    assert UUID in result.problems
+    assert len(requests) == 1
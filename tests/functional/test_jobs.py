@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pyuploadcare.api.addon_entities import AddonLabels
+from pyuploadcare.api.entities import VideoConvertStatus
+from pyuploadcare.api.responses import AddonResponse
+from pyuploadcare.exceptions import JobFailedError, TimeoutError
+from pyuploadcare.polling import FixedInterval
+
+
+def _video_status(status):
+    return VideoConvertStatus.model_validate(
+        {
+            "status": status,
+            "result": {
+                "uuid": "11111111-1111-1111-1111-111111111111",
+                "thumbnails_group_uuid": "group~1",
+            },
+        }
+    )
+
+
+def test_job_tracker_completes_jobs(uploadcare):
+    video_statuses = {
+        1: iter(["pending", "processing", "finished"]),
+        2: iter(["processing", "failed"]),
+    }
+    addon_statuses = iter(["in_progress", "done"])
+    completed = []
+
+    tracker = uploadcare.job_tracker(
+        polling=FixedInterval(0.001), concurrency=2
+    )
+    with patch.object(
+        uploadcare.video_convert_api,
+        "status",
+        side_effect=lambda token: _video_status(next(video_statuses[token])),
+    ), patch.object(
+        uploadcare.addons_api,
+        "status",
+        side_effect=lambda request_id, addon_name: AddonResponse(
+            status=next(addon_statuses)
+        ),
+    ):
+        finished = tracker.track_video_conversion(1)
+        failed = tracker.track_video_conversion(2)
+        addon = tracker.track_addon_execution(
+            "c3446e41-9eb0-4301-aeb4-356d0fdcf9af",
+            AddonLabels.CLAM_AV,
+            callback=completed.append,
+        )
+        jobs = tracker.wait()
+
+    assert set(jobs) == {finished, failed, addon}
+    assert finished.result().status == "finished"
+    with pytest.raises(JobFailedError) as error:
+        failed.result()
+    assert error.value.status.status == "failed"
+    assert addon.result().status == "done"
+    assert completed == [addon]
+    assert len(tracker) == 0
+
+
+def test_job_tracker_deadline(uploadcare):
+    tracker = uploadcare.job_tracker(polling=FixedInterval(0.001))
+    with patch.object(
+        uploadcare.document_convert_api,
+        "status",
+        return_value=_video_status("processing"),
+    ):
+        job = tracker.track_document_conversion(1, timeout=0.01)
+        [completed] = tracker.as_completed()
+
+    assert completed is job
+    with pytest.raises(TimeoutError):
+        job.result()
+
+
+def test_job_tracker_request_budget(uploadcare):
+    tracker = uploadcare.job_tracker(
+        polling=FixedInterval(0), requests_per_second=100
+    )
+    with patch.object(
+        uploadcare.video_convert_api,
+        "status",
+        return_value=_video_status("finished"),
+    ) as status_mock, patch("pyuploadcare.jobs.time.sleep") as sleep_mock:
+        for token in range(3):
+            tracker.track_video_conversion(token)
+        tracker.wait()
+
+    assert status_mock.call_count == 3
+    assert sleep_mock.called
+
+
+def test_job_tracker_network_errors(uploadcare):
+    timeout = httpx.ReadTimeout("timed out")
+    statuses = {
+        1: iter([timeout, "finished"]),
+        2: iter([timeout] * 100),
+    }
+
+    def fetch_status(token):
+        status = next(statuses[token])
+        if isinstance(status, Exception):
+            raise status
+        return _video_status(status)
+
+    tracker = uploadcare.job_tracker(
+        polling=FixedInterval(0.001), timeout=0.05
+    )
+    with patch.object(
+        uploadcare.video_convert_api, "status", side_effect=fetch_status
+    ):
+        recovered = tracker.track_video_conversion(1)
+        unreachable = tracker.track_video_conversion(2)
+        tracker.wait()
+
+    assert recovered.result().status == "finished"
+    with pytest.raises(httpx.ReadTimeout):
+        unreachable.result()
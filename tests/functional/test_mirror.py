@@ -0,0 +1,118 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from pyuploadcare.mirror import FileMirror
+
+
+def _item(index, stored=True, removed=False, size=1024):
+    uploaded = f"2024-01-0{index}T10:00:00Z"
+    return {
+        "uuid": f"{index}" * 8 + "-1111-1111-1111-111111111111",
+        "size": size,
+        "mime_type": "image/png",
+        "is_image": True,
+        "datetime_uploaded": uploaded,
+        "datetime_stored": uploaded if stored else None,
+        "datetime_removed": uploaded if removed else None,
+        "content_info": {"image": {"width": 10, "height": 20}},
+        "metadata": {"key": str(index)},
+    }
+
+
+def _fake_listing(files):
+    def list_raw(request_limit=None, **query_parameters):
+        removed = query_parameters["removed"] == "true"
+        starting_point = query_parameters.get("from")
+        return iter(
+            [
+                item
+                for item in files
+                if bool(item["datetime_removed"]) is removed
+                and (
+                    starting_point is None
+                    or item["datetime_uploaded"].replace("Z", "")
+                    >= starting_point.split("+")[0].split(".")[0]
+                )
+            ]
+        )
+
+    return list_raw
+
+
+def test_mirror_incremental_refresh(uploadcare):
+    files = [_item(1), _item(2, stored=False), _item(3, size=10)]
+    mirror = FileMirror(uploadcare)
+
+    with patch.object(
+        uploadcare.files_api, "list_raw", side_effect=_fake_listing(files)
+    ) as list_mock:
+        assert mirror.refresh() == 3
+        assert "from" not in list_mock.call_args.kwargs
+        assert mirror.count() == 3
+        assert mirror.count(stored=False) == 1
+
+        files[1] = _item(2, removed=True)
+        files.append(_item(4, size=5000))
+        # files uploaded since the oldest pending one are listed again
+        assert mirror.refresh() == 3
+        assert list_mock.call_args.kwargs["from"] == (
+            "2024-01-02T10:00:00.000000+00:00"
+        )
+
+    assert mirror.count() == 3
+    assert mirror.count(removed=True) == 1
+    assert mirror.count(stored=True, min_size=1024) == 2
+    assert mirror.total_size(stored=True) == 1024 + 10 + 5000
+    assert (
+        mirror.count(uploaded_after=datetime(2024, 1, 3, tzinfo=timezone.utc))
+        == 2
+    )
+    assert mirror.count(mime_type="image/") == 3
+
+    [item] = mirror.query(limit=1)
+    assert item["uuid"] == files[0]["uuid"]
+    assert item["image_width"] == 10
+    assert item["metadata"] == {"key": "1"}
+
+
+def test_mirror_full_refresh_drops_missing_files(uploadcare, tmp_path):
+    files = [_item(1), _item(2)]
+    path = str(tmp_path / "files.db")
+
+    with patch.object(
+        uploadcare.files_api, "list_raw", side_effect=_fake_listing(files)
+    ):
+        with FileMirror(uploadcare, path) as mirror:
+            mirror.refresh()
+
+        del files[0]
+        with FileMirror(uploadcare, path) as mirror:
+            assert mirror.refresh(full=True) == 1
+            assert [item["uuid"] for item in mirror.query()] == [
+                files[0]["uuid"]
+            ]
+
+
+def test_mirror_full_refresh_after_failure(uploadcare):
+    files = [_item(1), _item(2)]
+    mirror = FileMirror(uploadcare)
+    list_raw = _fake_listing(files)
+
+    def failing_listing(request_limit=None, **query_parameters):
+        yield from list_raw(request_limit, **query_parameters)
+        raise ConnectionError("connection lost")
+
+    with patch.object(
+        uploadcare.files_api, "list_raw", side_effect=failing_listing
+    ):
+        with pytest.raises(ConnectionError):
+            mirror.refresh(full=True)
+
+    del files[0]
+    with patch.object(
+        uploadcare.files_api, "list_raw", side_effect=_fake_listing(files)
+    ):
+        assert mirror.refresh(full=True) == 1
+    assert [item["uuid"] for item in mirror.query()] == [files[0]["uuid"]]
@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+import pytest
+
+from pyuploadcare.polling import (
+    ExponentialBackoff,
+    FixedInterval,
+    PollingState,
+    ProgressAwareBackoff,
+)
+
+
+def test_fixed_interval():
+    strategy = FixedInterval(0.5)
+    state = PollingState()
+    for _ in range(3):
+        state.advance(0.5)
+        assert strategy.next_interval(state) == 0.5
+
+
+def test_exponential_backoff_is_capped():
+    strategy = ExponentialBackoff(
+        initial=1, factor=2, max_interval=5, jitter=0
+    )
+    state = PollingState()
+    intervals = []
+    for _ in range(5):
+        state.advance(intervals[-1] if intervals else 0)
+        intervals.append(strategy.next_interval(state))
+
+    assert intervals == [1, 2, 4, 5, 5]
+
+
+def test_exponential_backoff_jitter():
+    strategy = ExponentialBackoff(initial=1, max_interval=10, jitter=0.5)
+    state = PollingState(attempt=2)
+    for _ in range(20):
+        assert 1 <= strategy.next_interval(state) <= 3
+
+
+def test_exponential_backoff_invalid_parameters():
+    with pytest.raises(ValueError):
+        ExponentialBackoff(initial=-1)
+    with pytest.raises(ValueError):
+        ExponentialBackoff(factor=0.5)
+
+    assert ExponentialBackoff(initial=0).next_interval(PollingState()) == 0
+
+
+def test_progress_aware_backoff():
+    strategy = ProgressAwareBackoff(initial=0.5, max_interval=10, jitter=0)
+    state = PollingState()
+    state.advance(0, done=100, total=1000)
+    # no growth observed yet
+    assert strategy.next_interval(state) == 0.5
+
+    state.advance(1, done=400, total=1000)
+    # 300 B/s, 600 B left
+    assert strategy.next_interval(state) == 2
+
+    state.advance(2, done=400, total=1000)
+    # stalled, back to exponential backoff
+    assert strategy.next_interval(state) == 2
+
+
+def test_file_from_url_wait_with_polling(uploadcare):
+    statuses = iter(
+        [
+            {"status": "progress", "done": 1, "total": 4},
+            {"status": "progress", "done": 2, "total": 4},
+            {
+                "status": "success",
+                "done": 4,
+                "total": 4,
+                "uuid": "11111111-1111-1111-1111-111111111111",
+            },
+        ]
+    )
+    readiness = iter([{"is_ready": False}, {"is_ready": True}])
+    file_from_url = uploadcare.file_from_url("token")
+
+    with patch.object(
+        uploadcare.upload_api,
+        "get_upload_from_url_status",
+        side_effect=lambda token: next(statuses),
+    ) as status_mock, patch.object(
+        uploadcare.files_api,
+        "retrieve",
+        side_effect=lambda *args, **kwargs: _Info(next(readiness)),
+    ) as retrieve_mock, patch(
+        "pyuploadcare.resources.file.time.sleep"
+    ) as sleep_mock:
+        file = file_from_url.wait(
+            until_ready=True,
+            polling=ExponentialBackoff(initial=1, jitter=0),
+            ready_polling=FixedInterval(3),
+        )
+
+    assert file.uuid == "11111111-1111-1111-1111-111111111111"
+    assert status_mock.call_count == 3
+    assert retrieve_mock.call_count == 2
+    assert [call.args[0] for call in sleep_mock.call_args_list] == [1, 2, 3]
+
+
+class _Info:
+    def __init__(self, info):
+        self.info = info
+
+    def model_dump(self):
+        return self.info
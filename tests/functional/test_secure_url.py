@@ -1,13 +1,19 @@
+from unittest.mock import patch
 from urllib.error import HTTPError
 from urllib.request import urlopen
+from uuid import UUID
 
 import pytest
 
 from pyuploadcare import Uploadcare
 from pyuploadcare.secure_url import (
+    AkamaiSecureUrlBuilder,
     AkamaiSecureUrlBuilderWithAclToken,
     AkamaiSecureUrlBuilderWithUrlToken,
 )
+from pyuploadcare.transformations.base import Slot
+from pyuploadcare.transformations.image import ImageTransformation
+from pyuploadcare.transformations.video import VideoTransformation
 
 
 known_secret = (
@@ -312,3 +318,206 @@ def test_url_token_group_url(uploadcare_with_url_token: Uploadcare):
         "https://sectest.ucarecdn.com/3b278cee-47bd-4276-8d7d-9cde5902b18c~1/nth/0/"
     )
     assert urlopen(secure_url).status == 200
+
+
+@pytest.mark.freeze_time("2021-10-12")
+def test_client_cdn_urls():
+    secure_url_bulder = AkamaiSecureUrlBuilderWithAclToken(
+        "cdn.yourdomain.com", known_secret
+    )
+    uploadcare = Uploadcare(
+        public_key="public",
+        secret_key="secret",
+        secure_url_builder=secure_url_bulder,
+    )
+    transformation = ImageTransformation().resize(width=640)
+    files = [
+        "52da3bfc-7cd8-4861-8b05-126fef7a6994",
+        uploadcare.file("52da3bfc-7cd8-4861-8b05-126fef7a6994"),
+    ]
+
+    assert (
+        uploadcare.cdn_urls(files, transformation)
+        == [
+            "https://ucarecdn.com/52da3bfc-7cd8-4861-8b05-126fef7a6994"
+            "/-/resize/640x/"
+        ]
+        * 2
+    )
+    assert uploadcare.cdn_urls(files) == [files[1].cdn_url] * 2
+    assert (
+        uploadcare.cdn_urls(files, transformation, secure=True)
+        == [
+            secure_url_bulder.build(
+                "52da3bfc-7cd8-4861-8b05-126fef7a6994/-/resize/640x/"
+            )
+        ]
+        * 2
+    )
+
+
+@pytest.mark.parametrize(
+    "transformation",
+    [
+        ImageTransformation().gif2video(),
+        ImageTransformation().resize(200).detect_faces(),
+        "gif2video/-/format/mp4/",
+    ],
+)
+def test_client_cdn_urls_image_paths(uploadcare, transformation):
+    file_ = uploadcare.file("52da3bfc-7cd8-4861-8b05-126fef7a6994")
+    expected = [f"{uploadcare.cdn_base}{file_.cdn_path(transformation)}"]
+
+    assert uploadcare.cdn_urls([file_], transformation) == expected
+    assert (
+        uploadcare.cdn_urls(
+            [file_], ImageTransformation(transformation).freeze()
+        )
+        == expected
+    )
+
+
+def test_client_cdn_urls_video_paths(uploadcare):
+    file_ = uploadcare.file("52da3bfc-7cd8-4861-8b05-126fef7a6994")
+    transformation = VideoTransformation().thumbs(2)
+
+    assert uploadcare.cdn_urls([file_], transformation) == [
+        f"{uploadcare.cdn_base}{file_.uuid}/video/-/thumbs~2/"
+    ]
+
+
+def test_client_cdn_urls_template(uploadcare):
+    file_ = uploadcare.file("52da3bfc-7cd8-4861-8b05-126fef7a6994")
+    template = ImageTransformation().resize(Slot("width")).freeze()
+
+    assert uploadcare.cdn_urls([file_], template, values={"width": 200}) == [
+        f"{uploadcare.cdn_base}{template.path(file_.uuid, width=200)}"
+    ]
+    with pytest.raises(ValueError):
+        uploadcare.cdn_urls([file_], template)
+
+
+@pytest.mark.freeze_time("2021-10-12")
+def test_token_cache(freezer):
+    secure_url_bulder = AkamaiSecureUrlBuilderWithAclToken(
+        "cdn.yourdomain.com", known_secret, token_bucket=60
+    )
+    handle = "52da3bfc-7cd8-4861-8b05-126fef7a6994"
+    token = secure_url_bulder.get_token(handle)
+    # expiration time is rounded down to the bucket
+    assert token.startswith("exp=1633997100~")
+
+    with patch.object(
+        secure_url_bulder, "_new_hmac", wraps=secure_url_bulder._new_hmac
+    ) as new_hmac, patch("binascii.a2b_hex") as a2b_hex:
+        freezer.tick(59)
+        assert secure_url_bulder.get_token(handle) == token
+        assert secure_url_bulder.get_token(f"/{handle}") == token
+        assert not new_hmac.called
+
+        assert secure_url_bulder.get_token(handle, wildcard=True) != token
+        freezer.tick(1)
+        assert secure_url_bulder.get_token(handle).startswith(
+            "exp=1633997160~"
+        )
+        assert new_hmac.call_count == 2
+        # decoded key is prepared once
+        assert not a2b_hex.called
+
+
+@pytest.mark.freeze_time("2021-10-12")
+def test_path_resolved_once():
+    secure_url_bulder = AkamaiSecureUrlBuilderWithAclToken(
+        "cdn.yourdomain.com", known_secret
+    )
+    handle = "52da3bfc-7cd8-4861-8b05-126fef7a6994/-/resize/640x/"
+    expected = secure_url_bulder.build(handle)
+    secure_url_bulder._tokens.clear()
+
+    with patch.object(
+        secure_url_bulder, "_get_path", wraps=secure_url_bulder._get_path
+    ) as get_path_mock:
+        assert secure_url_bulder.build(handle) == expected
+        assert get_path_mock.call_count == 1
+
+        assert secure_url_bulder.build(handle) == expected
+        assert get_path_mock.call_count == 2
+
+
+def test_deprecated_builder_token_cache():
+    with pytest.warns(DeprecationWarning):
+        secure_url_bulder = AkamaiSecureUrlBuilder(
+            "cdn.yourdomain.com",
+            known_secret,
+            token_bucket=60,
+            token_cache_size=10,
+        )
+    assert secure_url_bulder.token_bucket == 60
+    assert secure_url_bulder.token_cache_size == 10
+
+
+def test_token_bucket_exceeds_window():
+    with pytest.raises(ValueError):
+        AkamaiSecureUrlBuilderWithAclToken(
+            "cdn.yourdomain.com", known_secret, window=60, token_bucket=60
+        )
+
+
+@pytest.mark.freeze_time("2021-10-12")
+def test_client_generate_secure_urls():
+    secure_url_bulder = AkamaiSecureUrlBuilderWithAclToken(
+        "cdn.yourdomain.com", known_secret
+    )
+    uploadcare = Uploadcare(
+        public_key="public",
+        secret_key="secret",
+        secure_url_builder=secure_url_bulder,
+    )
+    handles = [
+        "52da3bfc-7cd8-4861-8b05-126fef7a6994/-/resize/640x/",
+        UUID("1bd27101-6f40-460a-9358-d44c282e9d16"),
+        "https://cdn.yourdomain.com/52da3bfc-7cd8-4861-8b05-126fef7a6994/",
+    ]
+
+    assert uploadcare.generate_secure_urls(handles) == [
+        uploadcare.generate_secure_url(handle) for handle in handles
+    ]
+
+    # wildcard means the same as for single url
+    wildcard_urls = uploadcare.generate_secure_urls(handles, wildcard=True)
+    assert wildcard_urls == [
+        uploadcare.generate_secure_url(handle, wildcard=True)
+        for handle in handles
+    ]
+    assert (
+        "acl=/52da3bfc-7cd8-4861-8b05-126fef7a6994/-/resize/640x/*"
+        in wildcard_urls[0]
+    )
+
+    per_file_urls = uploadcare.generate_secure_urls(
+        handles, per_file_token=True
+    )
+    token = per_file_urls[0].split("?token=")[1]
+    assert token == uploadcare.generate_secure_url_token(
+        "52da3bfc-7cd8-4861-8b05-126fef7a6994", wildcard=True
+    )
+    assert per_file_urls[0] == (
+        "https://cdn.yourdomain.com/52da3bfc-7cd8-4861-8b05-126fef7a6994"
+        f"/-/resize/640x/?token={token}"
+    )
+    assert per_file_urls[2].endswith(f"?token={token}")
+    assert "acl=/1bd27101-6f40-460a-9358-d44c282e9d16/*" in per_file_urls[1]
+
+
+def test_generate_secure_urls_url_token_wildcard():
+    secure_url_bulder = AkamaiSecureUrlBuilderWithUrlToken(
+        "cdn.yourdomain.com", known_secret
+    )
+    with pytest.raises(ValueError):
+        secure_url_bulder.build_many(
+            ["52da3bfc-7cd8-4861-8b05-126fef7a6994"], wildcard=True
+        )
+    with pytest.raises(ValueError):
+        secure_url_bulder.build_many(
+            ["52da3bfc-7cd8-4861-8b05-126fef7a6994"], per_file_token=True
+        )
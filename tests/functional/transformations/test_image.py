@@ -1,3 +1,6 @@
+import pytest
+
+from pyuploadcare.transformations.base import Slot
 from pyuploadcare.transformations.image import (
     ColorAdjustment,
     CropAlignment,
@@ -401,3 +404,48 @@ def test_transformation_create_from_str():
 
     new_transformation = new_transformation.flip()
     assert str(new_transformation) == "preview/-/mirror/-/flip/"
+
+
+def test_frozen_transformation():
+    transformation = (
+        ImageTransformation().preview().quality(ImageQuality.smart)
+    )
+    template = transformation.freeze()
+    assert str(template) == "preview/-/quality/smart/"
+    assert not template.slots
+
+    cache = {template: "value"}
+    assert cache[transformation.freeze()] == "value"
+
+    transformation.flip()
+    assert str(template) == "preview/-/quality/smart/"
+    assert template != transformation.freeze()
+
+    with pytest.raises(AttributeError):
+        template.slots = frozenset()  # type: ignore
+
+
+def test_frozen_transformation_slots(uploadcare):
+    template = (
+        ImageTransformation()
+        .resize(Slot("width"), Slot("height"))
+        .setfill("{000}")
+        .freeze()
+    )
+    assert template.slots == {"width", "height"}
+    assert template.render(width=200, height=100) == (
+        "resize/200x100/-/setfill/{000}/"
+    )
+
+    uuid = "a771f854-c2cb-408a-8c36-71af77811f3b"
+    assert uploadcare.file(uuid).cdn_path(
+        ImageTransformation().resize(200).freeze()
+    ) == (f"{uuid}/-/resize/200x/")
+    assert template.path(uuid, width=1, height=2) == (
+        f"{uuid}/-/resize/1x2/-/setfill/{{000}}/"
+    )
+
+    with pytest.raises(ValueError):
+        template.render(width=200)
+    with pytest.raises(ValueError):
+        Slot("file_id")
@@ -0,0 +1,94 @@
+import pytest
+
+from pyuploadcare.exceptions import InvalidParamError
+from pyuploadcare.transformations.document import DocumentTransformation
+from pyuploadcare.transformations.image import (
+    ImageFormat,
+    ImageQuality,
+    ImageTransformation,
+)
+from pyuploadcare.transformations.parser import (
+    canonical_cdn_path,
+    parse_cdn_url,
+    parse_effects,
+)
+from pyuploadcare.transformations.video import VideoTransformation
+
+
+UUID = "a771f854-c2cb-408a-8c36-71af77811f3b"
+
+
+def test_parse_effects():
+    transformation = (
+        ImageTransformation()
+        .resize(200)
+        .quality(ImageQuality.smart)
+        .format(ImageFormat.webp)
+    )
+    parsed = parse_effects(transformation.effects)
+    assert isinstance(parsed, ImageTransformation)
+    assert parsed.operations == [
+        ("resize", ["200x"]),
+        ("quality", ["smart"]),
+        ("format", ["webp"]),
+    ]
+    assert parsed.effects == transformation.effects
+
+
+@pytest.mark.parametrize(
+    "cdn_url,transformation_class,effects,filename",
+    [
+        (UUID, ImageTransformation, "", ""),
+        (f"https://ucarecdn.com/{UUID}/", ImageTransformation, "", ""),
+        (
+            f"https://ucarecdn.com/{UUID}/-/resize/200x/image.jpg?x=1",
+            ImageTransformation,
+            "resize/200x/",
+            "image.jpg",
+        ),
+        (
+            f"{UUID}/-/preview/gif2video/-/format/mp4/",
+            ImageTransformation,
+            "preview/-/gif2video/-/format/mp4/",
+            "",
+        ),
+        (
+            f"/{UUID}/video/-/thumbs~5/-/format/mp4/",
+            VideoTransformation,
+            "thumbs/5/-/format/mp4/",
+            "",
+        ),
+        (
+            f"{UUID}/document/-/format/pdf/",
+            DocumentTransformation,
+            "format/pdf/",
+            "",
+        ),
+    ],
+)
+def test_parse_cdn_url(cdn_url, transformation_class, effects, filename):
+    parsed = parse_cdn_url(cdn_url)
+    assert parsed.uuid == UUID
+    assert type(parsed.transformation) is transformation_class
+    assert parsed.transformation.effects == effects
+    assert parsed.filename == filename
+
+
+def test_parse_cdn_url_invalid():
+    with pytest.raises(InvalidParamError):
+        parse_cdn_url("https://ucarecdn.com/image.jpg")
+
+
+def test_canonical_cdn_path():
+    expected = f"{UUID}/-/resize/200x/-/format/webp/-/quality/smart/"
+    assert canonical_cdn_path(expected) == expected
+
+    cdn_url = (
+        f"https://ucarecdn.com/{UUID}/"
+        "-/quality/smart/-/Resize/200x//-/format/jpeg/-/format/webp/"
+    )
+    assert canonical_cdn_path(cdn_url) == expected
+
+    # output operations after gif2video set up the video
+    path = f"{UUID}/-/format/webp/gif2video/-/format/mp4/"
+    assert canonical_cdn_path(path) == path
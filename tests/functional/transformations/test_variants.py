@@ -0,0 +1,86 @@
+import pytest
+
+from pyuploadcare import Uploadcare
+from pyuploadcare.secure_url import AkamaiSecureUrlBuilderWithAclToken
+from pyuploadcare.transformations.image import (
+    ImageFormat,
+    ImageQuality,
+    ImageTransformation,
+)
+from pyuploadcare.transformations.variants import VariantSet
+
+
+UUID = "a771f854-c2cb-408a-8c36-71af77811f3b"
+CDN_URL = f"https://ucarecdn.com/{UUID}/"
+
+
+def test_variant_set_widths(uploadcare):
+    variants = VariantSet(
+        uploadcare,
+        widths=[640, 320],
+        formats=[ImageFormat.webp, ImageFormat.jpeg],
+        densities=[1, 2],
+        transformation=ImageTransformation().grayscale(),
+        quality=ImageQuality.smart,
+    )
+    assert [variant.width for variant in variants.variants["webp"]] == [
+        320,
+        640,
+        1280,
+    ]
+
+    srcsets = variants.srcsets([UUID, f"{CDN_URL}-/flip/"])
+    assert list(srcsets) == [UUID]
+    assert srcsets[UUID]["jpeg"] == ", ".join(
+        f"{CDN_URL}-/grayscale/-/resize/{width}x/"
+        f"-/format/jpeg/-/quality/smart/ {width}w"
+        for width in (320, 640, 1280)
+    )
+    assert variants.srcset(UUID) == srcsets[UUID]["webp"]
+
+
+def test_variant_set_densities(uploadcare):
+    variants = VariantSet(uploadcare, widths=[300], densities=[1, 1.5, 2])
+    assert variants.srcset(UUID) == (
+        f"{CDN_URL}-/resize/300x/-/format/auto/ 1x, "
+        f"{CDN_URL}-/resize/450x/-/format/auto/ 1.5x, "
+        f"{CDN_URL}-/resize/600x/-/format/auto/ 2x"
+    )
+
+
+@pytest.mark.freeze_time("2021-10-12")
+def test_variant_set_secure():
+    uploadcare = Uploadcare(
+        public_key="public",
+        secret_key="secret",
+        secure_url_builder=AkamaiSecureUrlBuilderWithAclToken(
+            "cdn.yourdomain.com", "73636b61519adede42191058ef36ad14"
+        ),
+    )
+    variants = VariantSet(uploadcare, widths=[100])
+    urls = variants.urls([UUID], secure=True)
+    assert list(urls[UUID].values()) == [
+        uploadcare.generate_secure_url(f"{UUID}/-/resize/100x/-/format/auto/")
+    ]
+
+    variants = VariantSet(uploadcare, widths=[100, 200])
+    urls = variants.urls([UUID], secure=True, wildcard=True)
+    assert list(urls[UUID].values()) == [
+        uploadcare.generate_secure_url(
+            f"{UUID}/-/resize/{width}x/-/format/auto/", wildcard=True
+        )
+        for width in [100, 200]
+    ]
+
+    urls = variants.urls([UUID], secure=True, per_file_token=True)
+    tokens = {url.split("?token=")[1] for url in urls[UUID].values()}
+    assert tokens == {
+        uploadcare.generate_secure_url_token(UUID, wildcard=True)
+    }
+
+
+def test_variant_set_invalid(uploadcare):
+    with pytest.raises(ValueError):
+        VariantSet(uploadcare, widths=[])
+    with pytest.raises(ValueError):
+        VariantSet(uploadcare, widths=[100], densities=[0])
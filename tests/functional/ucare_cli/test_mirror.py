@@ -0,0 +1,36 @@
+import json
+from unittest.mock import patch
+
+from tests.functional.ucare_cli.helpers import arg_namespace
+
+from pyuploadcare.ucare_cli.commands.mirror import mirror
+
+
+def test_mirror_count(uploadcare, tmp_path, capsys):
+    items = [
+        {
+            "uuid": "11111111-1111-1111-1111-111111111111",
+            "size": 6 * 1024 * 1024,
+            "is_image": True,
+            "datetime_uploaded": "2024-01-01T10:00:00Z",
+            "datetime_stored": "2024-01-01T10:00:00Z",
+        },
+    ]
+    args = arg_namespace(
+        f"mirror {tmp_path / 'files.db'} --stored true --is_image true"
+        " --min_size 5242880 --uploaded_after 2024-01-01"
+    )
+
+    with patch.object(
+        uploadcare.files_api,
+        "list_raw",
+        side_effect=lambda **kwargs: iter(
+            items if kwargs["removed"] == "false" else []
+        ),
+    ):
+        mirror(args, uploadcare)
+
+    assert json.loads(capsys.readouterr().out) == {
+        "count": 1,
+        "total_size": 6 * 1024 * 1024,
+    }
@@ -0,0 +1,158 @@
+from unittest.mock import patch
+
+import pytest
+from tests.functional.ucare_cli.helpers import arg_namespace
+
+from pyuploadcare.api.entities import FileInfo
+from pyuploadcare.batch import BatchDownloadResult
+from pyuploadcare.ucare_cli.commands import sync
+from pyuploadcare.ucare_cli.commands.sync import save_file_locally, sync_files
+
+
+UUIDS = [
+    "11111111-1111-1111-1111-111111111111",
+    "22222222-2222-2222-2222-222222222222",
+]
+
+
+def fake_download(files, dest, **kwargs):
+    result = BatchDownloadResult()
+    for file_ in files:
+        path = dest(file_)
+        with open(path, "wb") as local_file:
+            local_file.write(b"x" * file_.size)
+        result.files[file_.uuid] = path
+    return result
+
+
+def test_sync_manifest(uploadcare, tmp_path):
+    files = [
+        uploadcare.file(
+            uuid, file_info={"uuid": uuid, "size": 3, "is_image": False}
+        )
+        for uuid in UUIDS
+    ]
+    args = arg_namespace(
+        f"sync {tmp_path} --manifest {tmp_path / 'manifest.db'}"
+        " --checkpoint 1 --workers 2"
+    )
+
+    with patch.object(
+        uploadcare, "list_files", return_value=files
+    ), patch.object(
+        uploadcare, "download", side_effect=fake_download
+    ) as download:
+        sync_files(args, uploadcare)
+        assert download.call_count == 2
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            *UUIDS,
+            "manifest.db",
+        ]
+
+        # synced files are skipped without requests
+        sync_files(args, uploadcare)
+        assert download.call_count == 2
+
+        # removed local files are synced again
+        (tmp_path / UUIDS[1]).unlink()
+        sync_files(args, uploadcare)
+        assert [file_.uuid for file_ in download.call_args[0][0]] == [UUIDS[1]]
+
+
+def test_sync_effects(uploadcare, tmp_path):
+    uuid = UUIDS[0]
+    file_ = uploadcare.file(
+        uuid, file_info={"uuid": uuid, "size": 3, "is_image": True}
+    )
+    args = arg_namespace(f"sync {tmp_path} --effects resize/20x/")
+
+    with patch.object(
+        uploadcare, "list_files", return_value=[file_]
+    ), patch.object(sync, "_download_file", return_value=True) as download:
+        sync_files(args, uploadcare)
+
+    assert download.call_args[0][:2] == (
+        f"{uploadcare.cdn_base}{uuid}/-/resize/20x/",
+        str(tmp_path / uuid),
+    )
+
+
+def test_sync_uuids_manifest(uploadcare, tmp_path):
+    def fake_retrieve(file_uuid, include_appdata=False):
+        return FileInfo.model_validate(
+            {
+                "uuid": file_uuid,
+                "size": 3,
+                "is_image": False,
+                "original_filename": "file.txt",
+            }
+        )
+
+    args = arg_namespace(
+        f"sync {tmp_path} --manifest {tmp_path / 'manifest.db'}"
+        f" --uuids {' '.join(UUIDS)}"
+    )
+
+    with patch.object(
+        uploadcare.files_api, "retrieve", side_effect=fake_retrieve
+    ) as retrieve, patch.object(
+        uploadcare, "download", side_effect=fake_download
+    ) as download:
+        sync_files(args, uploadcare)
+        assert retrieve.call_count == 2
+        assert download.call_count == 1
+
+        # information of synced files is taken from the manifest
+        sync_files(args, uploadcare)
+        assert retrieve.call_count == 2
+        assert download.call_count == 1
+
+
+@pytest.mark.parametrize("workers,progress", [(1, True), (4, False)])
+def test_sync_progress(uploadcare, tmp_path, workers, progress):
+    file_ = uploadcare.file(
+        UUIDS[0], file_info={"uuid": UUIDS[0], "size": 3, "is_image": True}
+    )
+    args = arg_namespace(
+        f"sync {tmp_path} --effects resize/20x/ --workers {workers}"
+    )
+
+    with patch.object(
+        uploadcare, "list_files", return_value=[file_]
+    ), patch.object(sync, "_download_file", return_value=True) as download:
+        sync_files(args, uploadcare)
+
+    assert download.call_args[1]["progress"] is progress
+
+
+class FakeResponse:
+    def __init__(self, content, fail=False):
+        self.content = content
+        self.fail = fail
+        self.chunk_sizes = []
+
+    def iter_bytes(self, chunk_size):
+        self.chunk_sizes.append(chunk_size)
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+        if self.fail:
+            raise OSError("connection lost")
+
+
+def test_save_file_locally(tmp_path):
+    path = str(tmp_path / "image.jpg")
+    response = FakeResponse(b"x" * 2500)
+
+    # size of the original file is bigger than transformed content
+    save_file_locally(path, response, size=10000, chunk_size=1000)
+
+    assert response.chunk_sizes == [1000]
+    with open(path, "rb") as local_file:
+        assert local_file.read() == b"x" * 2500
+    assert [path.name for path in tmp_path.iterdir()] == ["image.jpg"]
+
+    with pytest.raises(OSError):
+        save_file_locally(path, FakeResponse(b"y" * 10, fail=True), size=10)
+    with open(path, "rb") as local_file:
+        assert local_file.read() == b"x" * 2500
+    assert [path.name for path in tmp_path.iterdir()] == ["image.jpg"]
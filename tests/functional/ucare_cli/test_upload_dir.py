@@ -0,0 +1,67 @@
+import json
+from unittest.mock import MagicMock, patch
+
+from tests.functional.ucare_cli.helpers import arg_namespace
+
+from pyuploadcare.ucare_cli.commands.upload_dir import upload_dir
+
+
+def fake_upload(file_obj, store=None, metadata=None):
+    name = file_obj.name.rsplit("/", 1)[-1]
+    if name == "broken.jpg":
+        raise ValueError("upload failed")
+    return MagicMock(uuid=name, cdn_url=f"https://ucarecdn.com/{name}/")
+
+
+def read_log(path):
+    with open(path) as log:
+        return [json.loads(line) for line in log]
+
+
+def test_upload_dir(uploadcare, tmp_path, monkeypatch, capsys):
+    images = tmp_path / "images"
+    (images / "nested").mkdir(parents=True)
+    for name in ("a.jpg", "b.png", "broken.jpg", "nested/c.jpg"):
+        (images / name).write_bytes(b"image")
+    log_path = tmp_path / "upload.jsonl"
+    args = arg_namespace(
+        f"upload-dir {images} --workers 2 --pattern *.jpg --store"
+        f" --metadata kind=photo --log {log_path}"
+    )
+
+    with patch.object(uploadcare, "upload", side_effect=fake_upload) as upload:
+        upload_dir(args, uploadcare)
+
+        assert upload.call_count == 3
+        assert upload.call_args[1] == {
+            "store": True,
+            "metadata": {"kind": "photo"},
+        }
+        entries = {entry["path"]: entry for entry in read_log(log_path)}
+        assert entries[str(images / "a.jpg")] == {
+            "path": str(images / "a.jpg"),
+            "uuid": "a.jpg",
+            "cdn_url": "https://ucarecdn.com/a.jpg/",
+        }
+        assert entries[str(images / "nested" / "c.jpg")]["uuid"] == "c.jpg"
+        assert entries[str(images / "broken.jpg")] == {
+            "path": str(images / "broken.jpg"),
+            "error": "upload failed",
+        }
+
+        # uploaded files are skipped, failed are retried
+        upload_dir(args, uploadcare)
+        assert upload.call_count == 4
+        assert upload.call_args[0][0].name == str(images / "broken.jpg")
+
+        # paths are matched from other working directories
+        monkeypatch.chdir(images)
+        upload_dir(
+            arg_namespace(f"upload-dir ./nested --log {log_path}"),
+            uploadcare,
+        )
+        assert upload.call_count == 4
+        assert capsys.readouterr().out.endswith(
+            json.dumps({"uploaded": 0, "failed": 0, "skipped": 1}, indent=2)
+            + "\n"
+        )